@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+assets/data 파일들의 매니페스트(assets/data/manifest.json)를 만들고 검사하는 스크립트
+
+매니페스트에는 에셋 파일마다 sha256, 바이트 크기, 항목 수, 스키마(이름, 버전)가 들어 있고,
+전체 에셋 목록의 해시(content_hash)가 있어서 클라이언트나 CDN은
+- content_hash가 같으면 아무것도 다시 받지 않고
+- 다르면 sha256이 바뀐 에셋(덱 캐시 키 ${language}_${level}_${category})만 무효화할 수 있다.
+
+매니페스트는 덱 파일 패턴(EN_*, KO_*)과 겹치지 않으므로 덱을 읽는 스크립트에는 영향이 없다.
+같은 내용이면 다시 쓰지 않으므로 에셋이 바뀌지 않은 빌드에서는 매니페스트도 바뀌지 않는다.
+
+사용 예:
+    python scripts/asset_manifest.py                 # 매니페스트 생성/갱신
+    python scripts/asset_manifest.py --verify        # 매니페스트와 실제 파일 비교 (다르면 종료 코드 1)
+    python scripts/asset_manifest.py --diff old.json # 이전 릴리스 매니페스트와 비교해서 바뀐 에셋 출력
+"""
+
+import argparse
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+from atomic_io import WriteTransaction
+from build_cache import bytes_hash
+from deck_io import DECK_SCHEMA_VERSION, default_data_dir, write_bytes_if_changed
+from metrics import add_counts, add_metrics_arguments, metered, tracked
+from profiling import add_profile_argument, profiled
+
+MANIFEST_VERSION = 1
+MANIFEST_FILE_NAME = "manifest.json"
+
+# 에셋 종류별 스키마 (이름, 버전) - 파일 구조가 바뀌면 버전을 올린다
+ASSET_SCHEMAS = {
+    "deck": DECK_SCHEMA_VERSION,
+    "core_words": 1,
+    "word_frequency": 1,
+}
+
+
+def asset_schema(name):
+    """에셋 파일 이름으로 스키마 이름을 정함 (모르는 파일이면 None)"""
+    if name.startswith(("EN_", "KO_")):
+        return "deck"
+    stem = Path(name).stem
+    return stem if stem in ASSET_SCHEMAS else None
+
+
+def asset_files(data_dir):
+    """매니페스트에 넣을 assets/data의 JSON 파일들 (매니페스트 자신은 제외, 이름순)"""
+    return sorted(path for path in Path(data_dir).glob("*.json") if path.name != MANIFEST_FILE_NAME)
+
+
+def count_entries(schema, data):
+    """에셋의 항목 수 (덱: 항목 수, core_words: 단어 수, word_frequency: 단어 수)"""
+    if schema == "core_words":
+        return sum(len(words) for levels in data.values() for words in levels.values())
+    return len(data)
+
+
+def describe_asset(path, source=None):
+    """
+    에셋 파일 하나의 매니페스트 항목
+
+    source가 주어지면 path 대신 source 파일의 내용으로 만든다 (트랜잭션에 올라간 임시 파일).
+
+    Raises:
+        ValueError: 스키마를 알 수 없는 파일이거나 JSON으로 읽을 수 없을 때
+    """
+    schema = asset_schema(path.name)
+    if schema is None:
+        raise ValueError(f"스키마를 알 수 없는 에셋입니다: {path.name}")
+    data = Path(source or path).read_bytes()
+    add_counts(bytes_read=len(data))
+    try:
+        entries = count_entries(schema, json.loads(data))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{path.name}: JSON 파싱 오류 - {e}") from e
+    return {
+        "sha256": bytes_hash(data),
+        "size": len(data),
+        "entries": entries,
+        "schema": schema,
+        "schema_version": ASSET_SCHEMAS[schema],
+    }
+
+
+def content_hash(assets):
+    """에셋 이름과 sha256 목록 전체의 해시 (에셋이 하나라도 바뀌면 달라짐)"""
+    lines = "".join(f"{name} {asset['sha256']}\n" for name, asset in sorted(assets.items()))
+    return bytes_hash(lines.encode('utf-8'))
+
+
+def build_manifest(data_dir, transaction=None):
+    """
+    data_dir의 에셋들로 매니페스트 dict를 만듦
+
+    transaction이 주어지면 트랜잭션에 올라간 파일은 커밋 후의 내용(임시 파일)으로 기록하고,
+    트랜잭션에서 새로 만드는 파일은 넣고, 삭제할 파일은 뺀다.
+    """
+    paths = {path.name: path for path in asset_files(data_dir)}
+    if transaction is not None:
+        data_path = Path(data_dir).resolve()
+        for temp_path, path in transaction.pending:
+            if temp_path is not None and path.parent == data_path and path.suffix == ".json" \
+                    and path.name != MANIFEST_FILE_NAME:
+                paths.setdefault(path.name, path)
+    assets = {}
+    for name, path in sorted(paths.items()):
+        source = transaction.staged(path) if transaction is not None else path
+        if source is None:
+            continue
+        with tracked("describe_asset"):
+            assets[name] = describe_asset(path, source)
+    return {"version": MANIFEST_VERSION, "content_hash": content_hash(assets), "assets": assets}
+
+
+def write_manifest(data_dir, transaction=None):
+    """
+    매니페스트를 만들어서 data_dir/manifest.json에 저장 (내용이 같으면 다시 쓰지 않음)
+
+    transaction이 주어지면 트랜잭션에 올라간 덱의 새 내용으로 매니페스트를 만들고,
+    매니페스트도 같은 트랜잭션에 추가해서 덱과 함께 교체되게 한다.
+
+    Returns:
+        dict: 매니페스트
+    """
+    manifest = build_manifest(data_dir, transaction)
+    manifest_file = Path(data_dir) / MANIFEST_FILE_NAME
+    data = (json.dumps(manifest, ensure_ascii=False, indent=2) + "\n").encode('utf-8')
+    written = write_bytes_if_changed(manifest_file, data, transaction)
+    status = "✅" if written else "⏭️ "
+    total_size = sum(asset["size"] for asset in manifest["assets"].values())
+    print(f"{status} {manifest_file}: 에셋 {len(manifest['assets'])}개, {total_size:,} bytes, "
+          f"content_hash {manifest['content_hash'][:16]}")
+    return manifest
+
+
+@contextmanager
+def deck_transaction(data_dir):
+    """
+    data_dir의 덱을 쓰는 WriteTransaction
+
+    with 블록이 정상 종료되고 data_dir의 파일이 트랜잭션에 올라가 있으면, 커밋 직전에 매니페스트를
+    새 내용으로 만들어 같은 트랜잭션에 추가한다 (덱과 매니페스트가 함께 교체됨).
+    """
+    data_path = Path(data_dir).resolve()
+    with WriteTransaction() as transaction:
+        yield transaction
+        if any(path.parent == data_path for _, path in transaction.pending):
+            with tracked("write_manifest"):
+                write_manifest(data_dir, transaction)
+
+
+def load_manifest(path):
+    """매니페스트 파일을 읽음 (지원하지 않는 버전이면 ValueError)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"지원하지 않는 매니페스트 버전입니다: {manifest.get('version')}")
+    return manifest
+
+
+def verify_manifest(data_dir):
+    """
+    data_dir/manifest.json과 실제 에셋 파일들을 비교
+
+    빠진 파일, 목록에 없는 파일, 크기/sha256/항목 수/스키마 버전이 다른 파일,
+    content_hash가 에셋 목록과 맞지 않는 경우를 모두 문제로 보고한다.
+
+    Returns:
+        list: 문제 설명 문자열 리스트 (비어 있으면 통과)
+    """
+    data_path = Path(data_dir)
+    manifest_file = data_path / MANIFEST_FILE_NAME
+    if not manifest_file.exists():
+        return [f"{manifest_file}이 없습니다"]
+    try:
+        manifest = load_manifest(manifest_file)
+    except (ValueError, json.JSONDecodeError) as e:
+        return [f"{manifest_file.name}: {e}"]
+
+    problems = []
+    listed = manifest.get("assets", {})
+    if manifest.get("content_hash") != content_hash(listed):
+        problems.append("content_hash가 에셋 목록과 맞지 않습니다")
+
+    actual = {path.name: path for path in asset_files(data_path)}
+    for name in sorted(set(listed) - set(actual)):
+        problems.append(f"{name}: 파일이 없습니다")
+    for name in sorted(set(actual) - set(listed)):
+        problems.append(f"{name}: 매니페스트에 없는 파일입니다")
+
+    for name in sorted(set(listed) & set(actual)):
+        expected = listed[name]
+        try:
+            with tracked("describe_asset"):
+                current = describe_asset(actual[name])
+        except ValueError as e:
+            problems.append(str(e))
+            continue
+        for field in ("size", "sha256", "entries", "schema", "schema_version"):
+            if expected.get(field) != current[field]:
+                problems.append(f"{name}: {field}가 다릅니다 (매니페스트 {expected.get(field)}, 실제 {current[field]})")
+        if ASSET_SCHEMAS.get(expected.get("schema")) != expected.get("schema_version"):
+            problems.append(f"{name}: 지원하지 않는 스키마 버전입니다 "
+                            f"({expected.get('schema')} v{expected.get('schema_version')})")
+    return problems
+
+
+def diff_manifests(old, new):
+    """
+    두 매니페스트의 에셋 차이
+
+    Returns:
+        dict: {"added": [...], "removed": [...], "changed": [...], "unchanged": [...]} (에셋 이름, 이름순)
+    """
+    old_assets = old.get("assets", {})
+    new_assets = new.get("assets", {})
+    common = sorted(set(old_assets) & set(new_assets))
+    return {
+        "added": sorted(set(new_assets) - set(old_assets)),
+        "removed": sorted(set(old_assets) - set(new_assets)),
+        "changed": [name for name in common if old_assets[name]["sha256"] != new_assets[name]["sha256"]],
+        "unchanged": [name for name in common if old_assets[name]["sha256"] == new_assets[name]["sha256"]],
+    }
+
+
+def print_diff(diff, new):
+    """diff_manifests 결과 출력 (다시 받아야 하는 바이트 수 포함)"""
+    new_assets = new["assets"]
+    for label, key in (("추가", "added"), ("변경", "changed"), ("삭제", "removed")):
+        for name in diff[key]:
+            size = f" ({new_assets[name]['size']:,} bytes)" if name in new_assets else ""
+            print(f"  {label}: {name}{size}")
+    download = sum(new_assets[name]["size"] for name in diff["added"] + diff["changed"])
+    total = sum(asset["size"] for asset in new_assets.values())
+    print(f"\n📊 추가 {len(diff['added'])}개, 변경 {len(diff['changed'])}개, 삭제 {len(diff['removed'])}개, "
+          f"그대로 {len(diff['unchanged'])}개 - 다시 받을 크기 {download:,}/{total:,} bytes")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="assets/data 매니페스트(sha256, 크기, 항목 수, 스키마 버전) 생성/검사")
+    parser.add_argument("--verify", action="store_true", help="매니페스트를 만들지 않고 실제 파일과 비교만 함")
+    parser.add_argument("--diff", type=Path, metavar="OLD_MANIFEST", help="이전 매니페스트와 비교해서 바뀐 에셋 출력")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    data_dir = default_data_dir()
+    if not data_dir.exists():
+        print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
+        sys.exit(1)
+
+    with profiled("asset_manifest", args.profile), metered("asset_manifest", args.metrics, args.prometheus):
+        if args.verify:
+            problems = verify_manifest(data_dir)
+            for problem in problems:
+                print(f"❌ {problem}")
+            if problems:
+                print(f"\n❌ 매니페스트 검사 실패: 문제 {len(problems)}개 (다시 만들려면 --verify 없이 실행)")
+                sys.exit(1)
+            print("✅ 매니페스트가 에셋 파일들과 일치합니다")
+            return
+
+        try:
+            manifest = write_manifest(data_dir)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        if args.diff:
+            print(f"\n{args.diff} 대비:")
+            print_diff(diff_manifests(load_manifest(args.diff), manifest), manifest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+중간에 중단되어도 파일이 깨지지 않는 쓰기 유틸리티
+
+- 파일은 같은 디렉토리의 임시 파일에 쓰고 fsync한 뒤 os.replace로 교체하고, 디렉토리도 fsync한다.
+  교체 전에 중단되면 기존 파일이 그대로 남고, 교체 후에는 새 파일 전체가 남는다.
+- 여러 파일을 함께 바꾸는 실행은 WriteTransaction으로 묶는다.
+  모든 임시 파일을 다 쓴 뒤 저널(.deck_write_journal.json)에 교체/삭제 목록을 기록하고 반영하므로,
+  도중에 중단되어도 다음 실행 시 저널을 보고 남은 교체/삭제를 마저 끝낸다 (전부 반영되거나 전혀 반영되지 않음).
+
+python scripts/atomic_io.py recover 로 남은 저널을 처리하고 중단된 실행의 임시 파일을 지울 수 있다.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+JOURNAL_VERSION = 1
+DEFAULT_JOURNAL_FILE = Path(__file__).parent.parent / ".deck_write_journal.json"
+
+TEMP_SUFFIX = ".tmp"
+
+
+def _default_mode():
+    """새 파일에 적용할 권한 (umask 반영)"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def fsync_directory(directory):
+    """디렉토리 항목 변경(파일 교체/삭제)을 디스크에 반영"""
+    if os.name == 'nt':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _make_temp_file(path):
+    """path와 같은 디렉토리에 임시 파일을 만들고 (fd, 임시 파일 경로)를 반환"""
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=TEMP_SUFFIX, dir=path.parent)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = _default_mode()
+    os.chmod(temp_name, mode)
+    return fd, Path(temp_name)
+
+
+def _publish(temp_path, path):
+    """fsync까지 끝난 임시 파일로 path를 교체하고 디렉토리를 fsync"""
+    os.replace(temp_path, path)
+    fsync_directory(Path(path).parent)
+
+
+def replace_file(source, path):
+    """
+    source 파일로 path를 원자적으로 교체 (source는 path와 같은 파일 시스템에 있어야 함)
+
+    unlink 후 rename과 달리 중간에 path가 없는 순간이 생기지 않는다.
+    """
+    with open(source, 'rb') as f:
+        os.fsync(f.fileno())
+    _publish(source, path)
+
+
+def stage_bytes(path, data):
+    """
+    data를 path 옆의 임시 파일에 쓰고 fsync한 뒤 임시 파일 경로를 반환 (path는 아직 바꾸지 않음)
+
+    다른 프로세스에서 만든 임시 파일도 WriteTransaction.add로 넘겨서 함께 반영할 수 있다.
+    """
+    fd, temp_path = _make_temp_file(path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return temp_path
+
+
+class AtomicFile:
+    """
+    path 옆의 임시 파일에 쓰고, commit()을 호출해야 path를 교체하는 파일
+
+    temp_path로 교체 전의 내용을 확인할 수 있고, discard()하면 path는 그대로 남는다.
+    """
+
+    def __init__(self, path, mode='w', encoding='utf-8'):
+        self.path = Path(path)
+        fd, self.temp_path = _make_temp_file(self.path)
+        try:
+            if 'b' in mode:
+                self.file = os.fdopen(fd, mode)
+            else:
+                self.file = os.fdopen(fd, mode, encoding=encoding)
+        except BaseException:
+            os.close(fd)
+            self.temp_path.unlink(missing_ok=True)
+            raise
+
+    def write(self, data):
+        return self.file.write(data)
+
+    def finish(self):
+        """임시 파일을 닫고 fsync (이후 temp_path의 내용은 바뀌지 않음)"""
+        if not self.file.closed:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+
+    def commit(self, transaction=None):
+        """path를 임시 파일로 교체 (transaction이 주어지면 트랜잭션에 추가)"""
+        self.finish()
+        if transaction is not None:
+            transaction.add(self.temp_path, self.path)
+        else:
+            _publish(self.temp_path, self.path)
+
+    def discard(self):
+        """임시 파일을 지우고 path는 그대로 둠"""
+        self.file.close()
+        self.temp_path.unlink(missing_ok=True)
+
+
+@contextmanager
+def atomic_open(path, mode='w', encoding='utf-8', transaction=None):
+    """
+    임시 파일을 열어서 돌려주고, with 블록이 정상 종료되면 path를 교체하는 컨텍스트 매니저
+
+    블록 안에서 예외가 나면 임시 파일을 지우고 path는 그대로 둔다.
+    transaction이 주어지면 바로 교체하지 않고 트랜잭션에 추가한다.
+    """
+    atomic_file = AtomicFile(path, mode, encoding)
+    try:
+        yield atomic_file.file
+        atomic_file.commit(transaction)
+    except BaseException:
+        atomic_file.discard()
+        raise
+
+
+def atomic_write_bytes(path, data, transaction=None):
+    """data를 path에 원자적으로 저장 (transaction이 주어지면 트랜잭션에 추가)"""
+    temp_path = stage_bytes(path, data)
+    if transaction is not None:
+        transaction.add(temp_path, path)
+    else:
+        try:
+            _publish(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+
+def atomic_write_text(path, text, transaction=None):
+    """text를 UTF-8로 path에 원자적으로 저장 (transaction이 주어지면 트랜잭션에 추가)"""
+    atomic_write_bytes(path, text.encode('utf-8'), transaction)
+
+
+def _load_journal(journal_file):
+    with open(journal_file, 'r', encoding='utf-8') as f:
+        journal = json.load(f)
+    if journal.get("version") != JOURNAL_VERSION:
+        raise ValueError(f"지원하지 않는 저널 버전입니다: {journal.get('version')}")
+    return journal
+
+
+def _apply_journal(journal_file, replacements):
+    """
+    저널의 교체 목록을 반영하고 저널을 삭제 (이미 반영된 항목은 건너뜀)
+
+    임시 파일이 null인 항목은 대상 파일을 삭제한다.
+    """
+    applied = 0
+    directories = set()
+    for temp_name, target_name in replacements:
+        if temp_name is None:
+            if os.path.exists(target_name):
+                os.unlink(target_name)
+                applied += 1
+        elif os.path.exists(temp_name):
+            os.replace(temp_name, target_name)
+            applied += 1
+        directories.add(Path(target_name).parent)
+    for directory in sorted(directories):
+        fsync_directory(directory)
+
+    journal_path = Path(journal_file)
+    journal_path.unlink(missing_ok=True)
+    fsync_directory(journal_path.parent)
+    return applied
+
+
+def recover_transactions(journal_file=None):
+    """
+    중단된 트랜잭션의 저널이 남아 있으면 남은 교체를 마저 반영
+
+    저널은 모든 임시 파일을 fsync한 뒤에 기록되므로, 저널이 있으면 항상 앞으로 진행해서 끝낸다.
+
+    Returns:
+        int: 새로 반영한 파일 수
+    """
+    journal_file = Path(journal_file or DEFAULT_JOURNAL_FILE)
+    if not journal_file.exists():
+        return 0
+    try:
+        journal = _load_journal(journal_file)
+    except json.JSONDecodeError:
+        # 저널 기록 도중 중단되면 저널 자체가 원자적으로 교체되므로 이 경우는 생기지 않지만, 안전하게 무시
+        print(f"⚠️  읽을 수 없는 저널을 무시합니다: {journal_file}")
+        journal_file.unlink()
+        return 0
+    applied = _apply_journal(journal_file, journal["replacements"])
+    print(f"⚠️  중단된 쓰기 작업을 복구했습니다: {applied}개 파일 반영 ({journal_file.name})")
+    return applied
+
+
+def remove_stale_temp_files(directory):
+    """
+    중단된 실행이 남긴 임시 파일(.파일명.XXXX.tmp)을 삭제
+
+    같은 디렉토리를 쓰는 다른 실행이 진행 중이지 않을 때만 사용한다.
+
+    Returns:
+        list: 삭제한 파일 경로 리스트
+    """
+    removed = []
+    for temp_path in sorted(Path(directory).glob(f".*{TEMP_SUFFIX}")):
+        if temp_path.is_file():
+            temp_path.unlink()
+            removed.append(temp_path)
+    return removed
+
+
+class WriteTransaction:
+    """
+    여러 파일 쓰기를 하나로 묶는 트랜잭션
+
+    with WriteTransaction() as transaction:
+        save_deck(path_a, data_a, transaction)
+        save_deck(path_b, data_b, transaction)
+
+    with 블록이 정상 종료되면 모든 파일을 함께 반영하고, 예외가 나면 아무 파일도 바꾸지 않는다.
+    remove(path)로 추가한 삭제도 같은 저널에 기록되어 쓰기와 함께 반영된다.
+    """
+
+    def __init__(self, journal_file=None):
+        self.journal_file = Path(journal_file or DEFAULT_JOURNAL_FILE)
+        self.pending = []
+        self.committed = []
+
+    def __enter__(self):
+        recover_transactions(self.journal_file)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def _discard_pending(self, path):
+        for position, (pending_temp, pending_path) in enumerate(self.pending):
+            if pending_path == path:
+                if pending_temp is not None:
+                    pending_temp.unlink(missing_ok=True)
+                del self.pending[position]
+                return
+
+    def add(self, temp_path, path):
+        """fsync까지 끝난 임시 파일을 커밋 때 path로 교체하도록 추가"""
+        path = Path(path).resolve()
+        # 같은 파일을 다시 쓰면 마지막 내용만 반영
+        self._discard_pending(path)
+        self.pending.append((Path(temp_path).resolve(), path))
+
+    def remove(self, path):
+        """커밋 때 path를 삭제하도록 추가 (pending에는 임시 파일 대신 None으로 들어감)"""
+        path = Path(path).resolve()
+        self._discard_pending(path)
+        self.pending.append((None, path))
+
+    def staged(self, path):
+        """
+        커밋 후 path의 내용이 들어 있는 파일
+
+        Returns:
+            Path: 트랜잭션에 올라간 임시 파일, 올라가지 않았으면 path 자신, 삭제할 파일이면 None
+        """
+        path = Path(path)
+        resolved = path.resolve()
+        for temp_path, pending_path in self.pending:
+            if pending_path == resolved:
+                return temp_path
+        return path
+
+    def write_bytes(self, path, data):
+        atomic_write_bytes(path, data, self)
+
+    def write_text(self, path, text):
+        atomic_write_text(path, text, self)
+
+    def open(self, path, mode='w', encoding='utf-8'):
+        return atomic_open(path, mode, encoding, self)
+
+    def commit(self):
+        """
+        추가된 모든 임시 파일을 반영
+
+        Returns:
+            list: 반영한 파일 경로 리스트
+        """
+        if not self.pending:
+            return []
+        replacements = [[None if temp_path is None else str(temp_path), str(path)] for temp_path, path in self.pending]
+        atomic_write_text(
+            self.journal_file,
+            json.dumps({"version": JOURNAL_VERSION, "replacements": replacements}, ensure_ascii=False),
+        )
+        _apply_journal(self.journal_file, replacements)
+        self.committed.extend(path for _, path in self.pending)
+        self.pending = []
+        return self.committed
+
+    def rollback(self):
+        """추가된 임시 파일들을 지우고 아무 파일도 바꾸지 않음"""
+        for temp_path, _ in self.pending:
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+        self.pending = []
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="중단된 쓰기 작업 복구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    recover_parser = subparsers.add_parser("recover", help="남은 저널을 반영하고 임시 파일 정리")
+    recover_parser.add_argument(
+        "directories", nargs="*", type=Path,
+        help="임시 파일을 정리할 디렉토리 (기본값: assets/data, build, build/decks)",
+    )
+    args = parser.parse_args()
+
+    project_root = Path(__file__).parent.parent
+    directories = args.directories or [
+        project_root / "assets" / "data", project_root / "build", project_root / "build" / "decks",
+    ]
+
+    applied = recover_transactions()
+    if not applied:
+        print("✅ 남은 저널이 없습니다.")
+
+    for directory in directories:
+        if not directory.exists():
+            continue
+        for temp_path in remove_stale_temp_files(directory):
+            print(f"🗑️  임시 파일 삭제: {temp_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 예문/뜻을 번역 API로 미리 일괄 번역하는 스크립트 (asyncio 일괄 번역 클라이언트 사용)
+
+- examples: all_ko_examples.txt로 내보낸 예문을 번역해서 translate_examples.csv를
+  "번호. {ID} 번역" 형식으로 쓴다. 이어서 update_ko_examples.py로 덱에 적용한다.
+  --tm을 주면 번역 메모리에 번역이 있는 예문은 요청하지 않고 기억된 번역을 쓰고, 새 번역은 번역 메모리에 기록한다.
+- meanings: EN 덱의 단어를 번역해서 build/translations/meanings_{언어}.json에 ID -> 번역으로 쓴다 (검토용).
+  기본은 meaning_ko가 빈 항목만, --all이면 모든 항목을 번역한다.
+
+API 키는 DEEPL_AUTH_KEY 환경 변수에서 읽는다. --stub이면 같은 프로세스에서 로컬 대역 서버
+(translation_stub_server.py)를 띄워 거기로 보낸다 (API 키 불필요, 오프라인 확인용).
+--stub 결과는 기본적으로 build/translations/stub_*에 써서 실제 번역 파일을 덮어쓰지 않고, 번역 메모리에도 기록하지 않는다.
+
+일부 요청이 재시도 후에도 실패하면 성공한 번역은 저장(--tm이면 번역 메모리에도 기록)하고,
+번역하지 못한 문장을 출력한 뒤 종료 코드 1로 끝난다. 다시 실행하면 (--tm이면) 남은 문장만 요청한다.
+
+사용 예:
+    python scripts/extract_examples.py --tm
+    python scripts/batch_translate.py examples --tm
+    python scripts/update_ko_examples.py --tm
+
+    python scripts/batch_translate.py meanings --stub --stub-failure-rate 0.1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+from atomic_io import atomic_write_text
+from deck_io import default_data_dir, deck_files, iter_deck_entries
+from entry_ids import format_id_token
+from metrics import add_counts, add_metrics_arguments, metered, tracked
+from profiling import add_profile_argument, profiled
+from translation_client import DEFAULT_BATCH_SIZE, DEFAULT_CONCURRENCY, DEFAULT_RETRIES, BatchTranslator
+from translation_memory import TranslationMemory, default_tm_file
+from translation_stub_server import start_stub_server
+from update_ko_examples import read_exported_sources, record_translations
+
+# lib/data/services/dictionary_api_service.dart와 같은 엔드포인트
+DEFAULT_ENDPOINT = "https://api-free.deepl.com/v2/translate"
+AUTH_KEY_ENV = "DEEPL_AUTH_KEY"
+
+# 번역하지 못한 문장을 이만큼까지 출력
+MAX_LISTED_FAILURES = 20
+
+
+def collect_example_sources(txt_file, tm_file=None):
+    """
+    all_ko_examples.txt에서 ID가 있는 예문 원문을 읽고, 번역 메모리에 있는 것은 미리 번역으로 채움
+
+    Returns:
+        tuple: (ID -> 원문 딕셔너리 - 번역할 것만, ID -> 번역 딕셔너리 - 번역 메모리에서 찾은 것)
+    """
+    _, sources_by_id = read_exported_sources(txt_file)
+    if tm_file is None:
+        return sources_by_id, {}
+    remembered = {}
+    pending = {}
+    with TranslationMemory(tm_file, readonly=True) as memory:
+        for entry_id, source in sources_by_id.items():
+            target = memory.lookup(source)
+            if target is None:
+                pending[entry_id] = source
+            else:
+                remembered[entry_id] = target
+    return pending, remembered
+
+
+def collect_meaning_sources(data_dir, include_all=False):
+    """EN 덱에서 ID -> 단어 딕셔너리 (include_all이 아니면 meaning_ko가 빈 항목만)"""
+    sources = {}
+    for deck_file in deck_files(data_dir):
+        if not deck_file.name.startswith("EN_"):
+            continue
+        for item in iter_deck_entries(deck_file):
+            if 'id' in item and item.get('word') and (include_all or not item.get('meaning_ko', '').strip()):
+                sources[item['id']] = item['word']
+    return sources
+
+
+def write_examples_csv(csv_file, translations):
+    """ID -> 번역을 update_ko_examples.py가 읽는 "번호. {ID} 번역" 형식으로 씀"""
+    lines = [
+        f"{number}. {format_id_token(entry_id)} {text}"
+        for number, (entry_id, text) in enumerate(translations.items(), 1)
+    ]
+    atomic_write_text(csv_file, "\n".join(lines) + "\n" if lines else "")
+
+
+def default_output(field, target_lang, stub=False):
+    """
+    출력 파일 기본 경로
+
+    --stub 결과는 대역 번역("[KO] 원문")이므로 update_ko_examples.py가 읽는 translate_examples.csv나
+    검토용 파일을 덮어쓰지 않도록 build/translations/stub_*에 쓴다.
+    """
+    project_root = Path(__file__).parent.parent
+    translations_dir = project_root / "build" / "translations"
+    name = "translate_examples.csv" if field == "examples" else f"meanings_{target_lang.lower()}.json"
+    if stub:
+        return translations_dir / f"stub_{name}"
+    return project_root / name if field == "examples" else translations_dir / name
+
+
+async def translate_sources(sources, args):
+    """
+    ID -> 원문 딕셔너리를 번역
+
+    --stub이면 같은 이벤트 루프에서 대역 서버를 띄워 거기로 보낸다.
+
+    Returns:
+        tuple: (ID -> 번역 딕셔너리 - 성공한 것만, 실패한 묶음의 TranslationError 리스트, 통계 문자열)
+    """
+    stub = server = None
+    endpoint = args.endpoint
+    auth_key = os.environ.get(AUTH_KEY_ENV)
+    if args.stub:
+        stub, server, endpoint = await start_stub_server(
+            latency=args.stub_latency, failure_rate=args.stub_failure_rate, max_texts=args.batch_size)
+        auth_key = None
+    try:
+        async with BatchTranslator(
+            endpoint, args.target_lang, auth_key=auth_key, source_lang=args.source_lang,
+            batch_size=args.batch_size, concurrency=args.concurrency, retries=args.retries,
+        ) as translator:
+            texts = list(sources.values())
+            translations, failures = await translator.translate_partial(texts)
+            report = translator.stats.format_summary()
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+    if stub is not None:
+        report += f"\n대역 서버: {stub.describe()}"
+    translated = {
+        entry_id: translation for entry_id, translation in zip(sources, translations) if translation is not None
+    }
+    return translated, [error for _, error in failures], report
+
+
+def print_missing(sources, translations, errors):
+    """번역하지 못한 문장과 실패 원인을 출력"""
+    missing = [(entry_id, source) for entry_id, source in sources.items() if entry_id not in translations]
+    print(f"\n❌ 번역하지 못한 문장 {len(missing):,}개 (실패한 요청 {len(errors)}개)")
+    for error in dict.fromkeys(str(error) for error in errors):
+        print(f"   원인: {error}")
+    for entry_id, source in missing[:MAX_LISTED_FAILURES]:
+        print(f"   {format_id_token(entry_id)} {source}")
+    if len(missing) > MAX_LISTED_FAILURES:
+        print(f"   ... 외 {len(missing) - MAX_LISTED_FAILURES:,}개")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="덱 예문/뜻을 번역 API로 미리 일괄 번역")
+    parser.add_argument("field", choices=("examples", "meanings"), help="번역할 필드")
+    parser.add_argument("--data-dir", type=Path, default=default_data_dir(), help="덱 디렉토리 (meanings)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="출력 파일 (기본값: examples는 translate_examples.csv, "
+                             "meanings는 build/translations/meanings_{언어}.json, "
+                             "--stub이면 build/translations/stub_{같은 이름})")
+    parser.add_argument("--all", action="store_true", help="meanings: meaning_ko가 있는 항목도 번역")
+    parser.add_argument("--tm", nargs="?", type=Path, const=default_tm_file(), default=None,
+                        help="examples: 번역 메모리에 있는 예문은 요청하지 않고 새 번역은 기록 "
+                             "(기본 경로: .translation_memory.sqlite)")
+    parser.add_argument("--limit", type=int, default=None, help="앞에서부터 이 수만큼만 번역 (시험용)")
+    parser.add_argument("--endpoint", default=DEFAULT_ENDPOINT, help=f"번역 API 주소 (기본값: {DEFAULT_ENDPOINT})")
+    parser.add_argument("--source-lang", default="EN", help="원문 언어 (기본값: EN)")
+    parser.add_argument("--target-lang", default="KO", help="번역 언어 (기본값: KO)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"요청당 문장 수 (기본값: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"동시 요청 수 = 연결 풀 크기 (기본값: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help=f"요청당 재시도 횟수 (기본값: {DEFAULT_RETRIES})")
+    parser.add_argument("--stub", action="store_true", help="로컬 대역 서버로 번역 (API 키 불필요)")
+    parser.add_argument("--stub-latency", type=float, default=0.02, help="대역 서버 요청당 지연(초) (기본값: 0.02)")
+    parser.add_argument("--stub-failure-rate", type=float, default=0.0, help="대역 서버가 일부러 실패할 비율 (0~1)")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    if not args.stub and not os.environ.get(AUTH_KEY_ENV):
+        print(f"❌ {AUTH_KEY_ENV} 환경 변수에 API 키를 설정하거나 --stub을 사용하세요")
+        sys.exit(1)
+
+    project_root = Path(__file__).parent.parent
+    with profiled("batch_translate", args.profile), metered("batch_translate", args.metrics, args.prometheus):
+        remembered = {}
+        with tracked("collect_sources"):
+            if args.field == "examples":
+                txt_file = project_root / "all_ko_examples.txt"
+                if not txt_file.exists():
+                    print(f"❌ 내보낸 예문 파일이 없습니다 (extract_examples.py를 먼저 실행하세요): {txt_file}")
+                    sys.exit(1)
+                tm_file = args.tm
+                if tm_file is not None and not tm_file.exists():
+                    print(f"⚠️  번역 메모리 파일이 없어서 모든 예문을 번역합니다: {tm_file}")
+                    tm_file = None
+                sources, remembered = collect_example_sources(txt_file, tm_file)
+            else:
+                sources = collect_meaning_sources(args.data_dir, args.all)
+            output = args.output or default_output(args.field, args.target_lang, args.stub)
+            if args.limit is not None:
+                sources = dict(list(sources.items())[:args.limit])
+            add_counts(entries_in=len(sources) + len(remembered))
+
+        print(f"번역할 문장: {len(sources):,}개" + (f" (번역 메모리로 {len(remembered):,}개 채움)" if remembered else ""))
+        translations = {}
+        errors = []
+        if sources:
+            with tracked("translate"):
+                translations, errors, report = asyncio.run(translate_sources(sources, args))
+            print(f"📊 {report}")
+
+        with tracked("write_output"):
+            output.parent.mkdir(parents=True, exist_ok=True)
+            if args.field == "examples":
+                write_examples_csv(output, {**remembered, **translations})
+            else:
+                atomic_write_text(output, json.dumps(translations, ensure_ascii=False, indent=2) + "\n")
+            add_counts(entries_out=len(remembered) + len(translations), bytes_written=output.stat().st_size)
+        print(f"✅ 번역 {len(remembered) + len(translations):,}개를 '{output}'에 저장했습니다.")
+
+        if args.field == "examples" and args.tm is not None and translations:
+            if args.stub:
+                print("⏭️  --stub 번역은 번역 메모리에 기록하지 않습니다")
+            else:
+                with tracked("record_translations"):
+                    record_translations(args.tm, ((sources[entry_id], text) for entry_id, text in translations.items()))
+
+        if errors:
+            add_counts(errors=len(errors))
+            print_missing(sources, translations, errors)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 크기를 1배/10배/100배/1000배로 늘린 복사본에서 파이프라인 단계별 성능을 측정하는 스크립트
+
+배율마다 실제 덱(assets/data)과 translate_examples.csv를 배율만큼 반복한 복사본을 작업 디렉토리에 만들고,
+아래 단계를 순서대로 실행한다 (앞 단계의 출력이 뒤 단계의 입력이 됨).
+--synthetic을 주면 복사본 대신 같은 항목 수의 합성 코퍼스(synthetic_corpus.py)를 사용한다.
+
+1. extract_examples_from_ko_files: KO 덱 -> all_ko_examples.txt
+2. renumber_examples: all_ko_examples.txt 전체 넘버링
+3. clean_cite_text: translate_examples.csv 정리
+4. read_translated_examples: translate_examples.csv 파싱
+5. read_all_ko_examples_order: all_ko_examples.txt의 파일 순서 파싱
+6. update_ko_files: KO 덱에 번역 예문 적용
+7. fix_korean_meanings.update_json_files: EN 덱 meaning_ko 교체
+8. improve_all_examples.update_json_files: EN 덱 예문 개선
+9. swap_en_ko_files: EN 덱으로 KO 덱 교체
+
+단계마다 실행 시간, 처리량(항목/초), 최대 메모리(tracemalloc)를 기록하고 결과를 JSON으로 저장한다.
+최대 메모리는 같은 단계를 tracemalloc을 켜고 한 번 더 실행해서 재므로 실행 시간에는 영향을 주지 않는다.
+--jobs로 병렬 실행할 때 작업 프로세스의 메모리는 포함되지 않는다.
+
+사용 예:
+    python scripts/benchmark.py
+    python scripts/benchmark.py --scales 1,10 --jobs 4 --output build/benchmark.json
+    python scripts/benchmark.py --scales 100 --synthetic --seed 42
+"""
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+
+import atomic_io
+import fix_korean_meanings
+import improve_all_examples
+import snapshot_store
+from clean_cite_text import clean_cite_text
+from deck_io import default_data_dir, deck_files, dump_deck, load_deck
+from entry_ids import ID_LENGTH
+from extract_examples import extract_examples_from_ko_files
+from numbered_text import iter_numbered_sentences
+from parallel import add_jobs_argument, resolve_jobs
+from renumber_examples import renumber_examples
+from swap_en_ko_files import swap_en_ko_files
+from synthetic_corpus import generate_corpus, learn_profile
+from update_ko_examples import read_all_ko_examples_order, read_translated_examples, update_ko_files
+
+RESULT_VERSION = 1
+DEFAULT_SCALES = [1, 10, 100, 1000]
+DEFAULT_OUTPUT_FILE = Path(__file__).parent.parent / "build" / "benchmark.json"
+
+
+def _scaled_id(entry_id, copy):
+    """복사본 항목의 ID (같은 위치의 EN/KO 항목은 계속 같은 ID를 가짐)"""
+    if copy == 0:
+        return entry_id
+    return hashlib.sha1(f"{entry_id}\x1f{copy}".encode('utf-8')).hexdigest()[:ID_LENGTH]
+
+
+def build_scaled_corpus(scale, work_dir, data_dir=None, csv_file=None):
+    """
+    실제 덱과 번역 파일을 scale배로 늘린 복사본을 work_dir에 생성
+
+    Returns:
+        dict: 항목 수 ({"EN": EN 항목 수, "KO": KO 항목 수, "sentences": 번역 예문 수})
+    """
+    data_dir = Path(data_dir or default_data_dir())
+    csv_file = Path(csv_file or data_dir.parent.parent / "translate_examples.csv")
+    work_data_dir = Path(work_dir) / "assets" / "data"
+    work_data_dir.mkdir(parents=True, exist_ok=True)
+
+    counts = {"EN": 0, "KO": 0, "sentences": 0}
+    for deck_file in deck_files(data_dir):
+        data = load_deck(deck_file)
+        scaled = []
+        for copy in range(scale):
+            for item in data:
+                if "id" in item:
+                    item = {**item, "id": _scaled_id(item["id"], copy)}
+                scaled.append(item)
+        (work_data_dir / deck_file.name).write_text(dump_deck(scaled), encoding='utf-8')
+        counts[deck_file.name.split("_", 1)[0]] += len(scaled)
+
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        sentences = [sentence for _, sentence in iter_numbered_sentences(f)]
+    with open(Path(work_dir) / "translate_examples.csv", 'w', encoding='utf-8') as f:
+        number = 1
+        for copy in range(scale):
+            for sentence in sentences:
+                f.write(f"{number}. {sentence} ")
+                number += 1
+    counts["sentences"] = len(sentences) * scale
+    return counts
+
+
+@contextmanager
+def isolated_state(work_dir):
+    """쓰기 저널과 스냅샷 저장소를 작업 디렉토리 안으로 돌려서, 측정이 프로젝트의 기록을 건드리지 않게 함"""
+    journal_file = atomic_io.DEFAULT_JOURNAL_FILE
+    store_dir = snapshot_store.DEFAULT_STORE_DIR
+    atomic_io.DEFAULT_JOURNAL_FILE = Path(work_dir) / ".deck_write_journal.json"
+    snapshot_store.DEFAULT_STORE_DIR = Path(work_dir) / ".deck_snapshots"
+    try:
+        yield
+    finally:
+        atomic_io.DEFAULT_JOURNAL_FILE = journal_file
+        snapshot_store.DEFAULT_STORE_DIR = store_dir
+
+
+def _stages(work_dir, jobs):
+    """
+    (단계 이름, 처리량 기준 항목 종류, 실행 함수) 리스트
+
+    실행 함수는 이전 단계들의 반환값을 담은 results 딕셔너리를 받는다.
+    """
+    work_dir = Path(work_dir)
+    data_dir = work_dir / "assets" / "data"
+    csv_file = work_dir / "translate_examples.csv"
+    txt_file = work_dir / "all_ko_examples.txt"
+    return [
+        ("extract_examples_from_ko_files", "KO",
+         lambda results: extract_examples_from_ko_files(data_dir, txt_file, jobs)),
+        ("renumber_examples", "KO",
+         lambda results: renumber_examples(txt_file, work_dir / "all_ko_examples_renumbered.txt")),
+        ("clean_cite_text", "sentences",
+         lambda results: clean_cite_text(csv_file, work_dir / "translate_examples_cleaned.csv")),
+        ("read_translated_examples", "sentences",
+         lambda results: read_translated_examples(csv_file)),
+        ("read_all_ko_examples_order", "KO",
+         lambda results: read_all_ko_examples_order(txt_file)),
+        ("update_ko_files", "KO",
+         lambda results: update_ko_files(
+             data_dir, results["read_translated_examples"], results["read_all_ko_examples_order"])),
+        ("fix_korean_meanings.update_json_files", "EN",
+         lambda results: fix_korean_meanings.update_json_files(jobs, data_dir)),
+        ("improve_all_examples.update_json_files", "EN",
+         lambda results: improve_all_examples.update_json_files(jobs, data_dir)),
+        ("swap_en_ko_files", "EN",
+         lambda results: swap_en_ko_files(data_dir, jobs)),
+    ]
+
+
+def measure(func, results, memory=True):
+    """
+    func(results)의 실행 시간과 최대 메모리를 측정 (스크립트 출력은 버림)
+
+    Returns:
+        tuple: (반환값, 실행 시간(초), 최대 메모리(bytes) - memory=False이면 None)
+    """
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, redirect_stdout(devnull):
+        gc.collect()
+        start = time.perf_counter()
+        value = func(results)
+        elapsed = time.perf_counter() - start
+
+        peak = None
+        if memory:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                func(results)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    return value, elapsed, peak
+
+
+def run_scale(scale, work_dir, jobs=1, memory=True, synthetic=None):
+    """
+    scale배 복사본을 만들고 모든 단계를 측정한 결과를 반환
+
+    synthetic이 (합성 분포, 실제 EN 항목 수, 시드)이면 복사본 대신 실제 항목 수의 scale배인 합성 코퍼스를 만든다.
+    """
+    work_dir = Path(work_dir)
+    start = time.perf_counter()
+    if synthetic is not None:
+        profile, base_entries, seed = synthetic
+        counts = generate_corpus(base_entries * scale, work_dir, seed, profile)
+    else:
+        counts = build_scaled_corpus(scale, work_dir)
+    setup_time = time.perf_counter() - start
+    corpus_bytes = sum(path.stat().st_size for path in work_dir.rglob("*") if path.is_file())
+
+    print(f"\n📦 {scale}배: EN {counts['EN']:,}개, KO {counts['KO']:,}개 항목, "
+          f"번역 예문 {counts['sentences']:,}개 ({corpus_bytes / 1024 / 1024:,.1f} MB, 준비 {setup_time:.1f}초)")
+    print(f"  {'단계':<40} {'시간(s)':>9} {'항목/초':>12} {'최대 메모리(MB)':>16}")
+
+    stage_results = []
+    results = {}
+    with isolated_state(work_dir):
+        for name, unit, func in _stages(work_dir, jobs):
+            value, elapsed, peak = measure(func, results, memory)
+            results[name] = value
+            items = counts[unit]
+            throughput = items / elapsed if elapsed > 0 else None
+            stage_results.append({
+                "stage": name,
+                "items": items,
+                "item_kind": unit,
+                "wall_seconds": round(elapsed, 6),
+                "items_per_second": round(throughput, 1) if throughput else None,
+                "peak_memory_bytes": peak,
+            })
+            memory_text = f"{peak / 1024 / 1024:,.1f}" if peak is not None else "-"
+            print(f"  {name:<40} {elapsed:>9.3f} {throughput or 0:>12,.0f} {memory_text:>16}")
+
+    return {
+        "scale": scale,
+        "entries": counts,
+        "corpus_bytes": corpus_bytes,
+        "setup_seconds": round(setup_time, 6),
+        "stages": stage_results,
+    }
+
+
+def run_benchmark(scales, jobs=1, memory=True, work_dir=None, synthetic_seed=None):
+    """
+    배율별로 run_scale을 실행하고 전체 결과를 반환 (work_dir이 없으면 임시 디렉토리를 쓰고 지움)
+
+    synthetic_seed가 주어지면 배율별 코퍼스를 그 시드의 합성 코퍼스로 만든다.
+    """
+    synthetic = None
+    if synthetic_seed is not None:
+        base_entries = sum(len(load_deck(path)) for path in deck_files(default_data_dir())
+                           if path.name.startswith("EN_"))
+        synthetic = (learn_profile(), base_entries, synthetic_seed)
+
+    runs = []
+    for scale in scales:
+        if work_dir is not None:
+            scale_dir = Path(work_dir) / f"scale-{scale}"
+            scale_dir.mkdir(parents=True, exist_ok=True)
+            runs.append(run_scale(scale, scale_dir, jobs, memory, synthetic))
+        else:
+            with tempfile.TemporaryDirectory(prefix=f"deck-benchmark-{scale}x-") as temp_dir:
+                runs.append(run_scale(scale, temp_dir, jobs, memory, synthetic))
+    return {
+        "version": RESULT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "jobs": jobs,
+        "memory": memory,
+        "corpus": "synthetic" if synthetic is not None else "scaled",
+        "seed": synthetic_seed,
+        "runs": runs,
+    }
+
+
+def _parse_scales(text):
+    scales = [int(part) for part in text.split(",") if part.strip()]
+    if not scales or any(scale < 1 for scale in scales):
+        raise argparse.ArgumentTypeError("배율은 1 이상의 정수를 쉼표로 구분해서 입력하세요 (예: 1,10,100)")
+    return scales
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="덱 크기별 파이프라인 단계 성능 측정")
+    parser.add_argument("--scales", type=_parse_scales, default=DEFAULT_SCALES,
+                        help="덱 크기 배율 (기본값: 1,10,100,1000)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_FILE, help="결과 JSON 파일 경로")
+    parser.add_argument("--work-dir", type=Path,
+                        help="복사본을 만들 디렉토리 (지정하면 측정 후에도 남김, 기본값: 임시 디렉토리)")
+    parser.add_argument("--no-memory", action="store_true", help="최대 메모리 측정(단계별 재실행) 생략")
+    parser.add_argument("--synthetic", action="store_true", help="실제 덱 복사본 대신 합성 코퍼스 사용")
+    parser.add_argument("--seed", type=int, default=0, help="합성 코퍼스 시드 (--synthetic과 함께 사용)")
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    report = run_benchmark(args.scales, resolve_jobs(args.jobs), not args.no_memory, args.work_dir,
+                           args.seed if args.synthetic else None)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    atomic_io.atomic_write_text(args.output, json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"\n✅ 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+컴팩트한 바이너리 덱 형식 (.vdk) 인코더와 참조 리더
+
+파일 구조 (리틀 엔디언):
+1. 헤더: magic "VDK1", 버전, 필드 수, 항목 수, 문자열 수, 각 영역의 시작 위치
+2. 필드 테이블: 필드마다 (필드 이름 문자열 ID u32, 종류 u8, 패딩 3바이트)
+   - 종류 0 (FIELD_INTERNED): level/category/pos처럼 반복되는 값 -> 문자열 테이블 ID
+   - 종류 1 (FIELD_TEXT): word/meaning/example 같은 자유 텍스트 -> 페이로드 위치
+3. 문자열 테이블: 문자열마다 (blob 내 오프셋 u32, 길이 u32) + UTF-8 blob
+   필드 이름과 인터닝된 값은 한 번만 저장된다.
+4. 인덱스: 항목마다 고정 길이 레코드
+   (인터닝 필드는 문자열 ID u32, 텍스트 필드는 페이로드 오프셋 u32 + 길이 u32)
+   -> i번째 항목은 인덱스 시작 + i * 레코드 크기에서 바로 읽을 수 있다.
+5. 페이로드: 텍스트 필드 값들의 UTF-8 바이트를 이어 붙인 것
+
+값이 없는 필드는 0xFFFFFFFF로 표시한다.
+"""
+
+import struct
+
+MAGIC = b"VDK1"
+VERSION = 1
+
+FIELD_INTERNED = 0
+FIELD_TEXT = 1
+
+# 값 종류가 적고 반복이 많은 필드
+INTERNED_FIELDS = ("level", "category", "pos")
+
+MISSING = 0xFFFFFFFF
+
+# magic, version, field_count, entry_count, string_count,
+# string_index_offset, string_blob_offset, index_offset, payload_offset, payload_size
+HEADER = struct.Struct("<4sHHIIIIIII")
+FIELD = struct.Struct("<IB3x")
+STRING = struct.Struct("<II")
+
+
+def _record_struct(kinds):
+    """필드 종류 리스트로부터 인덱스 레코드 형식을 만듦"""
+    codes = "".join("I" if kind == FIELD_INTERNED else "II" for kind in kinds)
+    return struct.Struct("<" + codes)
+
+
+def encode_deck(entries):
+    """
+    덱 항목 리스트를 바이너리 덱 바이트열로 변환
+
+    모든 필드 값은 문자열이어야 한다. 필드 순서는 항목들에 처음 등장한 순서를 따른다.
+    """
+    fields = []
+    for entry in entries:
+        for field in entry:
+            if field not in fields:
+                fields.append(field)
+    kinds = [FIELD_INTERNED if field in INTERNED_FIELDS else FIELD_TEXT for field in fields]
+
+    strings = []
+    string_ids = {}
+
+    def intern(value):
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    field_name_ids = [intern(field) for field in fields]
+
+    record = _record_struct(kinds)
+    index = bytearray()
+    payload = bytearray()
+    for position, entry in enumerate(entries):
+        values = []
+        for field, kind in zip(fields, kinds):
+            value = entry.get(field)
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"{position}번째 항목의 {field} 값이 문자열이 아닙니다: {value!r}")
+            if kind == FIELD_INTERNED:
+                values.append(MISSING if value is None else intern(value))
+            elif value is None:
+                values.extend((MISSING, MISSING))
+            else:
+                data = value.encode('utf-8')
+                values.extend((len(payload), len(data)))
+                payload += data
+        index += record.pack(*values)
+
+    string_index = bytearray()
+    string_blob = bytearray()
+    for value in strings:
+        data = value.encode('utf-8')
+        string_index += STRING.pack(len(string_blob), len(data))
+        string_blob += data
+
+    field_table = b"".join(FIELD.pack(name_id, kind) for name_id, kind in zip(field_name_ids, kinds))
+
+    string_index_offset = HEADER.size + len(field_table)
+    string_blob_offset = string_index_offset + len(string_index)
+    index_offset = string_blob_offset + len(string_blob)
+    payload_offset = index_offset + len(index)
+
+    header = HEADER.pack(
+        MAGIC, VERSION, len(fields), len(entries), len(strings),
+        string_index_offset, string_blob_offset, index_offset, payload_offset, len(payload),
+    )
+    return b"".join((header, field_table, string_index, string_blob, index, payload))
+
+
+class BinaryDeck:
+    """
+    바이너리 덱 참조 리더
+
+    생성 시에는 헤더와 문자열 테이블만 해석하고, 항목은 접근할 때 인덱스 레코드로 바로 찾아서 디코딩한다.
+    """
+
+    def __init__(self, data):
+        buffer = memoryview(data)
+        (
+            magic, version, field_count, entry_count, string_count,
+            string_index_offset, string_blob_offset, index_offset, payload_offset, payload_size,
+        ) = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"바이너리 덱 형식이 아닙니다 (magic: {bytes(magic)!r})")
+        if version != VERSION:
+            raise ValueError(f"지원하지 않는 바이너리 덱 버전입니다: {version}")
+
+        self.strings = []
+        for i in range(string_count):
+            offset, length = STRING.unpack_from(buffer, string_index_offset + i * STRING.size)
+            start = string_blob_offset + offset
+            self.strings.append(str(buffer[start:start + length], 'utf-8'))
+
+        self.fields = []
+        kinds = []
+        for i in range(field_count):
+            name_id, kind = FIELD.unpack_from(buffer, HEADER.size + i * FIELD.size)
+            self.fields.append(self.strings[name_id])
+            kinds.append(kind)
+
+        # (필드 이름, 종류, 레코드 내 위치) - 항목 디코딩 시 반복 계산을 피하기 위해 미리 만들어 둠
+        self._layout = []
+        position = 0
+        for field, kind in zip(self.fields, kinds):
+            self._layout.append((field, kind, position))
+            position += 1 if kind == FIELD_INTERNED else 2
+
+        self._record = _record_struct(kinds)
+        self._count = entry_count
+        self._index = buffer[index_offset:index_offset + entry_count * self._record.size]
+        self._payload = bytes(buffer[payload_offset:payload_offset + payload_size])
+
+    def __len__(self):
+        return self._count
+
+    def _decode(self, values):
+        entry = {}
+        strings = self.strings
+        payload = self._payload
+        for field, kind, position in self._layout:
+            if kind == FIELD_INTERNED:
+                string_id = values[position]
+                if string_id != MISSING:
+                    entry[field] = strings[string_id]
+            else:
+                offset = values[position]
+                if offset != MISSING:
+                    entry[field] = payload[offset:offset + values[position + 1]].decode('utf-8')
+        return entry
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("바이너리 덱 항목 인덱스가 범위를 벗어났습니다")
+        return self._decode(self._record.unpack_from(self._index, index * self._record.size))
+
+    def __iter__(self):
+        if not self._count:
+            return
+        for values in self._record.iter_unpack(self._index):
+            yield self._decode(values)
+
+
+def read_binary_deck(path):
+    """바이너리 덱 파일을 읽어서 항목 리스트로 반환"""
+    with open(path, 'rb') as f:
+        return list(BinaryDeck(f.read()))
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+콘텐츠 해시 기반 빌드 캐시
+
+각 단계(step)의 입력 해시(덱 JSON, translate_examples.csv, 사전 데이터 등)와
+출력 파일 해시를 기록해 두고, 입력이 바뀌지 않았고 출력 파일도 마지막으로 기록한
+내용 그대로라면 그 단계를 건너뛸 수 있게 한다.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from atomic_io import atomic_write_text
+
+# 캐시 형식이나 변환 로직이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_FILE = Path(__file__).parent.parent / ".deck_build_cache.json"
+
+
+def _empty_cache():
+    return {"version": CACHE_VERSION, "files": {}, "steps": {}}
+
+
+def load_cache(cache_file=DEFAULT_CACHE_FILE):
+    """캐시 파일을 읽어서 반환 (없거나 버전이 다르면 빈 캐시)"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return _empty_cache()
+    if cache.get("version") != CACHE_VERSION:
+        return _empty_cache()
+    return cache
+
+
+def save_cache(cache, cache_file=DEFAULT_CACHE_FILE):
+    """캐시를 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+    atomic_write_text(cache_file, json.dumps(cache, ensure_ascii=False, indent=2, sort_keys=True))
+
+
+def bytes_hash(data):
+    """바이트열의 sha256 해시"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def object_hash(obj):
+    """JSON으로 표현 가능한 객체(사전 데이터 등)의 해시 (키 순서와 무관)"""
+    text = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return bytes_hash(text.encode('utf-8'))
+
+
+def file_hash(path, cache=None):
+    """
+    파일 내용의 sha256 해시
+
+    cache가 주어지면 크기와 수정 시각이 기록과 같을 때 파일을 다시 읽지 않고 기록된 해시를 사용한다.
+    파일이 없으면 None을 반환한다.
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    key = str(path.resolve())
+    if cache is not None:
+        entry = cache["files"].get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+
+    with open(path, 'rb') as f:
+        digest = bytes_hash(f.read())
+
+    if cache is not None:
+        cache["files"][key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+        }
+    return digest
+
+
+def inputs_key(inputs):
+    """입력 이름 -> 해시 딕셔너리를 하나의 키로 합침"""
+    return object_hash({"version": CACHE_VERSION, "inputs": inputs})
+
+
+def is_up_to_date(cache, step, key, output_paths):
+    """
+    step의 입력 키가 기록과 같고, 모든 출력 파일이 마지막으로 기록된 내용 그대로인지 확인
+    """
+    record = cache["steps"].get(step)
+    if not record or record["key"] != key:
+        return False
+
+    outputs = [str(Path(path).resolve()) for path in output_paths]
+    if sorted(outputs) != sorted(record["outputs"]):
+        return False
+    return all(file_hash(path, cache) == record["outputs"][path] for path in outputs)
+
+
+def record_step(cache, step, key, output_paths):
+    """step의 입력 키와 현재 출력 파일 해시를 기록"""
+    cache["steps"][step] = {
+        "key": key,
+        "outputs": {
+            str(Path(path).resolve()): file_hash(path, cache) for path in output_paths
+        },
+    }
+
+
+def forget_missing_files(cache):
+    """더 이상 존재하지 않는 파일의 기록을 제거"""
+    cache["files"] = {
+        path: entry for path, entry in cache["files"].items() if os.path.exists(path)
+    }
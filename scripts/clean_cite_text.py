@@ -3,9 +3,15 @@
 CSV 파일에서 [cite_start]와 [cite: 숫자] 같은 불필요한 텍스트를 제거하는 스크립트
 """
 
+import argparse
+import os
 import re
 from pathlib import Path
 
+from atomic_io import atomic_write_text, replace_file
+from metrics import add_counts, add_metrics_arguments, metered, tracked
+from profiling import add_profile_argument, profiled
+
 def clean_cite_text(input_file, output_file):
     """
     CSV 파일에서 대괄호 [] 안의 모든 내용을 제거
@@ -17,6 +23,7 @@ def clean_cite_text(input_file, output_file):
     
     with open(input_file, 'r', encoding='utf-8') as f:
         content = f.read()
+        add_counts(bytes_read=os.fstat(f.fileno()).st_size)
     
     # 대괄호 [] 안의 모든 내용을 제거
     cleaned_content = re.sub(r'\[.*?\]', '', content)
@@ -34,35 +41,44 @@ def clean_cite_text(input_file, output_file):
             cleaned_lines.append(line + '\n')
     
     # 새로운 파일에 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.writelines(cleaned_lines)
+    # 임시 파일에 쓴 뒤 교체하므로 중단되어도 반쯤 쓰인 파일이 남지 않음
+    output = ''.join(cleaned_lines)
+    atomic_write_text(output_file, output)
+    add_counts(entries_out=len(cleaned_lines), bytes_written=len(output.encode('utf-8')))
     
     print(f"✅ 완료: {input_file} -> {output_file}")
     print(f"총 {len(cleaned_lines)}줄이 정리되었습니다.")
 
 def main():
     """메인 함수"""
-    # 파일 경로 설정
-    project_root = Path(__file__).parent.parent
-    input_file = project_root / "translate_examples.csv"
-    output_file = project_root / "translate_examples_cleaned.csv"
-    
-    if not input_file.exists():
-        print(f"❌ 입력 파일을 찾을 수 없습니다: {input_file}")
-        return
-    
-    print(f"입력 파일: {input_file}")
-    print(f"출력 파일: {output_file}")
-    print("=" * 50)
-    
-    clean_cite_text(input_file, output_file)
-    
-    # 원본 파일을 새 파일로 교체
-    print("\n원본 파일을 새 파일로 교체합니다...")
-    input_file.unlink()  # 원본 파일 삭제
-    output_file.rename(input_file)  # 새 파일을 원본 이름으로 변경
+    parser = argparse.ArgumentParser(description="translate_examples.csv에서 대괄호 안의 텍스트 제거")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
     
-    print(f"✅ 최종 완료: {input_file}")
+    with profiled("clean_cite_text", args.profile), metered("clean_cite_text", args.metrics, args.prometheus):
+        # 파일 경로 설정
+        project_root = Path(__file__).parent.parent
+        input_file = project_root / "translate_examples.csv"
+        output_file = project_root / "translate_examples_cleaned.csv"
+        
+        if not input_file.exists():
+            print(f"❌ 입력 파일을 찾을 수 없습니다: {input_file}")
+            return
+        
+        print(f"입력 파일: {input_file}")
+        print(f"출력 파일: {output_file}")
+        print("=" * 50)
+        
+        with tracked("clean_cite_text"):
+            clean_cite_text(input_file, output_file)
+        
+        # 원본 파일을 새 파일로 교체
+        print("\n원본 파일을 새 파일로 교체합니다...")
+        with tracked("replace_file"):
+            replace_file(output_file, input_file)  # 원본을 삭제하지 않고 한 번에 교체 (중단되어도 원본이나 새 파일 중 하나는 남음)
+        
+        print(f"✅ 최종 완료: {input_file}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+assets/data의 모든 덱 JSON을 바이너리 덱 형식(.vdk)으로 컴파일하는 스크립트
+
+--benchmark 옵션을 주면 JSON 디코딩과 바이너리 디코딩 시간을 덱별로 비교한다.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from atomic_io import WriteTransaction
+from binary_deck import BinaryDeck, encode_deck
+from deck_io import deck_files, default_data_dir, load_deck, write_bytes_if_changed
+from metrics import add_metrics_arguments, metered, tracked
+from profiling import add_profile_argument, best_time, profiled
+
+
+def default_output_dir():
+    """바이너리 덱 출력 디렉토리 (build/decks)"""
+    return Path(__file__).parent.parent / "build" / "decks"
+
+
+def compile_decks(data_dir, output_dir):
+    """
+    data_dir의 EN_/KO_ 덱을 모두 바이너리 덱으로 컴파일
+
+    컴파일 결과가 기존 파일과 같으면 다시 쓰지 않고, 바뀐 파일들은 한 번에 교체한다.
+
+    Returns:
+        list: (덱 파일 경로, 바이너리 덱 파일 경로) 리스트
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    compiled = []
+    total_json = 0
+    total_binary = 0
+    with WriteTransaction() as transaction:
+        for deck_file in deck_files(data_dir):
+            data = encode_deck(load_deck(deck_file))
+            binary_file = output_path / (deck_file.stem + ".vdk")
+            written = write_bytes_if_changed(binary_file, data, transaction)
+
+            json_size = deck_file.stat().st_size
+            total_json += json_size
+            total_binary += len(data)
+            status = "✅" if written else "⏭️ "
+            print(f"{status} {deck_file.name}: {json_size:,} -> {len(data):,} bytes ({len(data) / json_size:.0%})")
+            compiled.append((deck_file, binary_file))
+
+    if total_json:
+        print(f"\n총 {len(compiled)}개 덱: {total_json:,} -> {total_binary:,} bytes ({total_binary / total_json:.0%})")
+    return compiled
+
+
+def benchmark_decode(compiled, repeat=20):
+    """
+    덱별로 JSON 디코딩(json.loads)과 바이너리 디코딩(BinaryDeck 전체 순회) 시간을 비교
+
+    두 방식 모두 파일 내용은 미리 메모리에 읽어둔 상태에서 디코딩 시간만 잰다.
+
+    Returns:
+        list: 덱별 결과 딕셔너리 리스트
+    """
+    results = []
+    print(f"\n{'덱':<32} {'JSON(ms)':>10} {'바이너리(ms)':>12} {'첫 항목(µs)':>12} {'배속':>6}")
+    print("-" * 78)
+    for deck_file, binary_file in compiled:
+        text = deck_file.read_text(encoding='utf-8')
+        data = binary_file.read_bytes()
+
+        expected = json.loads(text)
+        if list(BinaryDeck(data)) != expected:
+            raise ValueError(f"바이너리 덱 내용이 원본과 다릅니다: {deck_file.name}")
+
+        json_time = best_time(lambda: json.loads(text), repeat)
+        binary_time = best_time(lambda: list(BinaryDeck(data)), repeat)
+        first_entry_time = best_time(lambda: BinaryDeck(data)[0] if expected else None, repeat)
+
+        results.append({
+            "deck": deck_file.name,
+            "entries": len(expected),
+            "json_bytes": len(text.encode('utf-8')),
+            "binary_bytes": len(data),
+            "json_decode_seconds": json_time,
+            "binary_decode_seconds": binary_time,
+            "binary_first_entry_seconds": first_entry_time,
+        })
+        print(
+            f"{deck_file.name:<32} {json_time * 1000:>10.3f} {binary_time * 1000:>12.3f} "
+            f"{first_entry_time * 1e6:>12.1f} {json_time / binary_time:>5.2f}x"
+        )
+
+    total_json = sum(result["json_decode_seconds"] for result in results)
+    total_binary = sum(result["binary_decode_seconds"] for result in results)
+    if results:
+        print("-" * 78)
+        print(f"{'합계':<32} {total_json * 1000:>10.3f} {total_binary * 1000:>12.3f} {'':>12} {total_json / total_binary:>5.2f}x")
+    return results
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="덱 JSON을 바이너리 덱 형식으로 컴파일")
+    parser.add_argument("--out-dir", type=Path, default=default_output_dir(), help="바이너리 덱 출력 디렉토리")
+    parser.add_argument("--benchmark", action="store_true", help="JSON과 바이너리 디코딩 시간 비교")
+    parser.add_argument("--repeat", type=int, default=20, help="벤치마크 반복 횟수 (기본값: 20)")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    data_dir = default_data_dir()
+    if not data_dir.exists():
+        print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
+        return
+
+    print(f"데이터 디렉토리: {data_dir}")
+    print(f"출력 디렉토리: {args.out_dir}")
+    print("=" * 50)
+
+    with profiled("compile_binary_decks", args.profile), metered("compile_binary_decks", args.metrics, args.prometheus):
+        with tracked("compile_decks"):
+            compiled = compile_decks(data_dir, args.out_dir)
+
+        if args.benchmark:
+            with tracked("benchmark_decode"):
+                benchmark_decode(compiled, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱마다 앞으로 N일 동안의 오늘의 단어를 미리 정해서 일정 파일(.vds)로 만드는 스크립트
+
+앱(JsonWordService.getTodayWords)은 매번 덱 전체를 읽어서 Random()으로 섞고 앞의 5개를 고른다.
+이 스크립트는 같은 선택을 빌드 시점에 시드로 고정해서 계산해 둔다.
+- 덱 항목을 한 바퀴 다 보여 주기 전에는 같은 항목을 다시 고르지 않는다 (바퀴가 바뀌는 날에도 전날/같은 날 항목은 피함)
+- 바퀴마다 word_frequency.json 순위가 높은(흔한) 단어일수록 앞쪽에 나오도록 가중치를 주어 섞는다
+  (EN 덱은 word, KO 덱은 meaning_en 기준, 순위가 없는 단어는 가중치 1)
+- 일정은 SCHEDULE_EPOCH부터 이어지는 하나의 순서이므로, 다른 날 다시 빌드해도 같은 날짜에는 같은 단어가 나온다
+  (덱 파일이나 시드가 바뀌지 않는 한)
+
+사용 예:
+    python scripts/compile_daily_schedules.py --days 365
+    python scripts/compile_daily_schedules.py --lookup EN_기초다지기_일상회화 2026-10-18
+    python scripts/compile_daily_schedules.py --benchmark
+"""
+
+import argparse
+import json
+import math
+import random
+from collections import deque
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from atomic_io import WriteTransaction
+from build_cache import file_hash
+from daily_schedule import DailySchedule, day_number, encode_schedules
+from deck_io import deck_files, default_data_dir, load_deck, load_word_frequency, write_bytes_if_changed
+from metrics import add_metrics_arguments, metered, tracked
+from profiling import add_profile_argument, best_time, profiled
+
+# 일정 순서가 시작되는 날 (이날이 0번째 날)
+SCHEDULE_EPOCH = date(2026, 1, 1)
+
+DEFAULT_DAYS = 365
+DEFAULT_WORDS_PER_DAY = 5
+DEFAULT_SEED = 0
+
+# 빈도 순위 r인 단어의 가중치: 1 + FREQUENCY_WEIGHT / log2(r + 1) (1위: 5, 742위: 1.4)
+FREQUENCY_WEIGHT = 4.0
+
+
+def default_output_file():
+    """일정 파일 경로 (build/schedules/daily_schedules.vds)"""
+    return Path(__file__).parent.parent / "build" / "schedules" / "daily_schedules.vds"
+
+
+def entry_weights(entries, ranks):
+    """항목마다 섞기 가중치 (영어 단어의 빈도 순위가 높을수록 큼)"""
+    weights = []
+    for entry in entries:
+        word = entry.get("meaning_en", entry.get("word", ""))
+        rank = ranks.get(word) or ranks.get(word.lower())
+        weights.append(1.0 + FREQUENCY_WEIGHT / math.log2(rank + 1) if rank else 1.0)
+    return weights
+
+
+def cycle_order(weights, seed, deck, cycle):
+    """
+    한 바퀴 동안 보여 줄 항목 위치 순서 (가중치 비복원 추출과 같은 분포의 순서)
+
+    항목마다 지수분포 난수 / 가중치를 키로 정렬한다. 난수는 (시드, 덱, 바퀴 번호) 문자열로 시드한
+    random.Random에서 뽑으므로 플랫폼과 무관하게 같은 순서가 나온다.
+    """
+    rng = random.Random(f"{seed}:{deck}:{cycle}")
+    keys = [rng.expovariate(weight) for weight in weights]
+    return sorted(range(len(weights)), key=keys.__getitem__)
+
+
+def deck_schedule(weights, seed, deck, total_days, words_per_day):
+    """
+    SCHEDULE_EPOCH부터 total_days일 동안 날마다 보여 줄 항목 위치 리스트
+
+    바퀴 순서대로 하루 words_per_day개씩 꺼낸다. 바퀴가 바뀌는 날에 같은 날이나 전날 항목이
+    다시 나오면 그 항목은 뒤로 미룬다 (덱이 하루 단어 수의 두 배보다 작으면 전날 항목은 허용).
+    """
+    count = len(weights)
+    per_day = min(words_per_day, count)
+    avoid_previous = count >= 2 * per_day
+    queue = deque()
+    cycle = 0
+    previous = set()
+    days = []
+    for _ in range(total_days):
+        today = []
+        deferred = []
+        while len(today) < per_day:
+            if not queue:
+                queue.extend(cycle_order(weights, seed, deck, cycle))
+                cycle += 1
+            position = queue.popleft()
+            if position in today or (avoid_previous and position in previous):
+                deferred.append(position)
+                continue
+            today.append(position)
+        queue.extendleft(reversed(deferred))
+        previous = set(today)
+        days.append(today)
+    return days
+
+
+def compile_schedules(data_dir, output_file, start, days, words_per_day=DEFAULT_WORDS_PER_DAY, seed=DEFAULT_SEED):
+    """
+    data_dir의 모든 덱으로 start부터 days일 동안의 일정 파일을 만듦 (내용이 같으면 다시 쓰지 않음)
+
+    Returns:
+        bytes: 일정 파일 내용
+    """
+    if start < SCHEDULE_EPOCH:
+        raise ValueError(f"시작일은 {SCHEDULE_EPOCH} 이후여야 합니다: {start}")
+    offset = (start - SCHEDULE_EPOCH).days
+    ranks = load_word_frequency(data_dir)
+
+    decks = {}
+    ranked = 0
+    total = 0
+    for deck_file in deck_files(data_dir):
+        entries = load_deck(deck_file)
+        weights = entry_weights(entries, ranks)
+        schedule = deck_schedule(weights, seed, deck_file.stem, offset + days, words_per_day) if entries else [[]] * (offset + days)
+        decks[deck_file.stem] = {
+            "ids": [entry.get("id") for entry in entries],
+            "hash": file_hash(deck_file),
+            "days": schedule[offset:],
+        }
+        ranked += sum(1 for weight in weights if weight > 1.0)
+        total += len(entries)
+
+    data = encode_schedules(decks, words_per_day, day_number(SCHEDULE_EPOCH), day_number(start), seed)
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with WriteTransaction() as transaction:
+        written = write_bytes_if_changed(output_file, data, transaction)
+
+    status = "✅" if written else "⏭️ "
+    print(f"{status} {output_file.name}: 덱 {len(decks)}개 x {days}일 x {words_per_day}개, {len(data):,} bytes")
+    print(f"   빈도 순위가 있는 항목 {ranked:,}/{total:,}개, 기간 {start} ~ {date.fromordinal(start.toordinal() + days - 1)}")
+    return data
+
+
+def lookup(schedule, data_dir, deck, when):
+    """deck의 when 날짜 단어들을 덱 파일에서 찾아서 출력"""
+    deck_file = Path(data_dir) / f"{deck}.json"
+    if deck not in schedule.decks or not deck_file.exists():
+        print(f"❌ 덱을 찾을 수 없습니다: {deck}")
+        return
+    entries = load_deck(deck_file)
+    if file_hash(deck_file)[:16] != schedule.deck_hash(deck):
+        print(f"⚠️  {deck}.json이 일정을 만든 뒤 바뀌었습니다. 다시 컴파일하세요.")
+    try:
+        positions = schedule.positions_for_date(deck, when)
+    except IndexError as e:
+        print(f"❌ {e} ({schedule.first_date} ~ {schedule.last_date})")
+        return
+    print(f"\n{deck} {when}:")
+    for position in positions:
+        entry = entries[position] if position < len(entries) else {}
+        meaning = entry.get("meaning_ko", entry.get("meaning_en", ""))
+        print(f"  [{position}] {{{schedule.entry_id(deck, position)}}} {entry.get('word', '?')} - {meaning}")
+
+
+def benchmark_lookup(data, data_dir, words_per_day, repeat=20):
+    """
+    덱별로 앱의 현재 방식(JSON 디코딩 + 전체 섞기 + 앞에서 고르기)과 일정 파일 조회 시간을 비교
+
+    두 방식 모두 파일 내용은 미리 메모리에 읽어둔 상태에서 시간만 잰다.
+    일정 파일은 앱 실행 중 한 번만 열면 되므로 여는 시간(헤더/덱 테이블 해석)은 따로 출력한다.
+    """
+    schedule = DailySchedule(data)
+    open_time = best_time(lambda: DailySchedule(data), repeat)
+    today = max(schedule.first_date, min(schedule.last_date, datetime.now(timezone.utc).date()))
+    print(f"\n{'덱':<32} {'섞기(ms)':>10} {'조회(µs)':>10} {'배속':>8}")
+    print("-" * 64)
+    total_shuffle = 0.0
+    total_lookup = 0.0
+    for deck_file in deck_files(data_dir):
+        text = deck_file.read_text(encoding='utf-8')
+        deck = deck_file.stem
+
+        def shuffle_pick():
+            entries = json.loads(text)
+            random.shuffle(entries)
+            return entries[:words_per_day]
+
+        shuffle_time = best_time(shuffle_pick, repeat)
+        lookup_time = best_time(lambda: schedule.entry_ids_for_date(deck, today), repeat)
+        total_shuffle += shuffle_time
+        total_lookup += lookup_time
+        print(f"{deck_file.name:<32} {shuffle_time * 1000:>10.3f} {lookup_time * 1e6:>10.1f} "
+              f"{shuffle_time / lookup_time:>7.0f}x")
+    print("-" * 64)
+    print(f"{'합계':<32} {total_shuffle * 1000:>10.3f} {total_lookup * 1e6:>10.1f} "
+          f"{total_shuffle / total_lookup:>7.0f}x")
+    print(f"일정 파일 열기 (덱 {len(schedule.decks)}개): {open_time * 1e6:.1f}µs")
+
+
+def _parse_date(text):
+    return date.fromisoformat(text)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="덱별 오늘의 단어 일정을 미리 계산해서 일정 파일로 컴파일")
+    parser.add_argument("--out", type=Path, default=default_output_file(), help="일정 파일 경로")
+    parser.add_argument("--start", type=_parse_date, default=None,
+                        help="일정 첫날 YYYY-MM-DD (기본값: 오늘, UTC)")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help=f"저장할 일수 (기본값: {DEFAULT_DAYS})")
+    parser.add_argument("--words-per-day", type=int, default=DEFAULT_WORDS_PER_DAY,
+                        help=f"하루 단어 수 (기본값: {DEFAULT_WORDS_PER_DAY})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"일정 시드 (기본값: {DEFAULT_SEED})")
+    parser.add_argument("--lookup", nargs=2, metavar=("DECK", "DATE"),
+                        help="컴파일한 일정에서 덱(예: EN_기초다지기_일상회화)의 날짜별 단어 출력")
+    parser.add_argument("--benchmark", action="store_true", help="덱 섞기와 일정 조회 시간 비교")
+    parser.add_argument("--repeat", type=int, default=20, help="벤치마크 반복 횟수 (기본값: 20)")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    if args.days < 1 or args.words_per_day < 1:
+        parser.error("--days와 --words-per-day는 1 이상이어야 합니다")
+
+    data_dir = default_data_dir()
+    if not data_dir.exists():
+        print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
+        return
+
+    start = args.start or datetime.now(timezone.utc).date()
+    with profiled("compile_daily_schedules", args.profile), \
+            metered("compile_daily_schedules", args.metrics, args.prometheus):
+        with tracked("compile_schedules"):
+            data = compile_schedules(data_dir, args.out, start, args.days, args.words_per_day, args.seed)
+
+        if args.lookup:
+            deck, when = args.lookup
+            lookup(DailySchedule(data), data_dir, deck, _parse_date(when))
+
+        if args.benchmark:
+            with tracked("benchmark_lookup"):
+                benchmark_lookup(data, data_dir, args.words_per_day, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱을 고정 크기 샤드로 나누고 지연 로딩용 매니페스트를 만드는 스크립트
+
+앱(JsonWordService.getTodayWords)은 단어 count개를 고르려고 덱 파일 전체를 디코딩한다.
+이 스크립트는 덱마다 항목을 정렬해서 shard_size개씩 샤드로 나누고 build/shards에
+- {덱}.shards: 샤드(공백 없는 JSON 배열)들을 이어 붙인 파일
+- manifest.json: 덱별 샤드의 바이트 범위, 항목 수, sha256, 빈도 순위 범위 (deck_shards.py)
+를 만든다. 정렬 순서는 두 가지이다.
+- rank: word_frequency.json 빈도 순위순 (compile_ranked_decks와 같음) -> 흔한 단어부터, 순위 범위 조회
+- shuffle: (시드, 덱 이름)으로 고정한 섞기 -> 아무 위치에서 연속으로 count개를 읽으면 무작위 선택
+
+사용 예:
+    python scripts/compile_deck_shards.py
+    python scripts/compile_deck_shards.py --order rank --shard-size 32
+    python scripts/compile_deck_shards.py --pick EN_표현력확장_일상회화 10 --benchmark
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+
+from atomic_io import WriteTransaction
+from build_cache import file_hash
+from compile_ranked_decks import rank_deck
+from deck_io import deck_files, default_data_dir, load_deck, load_word_frequency, write_bytes_if_changed
+from deck_shards import (
+    MANIFEST_FILE_NAME,
+    MANIFEST_VERSION,
+    ORDERS,
+    SHARD_FILE_SUFFIX,
+    ShardedDecks,
+    encode_shards,
+)
+from metrics import add_counts, add_metrics_arguments, metered, tracked
+from profiling import add_profile_argument, best_time, profiled
+
+DEFAULT_SHARD_SIZE = 64
+DEFAULT_ORDER = "shuffle"
+DEFAULT_SEED = 0
+
+
+def default_output_dir():
+    """샤드 출력 디렉토리 (build/shards)"""
+    return Path(__file__).parent.parent / "build" / "shards"
+
+
+def ordered_entries(deck_file, order, seed, ranks):
+    """덱 항목들을 샤드 순서로 정렬한 리스트"""
+    if order == "rank":
+        return rank_deck(deck_file, ranks)[0]
+    entries = load_deck(deck_file)
+    random.Random(f"{seed}:{deck_file.stem}").shuffle(entries)
+    return entries
+
+
+def compile_deck_shards(data_dir, output_dir, shard_size=DEFAULT_SHARD_SIZE, order=DEFAULT_ORDER, seed=DEFAULT_SEED):
+    """
+    data_dir의 모든 덱을 샤드 파일로 나누고 매니페스트를 만듦
+
+    바뀐 파일만 다시 쓰고, 샤드 파일과 매니페스트는 한 번에 교체한다. 원본 덱이 없어진 샤드 파일도 같은 트랜잭션에서 지운다.
+
+    Returns:
+        dict: 매니페스트
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    ranks = load_word_frequency(data_dir) if order == "rank" else None
+
+    manifest = {"version": MANIFEST_VERSION, "order": order, "shard_size": shard_size, "seed": seed, "decks": {}}
+    produced = set()
+    with WriteTransaction() as transaction:
+        for deck_file in deck_files(data_dir):
+            with tracked("shard_deck"):
+                entries = ordered_entries(deck_file, order, seed, ranks)
+                data, shards = encode_shards(entries, shard_size)
+            shard_file = output_path / (deck_file.stem + SHARD_FILE_SUFFIX)
+            written = write_bytes_if_changed(shard_file, data, transaction)
+            produced.add(shard_file)
+            add_counts(entries_out=len(entries))
+            manifest["decks"][deck_file.stem] = {
+                "file": shard_file.name,
+                "entry_count": len(entries),
+                "source_sha256": file_hash(deck_file),
+                "shards": shards,
+            }
+            status = "✅" if written else "⏭️ "
+            print(f"{status} {shard_file.name}: 항목 {len(entries):,}개, 샤드 {len(shards)}개, {len(data):,} bytes")
+
+        manifest_data = json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')
+        write_bytes_if_changed(output_path / MANIFEST_FILE_NAME, manifest_data, transaction)
+
+        for stale in sorted(output_path.glob("*" + SHARD_FILE_SUFFIX)):
+            if stale not in produced:
+                transaction.remove(stale)
+                print(f"🗑️  {stale.name}: 원본 덱이 없어서 삭제")
+
+    shard_total = sum(len(deck["shards"]) for deck in manifest["decks"].values())
+    print(f"\n총 {len(manifest['decks'])}개 덱, 샤드 {shard_total}개 ({order} 순서, 샤드당 최대 {shard_size}개)")
+    return manifest
+
+
+def benchmark_pick(manifest, data_dir, output_dir, count, repeat=20):
+    """
+    덱별로 앱의 현재 방식(덱 파일 전체 읽기 + 디코딩 + 섞기 + 앞에서 count개)과
+    샤드 방식(매니페스트로 필요한 샤드만 읽기 + 디코딩 + 연속 count개) 시간을 비교
+
+    샤드 방식은 매번 새 리더를 만들어서 캐시 없이 파일에서 읽는다. 매니페스트 해석 시간은 제외한다.
+    """
+    rng = random.Random(0)
+    print(f"\n{'덱':<32} {'전체(ms)':>10} {'샤드(ms)':>10} {'읽은 바이트':>16} {'배속':>7}")
+    print("-" * 80)
+    total_full = 0.0
+    total_sharded = 0.0
+    for deck_file in deck_files(data_dir):
+        deck = deck_file.stem
+
+        def full_pick():
+            entries = json.loads(deck_file.read_text(encoding='utf-8'))
+            random.shuffle(entries)
+            return entries[:count]
+
+        def sharded_pick():
+            reader = ShardedDecks(manifest, output_dir)
+            reader.pick(deck, count, rng.randrange(max(reader.entry_count(deck), 1)))
+            return reader
+
+        full_time = best_time(full_pick, repeat)
+        sharded_time = best_time(sharded_pick, repeat)
+        bytes_read = sharded_pick().bytes_read
+        total_full += full_time
+        total_sharded += sharded_time
+        print(f"{deck_file.name:<32} {full_time * 1000:>10.3f} {sharded_time * 1000:>10.3f} "
+              f"{bytes_read:>7,}/{deck_file.stat().st_size:>8,} {full_time / sharded_time:>6.1f}x")
+    print("-" * 80)
+    print(f"{'합계':<32} {total_full * 1000:>10.3f} {total_sharded * 1000:>10.3f} "
+          f"{'':>16} {total_full / total_sharded:>6.1f}x")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="덱을 고정 크기 샤드로 나누고 지연 로딩용 매니페스트 생성")
+    parser.add_argument("--out-dir", type=Path, default=default_output_dir(), help="샤드/매니페스트 출력 디렉토리")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE,
+                        help=f"샤드당 항목 수 (기본값: {DEFAULT_SHARD_SIZE})")
+    parser.add_argument("--order", choices=ORDERS, default=DEFAULT_ORDER,
+                        help=f"샤드 정렬 순서 (기본값: {DEFAULT_ORDER})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"shuffle 순서 시드 (기본값: {DEFAULT_SEED})")
+    parser.add_argument("--pick", nargs=2, metavar=("DECK", "COUNT"),
+                        help="샤드에서 덱(예: EN_기초다지기_일상회화)의 단어 COUNT개를 골라 출력")
+    parser.add_argument("--benchmark", action="store_true", help="덱 전체 읽기+섞기와 샤드 읽기 시간 비교")
+    parser.add_argument("--count", type=int, default=5, help="벤치마크에서 고를 단어 수 (기본값: 5)")
+    parser.add_argument("--repeat", type=int, default=20, help="벤치마크 반복 횟수 (기본값: 20)")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    if args.shard_size < 1:
+        parser.error("--shard-size는 1 이상이어야 합니다")
+
+    data_dir = default_data_dir()
+    if not data_dir.exists():
+        print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
+        return
+
+    with profiled("compile_deck_shards", args.profile), \
+            metered("compile_deck_shards", args.metrics, args.prometheus):
+        with tracked("compile_deck_shards"):
+            manifest = compile_deck_shards(data_dir, args.out_dir, args.shard_size, args.order, args.seed)
+
+        if args.pick:
+            deck, count = args.pick[0], int(args.pick[1])
+            reader = ShardedDecks(manifest, args.out_dir)
+            if deck not in reader.decks:
+                print(f"❌ 덱을 찾을 수 없습니다: {deck}")
+                return
+            start = random.randrange(reader.entry_count(deck)) if args.order == "shuffle" else 0
+            print(f"\n{deck} (위치 {start}부터):")
+            for entry in reader.pick(deck, count, start):
+                meaning = entry.get("meaning_ko", entry.get("meaning_en", ""))
+                print(f"  {entry.get('word', '?')} - {meaning}")
+            print(f"   샤드 {reader.shards_read}/{reader.shard_count(deck)}개, {reader.bytes_read:,} bytes 읽음")
+
+        if args.benchmark:
+            with tracked("benchmark_pick"):
+                benchmark_pick(manifest, data_dir, args.out_dir, args.count, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
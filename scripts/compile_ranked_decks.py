@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 항목에 word_frequency.json 빈도 순위를 붙이고, 순위순으로 정렬한 덱과 희소 순위 색인을 만드는 스크립트
+
+- build/ranked/{덱}.json: 항목마다 "frequency_rank"(순위가 없으면 null)를 붙이고 순위순으로 정렬한 덱
+  (순위가 없는 항목은 원래 순서대로 맨 뒤, 같은 순위는 원래 순서 유지)
+- build/ranked/rank_index.idx: 정렬된 덱마다 희소 순위 색인 (rank_index.py)
+
+순위는 EN 덱은 word, KO 덱은 meaning_en으로 찾는다 (대소문자 무시).
+조인은 항목마다 사전을 찾지 않고, 덱의 단어 열에서 서로 다른 단어만 한 번씩 순위를 찾은 뒤
+그 결과를 단어 열 전체에 map으로 모아 array 열로 만든다.
+
+사용 예:
+    python scripts/compile_ranked_decks.py
+    python scripts/compile_ranked_decks.py --query 기초다지기 1 200
+    python scripts/compile_ranked_decks.py --query 표현력확장 100 500 --language KO --category 여행 --benchmark
+"""
+
+import argparse
+import json
+from array import array
+from operator import itemgetter
+from pathlib import Path
+
+from atomic_io import WriteTransaction
+from deck_io import (
+    CATEGORIES,
+    LEVELS,
+    deck_files,
+    default_data_dir,
+    iter_deck_entries,
+    load_deck,
+    load_word_frequency,
+    write_bytes_if_changed,
+)
+from metrics import add_counts, add_metrics_arguments, metered, tracked
+from profiling import add_profile_argument, best_time, profiled
+from rank_index import RANK_FIELD, RankIndex, encode_rank_index
+
+INDEX_FILE_NAME = "rank_index.idx"
+
+# 색인 표본 간격 (항목 수) - 조회할 때 범위 앞에서 최대 이만큼의 항목을 더 디코딩한다
+DEFAULT_STRIDE = 32
+
+# 순위가 없는 항목의 정렬 키 (어떤 순위보다도 뒤)
+UNRANKED = 0xFFFFFFFF
+
+
+def default_output_dir():
+    """정렬된 덱 출력 디렉토리 (build/ranked)"""
+    return Path(__file__).parent.parent / "build" / "ranked"
+
+
+def rank_column(entries, language, ranks):
+    """
+    덱 항목들의 빈도 순위 열 (array, 순위가 없으면 UNRANKED)
+
+    단어 열을 뽑고, 서로 다른 단어마다 한 번만 순위를 찾은 뒤, 그 결과를 단어 열에 map으로 모은다.
+    """
+    words = list(map(itemgetter("meaning_en" if language == "KO" else "word"), entries))
+    vocabulary = dict.fromkeys(words)
+    for word in vocabulary:
+        vocabulary[word] = ranks.get(word) or ranks.get(word.lower()) or UNRANKED
+    return array('I', map(vocabulary.__getitem__, words))
+
+
+def encode_ranked_deck(entries):
+    """
+    정렬된 덱을 dump_deck과 같은 형식의 바이트열로 변환
+
+    Returns:
+        tuple: (바이트열, 항목마다 파일 안에서 시작하는 바이트 위치 리스트)
+    """
+    if not entries:
+        return b"[]", []
+    parts = [b"[\n  "]
+    offsets = []
+    position = len(parts[0])
+    separator = b",\n  "
+    for i, entry in enumerate(entries):
+        if i:
+            parts.append(separator)
+            position += len(separator)
+        data = json.dumps(entry, ensure_ascii=False, indent=2).replace('\n', '\n  ').encode('utf-8')
+        offsets.append(position)
+        parts.append(data)
+        position += len(data)
+    parts.append(b"\n]")
+    return b"".join(parts), offsets
+
+
+def rank_deck(deck_file, ranks):
+    """
+    덱 하나에 순위를 붙이고 순위순으로 정렬
+
+    Returns:
+        tuple: (정렬된 항목 리스트, 정렬된 순위 열 array)
+    """
+    entries = load_deck(deck_file)
+    language = deck_file.name.split("_", 1)[0]
+    column = rank_column(entries, language, ranks)
+    order = sorted(range(len(entries)), key=column.__getitem__)
+    ranked = []
+    for position in order:
+        rank = column[position]
+        ranked.append({**entries[position], RANK_FIELD: None if rank == UNRANKED else rank})
+    return ranked, array('I', map(column.__getitem__, order))
+
+
+def compile_ranked_decks(data_dir, output_dir, stride=DEFAULT_STRIDE):
+    """
+    data_dir의 모든 덱을 순위순으로 정렬해서 output_dir에 저장하고 희소 순위 색인을 만듦
+
+    바뀐 파일만 다시 쓰고, 정렬된 덱과 색인은 한 번에 교체한다.
+
+    Returns:
+        bytes: 색인 파일 내용
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    ranks = load_word_frequency(data_dir)
+
+    index = {}
+    total = 0
+    total_ranked = 0
+    with WriteTransaction() as transaction:
+        for deck_file in deck_files(data_dir):
+            with tracked("rank_deck"):
+                ranked, column = rank_deck(deck_file, ranks)
+            ranked_count = len(column) - column.count(UNRANKED)
+            data, offsets = encode_ranked_deck(ranked)
+            add_counts(entries_out=len(ranked))
+            written = write_bytes_if_changed(output_path / deck_file.name, data, transaction)
+            index[deck_file.stem] = {
+                "entry_count": len(ranked),
+                "ranks": column[:ranked_count],
+                "offsets": offsets[:ranked_count],
+            }
+            total += len(ranked)
+            total_ranked += ranked_count
+            status = "✅" if written else "⏭️ "
+            print(f"{status} {deck_file.name}: 순위가 있는 항목 {ranked_count:,}/{len(ranked):,}개")
+
+        index_data = encode_rank_index(index, stride)
+        write_bytes_if_changed(output_path / INDEX_FILE_NAME, index_data, transaction)
+
+    print(f"\n총 {len(index)}개 덱, 순위가 있는 항목 {total_ranked:,}/{total:,}개, "
+          f"색인 {len(index_data):,} bytes (표본 간격 {stride})")
+    return index_data
+
+
+def query_decks(index, level, low, high, language=None, category=None):
+    """정렬된 덱들에서 level의 빈도 순위 low~high 항목들을 (덱 이름, 항목) 리스트로 반환 (색인 이진 탐색)"""
+    results = []
+    for deck in index.decks:
+        deck_language, deck_level, deck_category = deck.split("_", 2)
+        if deck_level != level or (language and deck_language != language) or (category and deck_category != category):
+            continue
+        results.extend((deck, entry) for entry in index.entries_in_rank_range(deck, low, high))
+    return results
+
+
+def scan_decks(data_dir, ranks, level, low, high, language=None, category=None):
+    """원본 덱 전체를 읽고 순위를 찾아서 거르는 방식 (비교용, 결과 순서는 query_decks와 같음)"""
+    results = []
+    for deck_file in deck_files(data_dir):
+        deck_language, deck_level, deck_category = deck_file.stem.split("_", 2)
+        if deck_level != level or (language and deck_language != language) or (category and deck_category != category):
+            continue
+        matches = []
+        for position, entry in enumerate(iter_deck_entries(deck_file)):
+            word = entry.get("meaning_en", entry.get("word", ""))
+            rank = ranks.get(word) or ranks.get(word.lower())
+            if rank and low <= rank <= high:
+                matches.append((rank, position, {**entry, RANK_FIELD: rank}))
+        results.extend((deck_file.stem, entry) for _, _, entry in sorted(matches, key=itemgetter(0, 1)))
+    return results
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="덱에 빈도 순위를 붙여 순위순으로 정렬하고 희소 순위 색인 생성")
+    parser.add_argument("--out-dir", type=Path, default=default_output_dir(), help="정렬된 덱/색인 출력 디렉토리")
+    parser.add_argument("--stride", type=int, default=DEFAULT_STRIDE,
+                        help=f"색인 표본 간격 (기본값: {DEFAULT_STRIDE})")
+    parser.add_argument("--query", nargs=3, metavar=("LEVEL", "MIN", "MAX"),
+                        help="레벨 LEVEL에서 빈도 순위 MIN~MAX인 단어 출력")
+    parser.add_argument("--language", choices=["EN", "KO"], help="--query 언어 제한")
+    parser.add_argument("--category", choices=CATEGORIES, help="--query 카테고리 제한")
+    parser.add_argument("--benchmark", action="store_true", help="--query를 원본 덱 전체 읽기+거르기와 비교")
+    parser.add_argument("--repeat", type=int, default=20, help="벤치마크 반복 횟수 (기본값: 20)")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    if args.stride < 1:
+        parser.error("--stride는 1 이상이어야 합니다")
+    if args.query and args.query[0] not in LEVELS:
+        parser.error(f"LEVEL은 {', '.join(LEVELS)} 중 하나여야 합니다")
+
+    data_dir = default_data_dir()
+    if not data_dir.exists():
+        print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
+        return
+
+    with profiled("compile_ranked_decks", args.profile), \
+            metered("compile_ranked_decks", args.metrics, args.prometheus):
+        with tracked("compile_ranked_decks"):
+            index_data = compile_ranked_decks(data_dir, args.out_dir, args.stride)
+
+        if args.query:
+            level, low, high = args.query[0], int(args.query[1]), int(args.query[2])
+            index = RankIndex(index_data, args.out_dir)
+            with tracked("query_decks"):
+                results = query_decks(index, level, low, high, args.language, args.category)
+            print(f"\n{level} 빈도 순위 {low}~{high}: {len(results)}개")
+            for deck, entry in results:
+                meaning = entry.get("meaning_ko", entry.get("meaning_en", ""))
+                print(f"  {entry[RANK_FIELD]:>6}  {entry['word']} - {meaning}  ({deck})")
+
+            if args.benchmark:
+                ranks = load_word_frequency(data_dir)
+                with tracked("benchmark_query"):
+                    scanned = scan_decks(data_dir, ranks, level, low, high, args.language, args.category)
+                    if scanned != results:
+                        raise ValueError("색인 조회 결과가 전체 읽기 결과와 다릅니다")
+                    index_time = best_time(
+                        lambda: query_decks(index, level, low, high, args.language, args.category), args.repeat)
+                    scan_time = best_time(
+                        lambda: scan_decks(data_dir, ranks, level, low, high, args.language, args.category),
+                        args.repeat)
+                print(f"\n전체 읽기+거르기 {scan_time * 1000:.3f}ms, 색인 조회 {index_time * 1000:.3f}ms "
+                      f"({scan_time / index_time:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
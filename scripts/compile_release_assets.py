@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+배포용 에셋(최소화 JSON + gzip/brotli 압축본)을 만드는 스크립트
+
+assets/data의 덱 JSON은 편집하기 쉽게 indent=2로 저장되어 있어서 공백이 크기의 상당 부분을 차지한다.
+이 스크립트는 원본은 그대로 두고 build/release/assets/data에 파일마다
+- {이름}.json: 공백 없는 최소화 JSON (내용은 원본과 같음)
+- {이름}.json.gz: 최소화 JSON의 gzip 압축본 (레벨 9, 헤더 시각 0으로 고정해서 같은 입력이면 같은 바이트)
+- {이름}.json.br: 최소화 JSON의 brotli 압축본 (brotli 패키지가 설치되어 있을 때만)
+을 만들고, 파일별 크기와 디코딩 시간(원본 / 최소화 / 압축 해제 + 디코딩) 표를 출력한다.
+같은 내용이 build/release/size_report.json에도 저장된다.
+
+항목마다 반복되는 키 이름은 압축본에서 대부분 사라진다.
+
+사용 예:
+    python scripts/compile_release_assets.py
+    python scripts/compile_release_assets.py --repeat 50
+"""
+
+import argparse
+import gzip
+import json
+from pathlib import Path
+
+from atomic_io import WriteTransaction, atomic_write_text
+from deck_io import deck_files, default_data_dir, write_bytes_if_changed
+from metrics import add_metrics_arguments, metered, tracked
+from profiling import add_profile_argument, best_time, profiled
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성 (pip install brotli)
+    brotli = None
+
+REPORT_VERSION = 1
+
+# 덱 외에 함께 배포하는 데이터 파일
+EXTRA_ASSET_FILES = ["core_words.json", "word_frequency.json"]
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# 출력 디렉토리에서 이 스크립트가 만드는 파일 확장자 (이번 실행에서 만들지 않은 파일은 지움)
+OUTPUT_SUFFIXES = (".json", ".json.gz", ".json.br")
+
+
+def default_output_dir():
+    """배포용 에셋 출력 디렉토리 (build/release)"""
+    return Path(__file__).parent.parent / "build" / "release"
+
+
+def release_asset_files(data_dir):
+    """배포할 원본 파일들 (덱 + core_words.json, word_frequency.json 중 있는 것)"""
+    data_path = Path(data_dir)
+    extras = [data_path / name for name in EXTRA_ASSET_FILES if (data_path / name).exists()]
+    return deck_files(data_path) + extras
+
+
+def minify_json(source):
+    """원본 JSON 바이트열을 공백 없는 JSON 바이트열로 (한글은 그대로 UTF-8)"""
+    data = json.loads(source)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def compress_variants(minified):
+    """최소화 JSON의 압축본들 (확장자 -> 바이트열)"""
+    variants = {".gz": gzip.compress(minified, compresslevel=GZIP_LEVEL, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(minified, quality=BROTLI_QUALITY)
+    return variants
+
+
+def _decompress(suffix, data):
+    if suffix == ".gz":
+        return gzip.decompress(data)
+    return brotli.decompress(data)
+
+
+def measure_file(source, minified, variants, repeat):
+    """
+    파일 하나의 크기와 디코딩 시간 (바이트열 -> 파이썬 객체, 파일 읽기 시간은 제외)
+
+    압축본은 압축 해제 + 디코딩 시간을 잰다. 모든 변형이 원본과 같은 내용인지도 확인한다.
+    """
+    expected = json.loads(source)
+    if json.loads(minified) != expected:
+        raise ValueError("최소화 JSON 내용이 원본과 다릅니다")
+    sizes = {"source": len(source), "minified": len(minified)}
+    decode = {
+        "source": best_time(lambda: json.loads(source.decode('utf-8')), repeat),
+        "minified": best_time(lambda: json.loads(minified.decode('utf-8')), repeat),
+    }
+    for suffix, data in variants.items():
+        if _decompress(suffix, data) != minified:
+            raise ValueError(f"{suffix} 압축본을 풀면 최소화 JSON과 다릅니다")
+        name = suffix.lstrip(".")
+        sizes[name] = len(data)
+        decode[name] = best_time(lambda: json.loads(_decompress(suffix, data).decode('utf-8')), repeat)
+    return sizes, decode
+
+
+def compile_release_assets(data_dir, output_dir, repeat=10):
+    """
+    원본 파일마다 최소화 JSON과 압축본을 output_dir/assets/data에 만들고 크기/디코딩 시간을 잼
+
+    바뀐 파일만 한 번에 교체하고, 원본이 없어진 이전 출력 파일은 같은 트랜잭션에서 지운다.
+
+    Returns:
+        list: 파일별 {"file", "sizes", "decode_seconds"} 리스트
+    """
+    asset_dir = Path(output_dir) / "assets" / "data"
+    asset_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    produced = set()
+    written = 0
+    with WriteTransaction() as transaction:
+        for source_file in release_asset_files(data_dir):
+            source = source_file.read_bytes()
+            with tracked("minify"):
+                minified = minify_json(source)
+            with tracked("compress"):
+                variants = compress_variants(minified)
+
+            outputs = {asset_dir / source_file.name: minified}
+            for suffix, data in variants.items():
+                outputs[asset_dir / (source_file.name + suffix)] = data
+            for path, data in outputs.items():
+                written += write_bytes_if_changed(path, data, transaction)
+                produced.add(path)
+
+            with tracked("measure"):
+                sizes, decode = measure_file(source, minified, variants, repeat)
+            results.append({"file": source_file.name, "sizes": sizes, "decode_seconds": decode})
+
+        # 원본이 없어진 이전 출력 파일은 새 파일과 같은 트랜잭션에서 지움
+        stale = [
+            path for path in sorted(asset_dir.iterdir())
+            if path.name.endswith(OUTPUT_SUFFIXES) and path not in produced
+        ]
+        for path in stale:
+            transaction.remove(path)
+
+    print(f"✅ {asset_dir}: 파일 {len(produced)}개 중 {written}개 갱신" +
+          (f", 이전 파일 {len(stale)}개 삭제" if stale else ""))
+    if brotli is None:
+        print("⚠️  brotli 패키지가 없어서 .br 압축본은 만들지 않았습니다 (pip install brotli)")
+    return results
+
+
+def _kb(size):
+    return f"{size / 1024:,.1f}"
+
+
+def format_size_table(results):
+    """파일별 크기(KB, 원본 대비 비율)와 디코딩 시간(ms) 표"""
+    variants = [name for name in ("gz", "br") if any(name in result["sizes"] for result in results)]
+    size_columns = ["source", "minified", *variants]
+    headers = {"source": "원본", "minified": "최소화", "gz": "gzip", "br": "brotli"}
+
+    lines = [f"{'파일':<30} " + " ".join(f"{headers[column] + '(KB)':>16}" for column in size_columns) +
+             "   " + " ".join(f"{headers[column] + '(ms)':>11}" for column in size_columns)]
+    lines.append("-" * len(lines[0]))
+    totals = dict.fromkeys(size_columns, 0)
+    decode_totals = dict.fromkeys(size_columns, 0.0)
+    for result in results:
+        sizes = result["sizes"]
+        decode = result["decode_seconds"]
+        cells = []
+        for column in size_columns:
+            totals[column] += sizes[column]
+            decode_totals[column] += decode[column]
+            ratio = sizes[column] / sizes["source"] if sizes["source"] else 0
+            cells.append(f"{_kb(sizes[column])} ({ratio:>4.0%})" if column != "source" else _kb(sizes[column]))
+        lines.append(f"{result['file']:<30} " + " ".join(f"{cell:>16}" for cell in cells) + "   " +
+                     " ".join(f"{decode[column] * 1000:>11.3f}" for column in size_columns))
+    lines.append("-" * len(lines[0]))
+    cells = [
+        f"{_kb(totals[column])} ({totals[column] / totals['source']:>4.0%})" if column != "source"
+        else _kb(totals[column])
+        for column in size_columns
+    ] if totals["source"] else ["0"] * len(size_columns)
+    lines.append(f"{'합계':<30} " + " ".join(f"{cell:>16}" for cell in cells) + "   " +
+                 " ".join(f"{decode_totals[column] * 1000:>11.3f}" for column in size_columns))
+    return "\n".join(lines)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="배포용 최소화 JSON과 gzip/brotli 압축본 생성, 크기/디코딩 시간 비교")
+    parser.add_argument("--out-dir", type=Path, default=default_output_dir(), help="배포용 에셋 출력 디렉토리")
+    parser.add_argument("--repeat", type=int, default=10, help="디코딩 시간 측정 반복 횟수 (기본값: 10)")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    data_dir = default_data_dir()
+    if not data_dir.exists():
+        print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
+        return
+
+    with profiled("compile_release_assets", args.profile), \
+            metered("compile_release_assets", args.metrics, args.prometheus):
+        results = compile_release_assets(data_dir, args.out_dir, max(args.repeat, 1))
+
+    print("\n" + format_size_table(results))
+    report = {"version": REPORT_VERSION, "brotli": brotli is not None, "files": results}
+    report_file = Path(args.out_dir) / "size_report.json"
+    atomic_write_text(report_file, json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"\n📊 크기 보고서 저장: {report_file}")
+
+
+if __name__ == "__main__":
+    main()
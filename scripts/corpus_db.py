@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+모든 덱과 word_frequency.json, core_words.json을 하나의 SQLite 파일로 만들고 조회하는 스크립트
+
+사용 예:
+    python scripts/corpus_db.py build
+    python scripts/corpus_db.py search "airport"
+    python scripts/corpus_db.py search "check-in"
+    python scripts/corpus_db.py search --raw "book* OR example: meeting"
+    python scripts/corpus_db.py find --language EN --level 기초다지기 --category 여행 --pos noun
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+from atomic_io import replace_file
+from build_cache import file_hash, inputs_key, is_up_to_date, load_cache, record_step, save_cache
+from compile_ranked_decks import UNRANKED, rank_column
+from deck_io import deck_files, default_data_dir, iter_deck_entries, load_word_frequency
+from metrics import add_metrics_arguments, metered
+from profiling import add_profile_argument, profiled
+
+SCHEMA = """
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    entry_id TEXT,
+    deck TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    level TEXT,
+    category TEXT,
+    pos TEXT,
+    word TEXT NOT NULL,
+    meaning_ko TEXT,
+    meaning_en TEXT,
+    example TEXT,
+    frequency_rank INTEGER
+);
+CREATE INDEX entries_lookup ON entries (language, level, category, pos);
+CREATE INDEX entries_word ON entries (word);
+CREATE INDEX entries_entry_id ON entries (entry_id);
+CREATE INDEX entries_rank ON entries (language, frequency_rank);
+
+CREATE TABLE word_frequency (
+    word TEXT PRIMARY KEY,
+    rank INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE core_words (
+    language TEXT NOT NULL,
+    category TEXT NOT NULL,
+    level TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    word TEXT NOT NULL,
+    PRIMARY KEY (language, category, level, position)
+) WITHOUT ROWID;
+CREATE INDEX core_words_word ON core_words (word);
+
+CREATE VIRTUAL TABLE entries_fts USING fts5 (
+    word, meaning_ko, meaning_en, example,
+    content='entries', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+-- 한국어는 조사/어미가 붙어 띄어쓰기 단위로는 찾을 수 없으므로 ("공항에", "공항까지") 3글자 조각으로 색인
+CREATE VIRTUAL TABLE entries_ko_fts USING fts5 (
+    word, meaning_ko, example,
+    content='entries', content_rowid='id',
+    tokenize='trigram'
+);
+"""
+
+# 한글 음절/자모 (검색어에 있으면 한국어 검색)
+HANGUL_PATTERN = re.compile(r'[\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3]')
+
+ENTRY_COLUMNS = ("entry_id", "deck", "position", "language", "level", "category", "pos",
+                 "word", "meaning_ko", "meaning_en", "example", "frequency_rank")
+
+
+def default_db_file():
+    """SQLite 코퍼스 파일 경로 (build/corpus.sqlite)"""
+    return Path(__file__).parent.parent / "build" / "corpus.sqlite"
+
+
+def _iter_core_words(core_words):
+    """core_words.json을 (언어, 카테고리, 레벨, 순서, 단어) 행으로 펼침"""
+    for category, levels in core_words.items():
+        if category == "korean":
+            for korean_category, korean_levels in levels.items():
+                for level, words in korean_levels.items():
+                    for position, word in enumerate(words):
+                        yield ("KO", korean_category, level, position, word)
+        else:
+            for level, words in levels.items():
+                for position, word in enumerate(words):
+                    yield ("EN", category, level, position, word)
+
+
+def build_corpus_db(data_dir, db_file):
+    """
+    덱들과 빈도/핵심 단어 목록을 SQLite 파일로 저장
+
+    임시 파일에 만든 뒤 교체하므로, 빌드 도중에는 기존 파일을 그대로 조회할 수 있다.
+
+    Returns:
+        int: 저장한 덱 항목 수
+    """
+    data_path = Path(data_dir)
+    db_path = Path(db_file)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = db_path.with_name(db_path.name + ".tmp")
+    if temp_path.exists():
+        temp_path.unlink()
+
+    word_frequency = load_word_frequency(data_path)
+    with open(data_path / "core_words.json", 'r', encoding='utf-8') as f:
+        core_words = json.load(f)
+
+    conn = sqlite3.connect(temp_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.executemany("INSERT INTO word_frequency VALUES (?, ?)", word_frequency.items())
+        conn.executemany("INSERT INTO core_words VALUES (?, ?, ?, ?, ?)", _iter_core_words(core_words))
+
+        total = 0
+        for deck_file in deck_files(data_path):
+            language = deck_file.name.split("_", 1)[0]
+            entries = list(iter_deck_entries(deck_file))
+            # 순위는 compile_ranked_decks.py와 같은 키로 찾는다 (EN은 word, KO는 meaning_en, 대소문자 무시)
+            ranks = rank_column(entries, language, word_frequency)
+            rows = (
+                (
+                    entry.get("id"), deck_file.name, position, language,
+                    entry.get("level"), entry.get("category"), entry.get("pos"),
+                    entry["word"], entry.get("meaning_ko"), entry.get("meaning_en"), entry.get("example"),
+                    None if rank == UNRANKED else rank,
+                )
+                for position, (entry, rank) in enumerate(zip(entries, ranks))
+            )
+            cursor = conn.executemany(
+                f"INSERT INTO entries ({', '.join(ENTRY_COLUMNS)}) VALUES ({', '.join('?' * len(ENTRY_COLUMNS))})",
+                rows,
+            )
+            total += cursor.rowcount
+            print(f"  {deck_file.name}: {cursor.rowcount}개 항목")
+
+        conn.execute("INSERT INTO entries_fts (entries_fts) VALUES ('rebuild')")
+        conn.execute("INSERT INTO entries_fts (entries_fts) VALUES ('optimize')")
+        conn.execute("INSERT INTO entries_ko_fts (entries_ko_fts) VALUES ('rebuild')")
+        conn.execute("INSERT INTO entries_ko_fts (entries_ko_fts) VALUES ('optimize')")
+        conn.commit()
+        conn.execute("ANALYZE")
+        conn.execute("VACUUM")
+    except BaseException:
+        conn.close()
+        temp_path.unlink()
+        raise
+    conn.close()
+
+    replace_file(temp_path, db_path)
+    return total
+
+
+def connect(db_file=None):
+    """코퍼스 SQLite 파일에 읽기 전용으로 연결 (행은 sqlite3.Row)"""
+    db_path = Path(db_file or default_db_file())
+    if not db_path.exists():
+        raise FileNotFoundError(f"코퍼스 DB가 없습니다. 먼저 build를 실행하세요: {db_path}")
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def find_entries(conn, language=None, level=None, category=None, pos=None, limit=None):
+    """
+    언어/레벨/카테고리/품사 조건에 맞는 항목들을 덱 순서대로 반환 (entries_lookup 인덱스 사용)
+    """
+    conditions = []
+    params = []
+    for column, value in (("language", language), ("level", level), ("category", category), ("pos", pos)):
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+
+    sql = "SELECT * FROM entries"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY deck, position"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return [dict(row) for row in conn.execute(sql, params)]
+
+
+def lookup_entry(conn, entry_id):
+    """항목 ID로 EN/KO 항목들을 반환"""
+    return [dict(row) for row in conn.execute("SELECT * FROM entries WHERE entry_id = ? ORDER BY deck", (entry_id,))]
+
+
+def lookup_word(conn, word, language=None):
+    """word가 정확히 일치하는 항목들을 반환"""
+    sql = "SELECT * FROM entries WHERE word = ?"
+    params = [word]
+    if language is not None:
+        sql += " AND language = ?"
+        params.append(language)
+    return [dict(row) for row in conn.execute(sql + " ORDER BY deck, position", params)]
+
+
+def fts_phrase(text):
+    """text를 FTS5 구문 하나로 감쌈 (따옴표, -, ., ' 등이 FTS5 문법으로 해석되지 않도록)"""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def search(conn, query, language=None, limit=20, raw=False):
+    """
+    word, meaning_ko, meaning_en, example 전체 텍스트 검색 (관련도 순)
+
+    query는 구문 하나로 찾는다 ("check-in", "don't", "U.S."도 그대로 검색).
+    raw이면 query를 FTS5 문법 그대로 쓴다 (예: "book*", "example: meeting", "airport OR station").
+    한글이 들어 있으면 word, meaning_ko, example에서 부분 문자열로 찾는다 ("공항"은 "공항에", "공항까지"도 찾음).
+    """
+    if HANGUL_PATTERN.search(query) and not raw:
+        return search_korean(conn, query, language, limit)
+    sql = (
+        "SELECT entries.*, bm25(entries_fts) AS score FROM entries_fts "
+        "JOIN entries ON entries.id = entries_fts.rowid "
+        "WHERE entries_fts MATCH ?"
+    )
+    params = [query if raw else fts_phrase(query)]
+    if language is not None:
+        sql += " AND entries.language = ?"
+        params.append(language)
+    sql += " ORDER BY score LIMIT ?"
+    params.append(limit)
+    return [dict(row) for row in conn.execute(sql, params)]
+
+
+def search_korean(conn, text, language=None, limit=20):
+    """
+    word, meaning_ko, example에 text가 부분 문자열로 들어 있는 항목들을 반환 (trigram 색인 사용)
+
+    3글자 이상은 trigram MATCH로 찾아 관련도 순으로, 더 짧으면 trigram 색인을 쓸 수 없으므로
+    LIKE로 찾아 덱 순서대로 반환한다.
+    """
+    text = " ".join(text.split())
+    if len(text) >= 3:
+        sql = (
+            "SELECT entries.*, bm25(entries_ko_fts) AS score FROM entries_ko_fts "
+            "JOIN entries ON entries.id = entries_ko_fts.rowid "
+            "WHERE entries_ko_fts MATCH ?"
+        )
+        params = [fts_phrase(text)]
+        order = "score"
+    else:
+        pattern = "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        sql = (
+            "SELECT entries.* FROM entries WHERE (word LIKE ? ESCAPE '\\' OR meaning_ko LIKE ? ESCAPE '\\' "
+            "OR example LIKE ? ESCAPE '\\')"
+        )
+        params = [pattern, pattern, pattern]
+        order = "deck, position"
+    if language is not None:
+        sql += " AND entries.language = ?"
+        params.append(language)
+    sql += f" ORDER BY {order} LIMIT ?"
+    params.append(limit)
+    return [dict(row) for row in conn.execute(sql, params)]
+
+
+def frequency_rank(conn, word):
+    """word_frequency.json 기준 빈도 순위 (없으면 None)"""
+    row = conn.execute("SELECT rank FROM word_frequency WHERE word = ?", (word,)).fetchone()
+    return row["rank"] if row else None
+
+
+def _print_entries(entries):
+    for entry in entries:
+        meaning = entry["meaning_ko"] or entry["meaning_en"] or ""
+        print(f"[{entry['deck']}#{entry['position']}] {entry['word']} ({entry['pos']}) - {meaning}")
+        if entry["example"]:
+            print(f"    {entry['example']}")
+    print(f"\n총 {len(entries)}개 항목")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="SQLite 코퍼스 빌드 및 조회")
+    parser.add_argument("--db", type=Path, default=default_db_file(), help="코퍼스 SQLite 파일 경로")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="덱들로 코퍼스 DB 생성")
+    build_parser.add_argument("--no-cache", action="store_true", help="입력이 바뀌지 않았어도 다시 생성")
+
+    search_parser = subparsers.add_parser("search", help="전체 텍스트 검색")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--language", choices=["EN", "KO"])
+    search_parser.add_argument("--limit", type=int, default=20)
+    search_parser.add_argument("--raw", action="store_true", help="검색어를 FTS5 문법 그대로 사용 (예: book*, airport OR station)")
+
+    find_parser = subparsers.add_parser("find", help="언어/레벨/카테고리/품사로 조회")
+    find_parser.add_argument("--language", choices=["EN", "KO"])
+    find_parser.add_argument("--level")
+    find_parser.add_argument("--category")
+    find_parser.add_argument("--pos")
+    find_parser.add_argument("--limit", type=int)
+
+    args = parser.parse_args()
+
+    with profiled("corpus_db", args.profile), metered("corpus_db", args.metrics, args.prometheus):
+        if args.command == "build":
+            data_dir = default_data_dir()
+            inputs = [*deck_files(data_dir), data_dir / "word_frequency.json", data_dir / "core_words.json"]
+
+            cache = None if args.no_cache else load_cache()
+            key = None
+            if cache is not None:
+                key = inputs_key({path.name: file_hash(path, cache) for path in inputs} | {"schema": SCHEMA})
+                if is_up_to_date(cache, "corpus_db", key, [args.db]):
+                    save_cache(cache)
+                    print(f"변경된 입력이 없습니다. 코퍼스 DB가 최신 상태입니다: {args.db}")
+                    return
+
+            print(f"코퍼스 DB 생성 중: {args.db}")
+            total = build_corpus_db(data_dir, args.db)
+            if cache is not None:
+                record_step(cache, "corpus_db", key, [args.db])
+                save_cache(cache)
+            print(f"✅ 완료: {total}개 항목")
+            return
+
+        conn = connect(args.db)
+        try:
+            if args.command == "search":
+                try:
+                    entries = search(conn, args.query, args.language, args.limit, args.raw)
+                except sqlite3.OperationalError as e:
+                    print(f"❌ 검색어를 FTS5 문법으로 해석할 수 없습니다: {e}")
+                    sys.exit(1)
+                _print_entries(entries)
+            else:
+                _print_entries(find_entries(conn, args.language, args.level, args.category, args.pos, args.limit))
+        finally:
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+미리 계산한 오늘의 단어 일정 파일 형식 (.vds) 인코더와 참조 리더
+
+덱(언어_레벨_카테고리)마다 날짜별로 보여 줄 항목 위치를 고정 길이 레코드로 저장하므로,
+앱은 덱을 읽고 섞지 않고도 (덱, 날짜) -> 항목 위치를 바로 찾을 수 있다.
+
+파일 구조 (리틀 엔디언):
+1. 헤더: magic "VDS1", 버전, 하루 단어 수, 위치 크기(2 또는 4바이트), 덱 수,
+   일정 기준일, 저장된 첫날, 저장된 일수, 시드 (날짜는 1970-01-01부터의 일수)
+2. 덱 테이블: 덱마다 (이름 오프셋 u32, 이름 길이 u32, 항목 수 u32, ID 테이블 위치 u32, 일정 위치 u32,
+   덱 파일 sha256 앞 8바이트) - 이름순으로 정렬
+3. 이름 blob: 덱 이름(파일명에서 .json을 뺀 것)의 UTF-8 바이트
+4. 덱마다 ID 테이블: 항목 순서대로 항목 ID 6바이트 (ID가 없으면 0)
+5. 덱마다 일정: 저장된 날마다 하루 단어 수만큼의 항목 위치
+   -> d번째 날은 일정 위치 + d * 하루 단어 수 * 위치 크기에서 바로 읽을 수 있다.
+
+덱 항목 수가 하루 단어 수보다 적은 날은 남는 칸을 MISSING으로 채운다.
+덱 파일 해시로 일정이 지금 덱 파일로 만든 것인지 확인할 수 있다.
+"""
+
+import struct
+from datetime import date
+
+from entry_ids import ID_LENGTH
+
+MAGIC = b"VDS1"
+VERSION = 1
+
+UNIX_EPOCH = date(1970, 1, 1)
+
+# magic, version, words_per_day, position_size, deck_count, epoch_day, first_day, day_count, seed
+HEADER = struct.Struct("<4sHHH2xIIIII")
+# name_offset, name_length, entry_count, ids_offset, schedule_offset, deck_hash
+DECK = struct.Struct("<IIIII8s")
+
+ID_SIZE = ID_LENGTH // 2
+NO_ID = bytes(ID_SIZE)
+
+POSITION_FORMATS = {2: "H", 4: "I"}
+
+
+def day_number(day):
+    """date를 1970-01-01부터의 일수로"""
+    return day.toordinal() - UNIX_EPOCH.toordinal()
+
+
+def day_date(number):
+    """1970-01-01부터의 일수를 date로"""
+    return date.fromordinal(UNIX_EPOCH.toordinal() + number)
+
+
+def encode_schedules(decks, words_per_day, epoch_day, first_day, seed):
+    """
+    덱별 일정을 일정 파일 바이트열로 변환
+
+    Args:
+        decks (dict): 덱 이름 -> {"ids": 항목 ID 리스트 (항목 순서), "hash": 덱 파일 sha256 hex,
+                      "days": 날마다 항목 위치 리스트의 리스트 (first_day부터)}
+        words_per_day (int): 하루 단어 수
+        epoch_day, first_day (int): 일정 기준일, 저장된 첫날 (1970-01-01부터의 일수)
+        seed (int): 일정을 만든 시드 (기록용)
+    """
+    names = sorted(decks)
+    day_counts = {len(decks[name]["days"]) for name in names}
+    if len(day_counts) > 1:
+        raise ValueError(f"덱마다 저장된 일수가 다릅니다: {sorted(day_counts)}")
+    day_count = day_counts.pop() if day_counts else 0
+
+    largest = max((len(decks[name]["ids"]) for name in names), default=0)
+    position_size = 2 if largest < 0xFFFF else 4
+    missing = (1 << (position_size * 8)) - 1
+    record = struct.Struct("<" + POSITION_FORMATS[position_size] * words_per_day)
+
+    name_blob = bytearray()
+    name_spans = []
+    for name in names:
+        encoded_name = name.encode('utf-8')
+        name_spans.append((len(name_blob), len(encoded_name)))
+        name_blob += encoded_name
+
+    data_offset = HEADER.size + DECK.size * len(names) + len(name_blob)
+    deck_table = bytearray()
+    sections = bytearray()
+    for name, (name_offset, name_length) in zip(names, name_spans):
+        deck = decks[name]
+        ids_offset = data_offset + len(sections)
+        for entry_id in deck["ids"]:
+            sections += bytes.fromhex(entry_id) if entry_id else NO_ID
+        schedule_offset = data_offset + len(sections)
+        for positions in deck["days"]:
+            if len(positions) > words_per_day:
+                raise ValueError(f"하루 단어 수({words_per_day})보다 많은 항목이 있습니다: {positions}")
+            sections += record.pack(*positions, *[missing] * (words_per_day - len(positions)))
+        deck_hash = bytes.fromhex(deck["hash"])[:8] if deck.get("hash") else bytes(8)
+        deck_table += DECK.pack(name_offset, name_length, len(deck["ids"]), ids_offset, schedule_offset, deck_hash)
+
+    header = HEADER.pack(MAGIC, VERSION, words_per_day, position_size, len(names),
+                         epoch_day, first_day, day_count, seed)
+    return b"".join((header, deck_table, name_blob, sections))
+
+
+class DailySchedule:
+    """
+    일정 파일 참조 리더
+
+    생성 시에는 헤더와 덱 테이블만 해석하고, 날짜별 항목은 조회할 때 레코드 하나만 읽는다 (O(1)).
+    """
+
+    def __init__(self, data):
+        buffer = memoryview(data)
+        (
+            magic, version, words_per_day, position_size, deck_count,
+            epoch_day, first_day, day_count, seed,
+        ) = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"일정 파일 형식이 아닙니다 (magic: {bytes(magic)!r})")
+        if version != VERSION:
+            raise ValueError(f"지원하지 않는 일정 파일 버전입니다: {version}")
+        if position_size not in POSITION_FORMATS:
+            raise ValueError(f"지원하지 않는 위치 크기입니다: {position_size}")
+
+        self.words_per_day = words_per_day
+        self.epoch_day = epoch_day
+        self.first_day = first_day
+        self.day_count = day_count
+        self.seed = seed
+        self._buffer = buffer
+        self._record = struct.Struct("<" + POSITION_FORMATS[position_size] * words_per_day)
+        self._missing = (1 << (position_size * 8)) - 1
+
+        # 덱 이름 -> (항목 수, ID 테이블 위치, 일정 위치, 덱 해시)
+        self._decks = {}
+        for i in range(deck_count):
+            name_offset, name_length, entry_count, ids_offset, schedule_offset, deck_hash = \
+                DECK.unpack_from(buffer, HEADER.size + i * DECK.size)
+            start = HEADER.size + deck_count * DECK.size + name_offset
+            name = str(buffer[start:start + name_length], 'utf-8')
+            self._decks[name] = (entry_count, ids_offset, schedule_offset, deck_hash.hex())
+
+    @property
+    def decks(self):
+        """저장된 덱 이름 리스트 (이름순)"""
+        return list(self._decks)
+
+    @property
+    def first_date(self):
+        return day_date(self.first_day)
+
+    @property
+    def last_date(self):
+        return day_date(self.first_day + self.day_count - 1)
+
+    def deck_hash(self, deck):
+        """일정을 만든 덱 파일 sha256의 앞 16자리 (hex)"""
+        return self._decks[deck][3]
+
+    def positions(self, deck, day):
+        """
+        deck의 day번째 날(저장된 첫날이 0) 항목 위치 리스트
+
+        Raises:
+            KeyError: 없는 덱
+            IndexError: 저장된 기간 밖의 날
+        """
+        schedule_offset = self._decks[deck][2]
+        if not 0 <= day < self.day_count:
+            raise IndexError(f"저장된 일정 기간 밖의 날입니다: {day} (0 ~ {self.day_count - 1})")
+        values = self._record.unpack_from(self._buffer, schedule_offset + day * self._record.size)
+        return [position for position in values if position != self._missing]
+
+    def positions_for_date(self, deck, when):
+        """deck의 when(date) 항목 위치 리스트"""
+        return self.positions(deck, day_number(when) - self.first_day)
+
+    def entry_id(self, deck, position):
+        """deck의 position번째 항목 ID (ID가 없으면 None)"""
+        entry_count, ids_offset, _, _ = self._decks[deck]
+        if not 0 <= position < entry_count:
+            raise IndexError(f"덱 항목 위치가 범위를 벗어났습니다: {position}")
+        start = ids_offset + position * ID_SIZE
+        raw = bytes(self._buffer[start:start + ID_SIZE])
+        return None if raw == NO_ID else raw.hex()
+
+    def entry_ids_for_date(self, deck, when):
+        """deck의 when(date) 항목 ID 리스트"""
+        return [self.entry_id(deck, position) for position in self.positions_for_date(deck, when)]
+
+
+def read_daily_schedule(path):
+    """일정 파일을 읽어서 DailySchedule로 반환"""
+    with open(path, 'rb') as f:
+        return DailySchedule(f.read())
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+두 코퍼스 버전 사이의 항목 단위 델타를 만들고 적용하는 스크립트
+
+덱 항목을 안정적인 ID("id" 필드, entry_ids.py)로 짝지어서 바뀐 것만 기록한다.
+- delete: 없어진 항목 ID
+- update: ID별로 바뀐 필드 값(set), 없어진 필드(unset), 필드 순서가 달라졌을 때만 전체 필드 순서(keys)
+- insert: 새 항목과 새 덱에서의 위치
+- order: 남은 항목들의 순서가 바뀌었을 때만 새 덱의 전체 ID 순서
+덱이 새로 생기거나 없어지면 덱 전체(entries) 또는 removed로 기록한다.
+
+델타에는 덱마다 기준 파일과 결과 파일의 sha256이 들어 있어서, 적용할 때 기준 덱이 다르면 거부하고
+적용 결과가 결과 파일과 바이트 단위로 같은지 확인한 뒤에만 (모든 덱을 한 트랜잭션으로) 저장한다.
+델타 파일은 공백 없는 JSON을 gzip으로 압축한 것이다.
+
+코퍼스는 덱 디렉토리 경로 또는 스냅샷 저장소의 실행("snapshot:<실행 ID>", 실행 전 상태는
+"snapshot:<실행 ID>:before")으로 지정한다. 실행은 그 실행이 기록한 덱만 담고 있으므로 (예: swap_en_ko_files는
+KO 덱만 기록), 스냅샷과 비교할 때는 스냅샷에 기록된 덱만 비교한다.
+
+사용 예:
+    python scripts/deck_delta.py diff snapshot:latest:before assets/data -o build/deltas/latest.delta.json.gz
+    python scripts/deck_delta.py apply build/deltas/latest.delta.json.gz --data-dir /tmp/old_decks
+    python scripts/deck_delta.py verify snapshot:latest:before assets/data
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+from asset_manifest import deck_transaction
+from atomic_io import atomic_write_bytes
+from build_cache import bytes_hash
+from deck_io import deck_files, default_data_dir, dump_deck, write_bytes_if_changed
+from metrics import add_counts, add_metrics_arguments, metered, tracked
+from profiling import add_profile_argument, profiled
+from snapshot_store import find_run, load_object, snapshot_run
+
+DELTA_VERSION = 1
+SNAPSHOT_PREFIX = "snapshot:"
+
+_MISSING = object()
+
+
+def _is_deck_name(name):
+    return name.startswith(("EN_", "KO_")) and name.endswith(".json")
+
+
+def load_corpus(spec):
+    """
+    코퍼스 지정 문자열을 {덱 파일명: 파일 내용 바이트열}로 읽음
+
+    spec은 덱 디렉토리 경로 또는 "snapshot:<실행 ID>[:before]" (실행 ID는 앞부분이나 latest도 됨)
+
+    Returns:
+        tuple: (코퍼스, 비교할 수 있는 덱 파일명 집합 - 스냅샷이면 그 실행이 실행 전/후에 기록한 덱, 디렉토리면 None)
+    """
+    if spec.startswith(SNAPSHOT_PREFIX):
+        run_id, _, state = spec[len(SNAPSHOT_PREFIX):].partition(":")
+        if state not in ("", "before", "after"):
+            raise ValueError(f"스냅샷 상태는 before 또는 after여야 합니다: {state}")
+        manifest = find_run(run_id)
+        files = manifest["before" if state == "before" else "after"]
+        recorded = {Path(name).name for name in (*manifest["before"], *manifest["after"])}
+        corpus = {
+            Path(name).name: load_object(digest)
+            for name, digest in sorted(files.items()) if _is_deck_name(Path(name).name)
+        }
+        return corpus, {name for name in recorded if _is_deck_name(name)}
+    data_path = Path(spec)
+    if not data_path.is_dir():
+        raise ValueError(f"덱 디렉토리를 찾을 수 없습니다: {spec}")
+    return {path.name: path.read_bytes() for path in deck_files(data_path)}, None
+
+
+def limit_corpora(base, target, base_recorded, target_recorded):
+    """
+    스냅샷이 기록한 덱만 남긴 (기준 코퍼스, 결과 코퍼스)
+
+    스냅샷에 없는 덱은 그 실행이 기록하지 않은 덱이므로 추가/삭제된 덱으로 보지 않는다.
+    양쪽이 모두 스냅샷이면 둘 다 기록한 덱만 비교한다.
+    """
+    scopes = [recorded for recorded in (base_recorded, target_recorded) if recorded is not None]
+    if not scopes:
+        return base, target
+    scope = set.intersection(*scopes)
+    skipped = (set(base) | set(target)) - scope
+    if skipped:
+        print(f"⏭️  스냅샷에 기록되지 않은 덱 {len(skipped)}개는 비교하지 않음")
+    return ({name: data for name, data in base.items() if name in scope},
+            {name: data for name, data in target.items() if name in scope})
+
+
+def _index_by_id(entries, name):
+    """항목 리스트를 {ID: 항목}으로 (ID가 없거나 겹치면 ValueError)"""
+    index = {}
+    for position, entry in enumerate(entries):
+        entry_id = entry.get("id")
+        if not entry_id:
+            raise ValueError(f"{name}[{position}]: ID가 없는 항목이 있습니다 (entry_ids.py로 먼저 ID를 부여하세요)")
+        if entry_id in index:
+            raise ValueError(f"{name}[{position}]: ID가 겹칩니다: {entry_id}")
+        index[entry_id] = entry
+    return index
+
+
+def diff_entry(base, target):
+    """
+    같은 ID 항목의 필드 단위 변경 (바뀐 것이 없으면 None)
+
+    Returns:
+        dict: {"set": {필드: 새 값}, "unset": [없어진 필드], "keys": [필드 순서 - 순서가 달라졌을 때만]}
+    """
+    if base == target and list(base) == list(target):
+        return None
+    change = {}
+    changed_fields = {field: value for field, value in target.items() if base.get(field, _MISSING) != value}
+    if changed_fields:
+        change["set"] = changed_fields
+    removed_fields = [field for field in base if field not in target]
+    if removed_fields:
+        change["unset"] = removed_fields
+    applied_order = [field for field in base if field in target] + \
+        [field for field in target if field not in base]
+    if applied_order != list(target):
+        change["keys"] = list(target)
+    return change
+
+
+def diff_deck(base_entries, target_entries, name):
+    """
+    한 덱의 두 버전 사이의 항목 단위 변경
+
+    ID를 키로 하는 사전으로 짝지으므로 항목 수에 비례하는 시간에 끝난다.
+
+    Returns:
+        dict: {"delete": [...], "update": {...}, "insert": [[위치, 항목], ...], "order": [...]} 중 내용이 있는 것만
+    """
+    base_index = _index_by_id(base_entries, name)
+    target_index = _index_by_id(target_entries, name)
+
+    delta = {}
+    deleted = [entry_id for entry_id in base_index if entry_id not in target_index]
+    if deleted:
+        delta["delete"] = deleted
+
+    updates = {}
+    inserts = []
+    for position, (entry_id, target) in enumerate(target_index.items()):
+        base = base_index.get(entry_id)
+        if base is None:
+            inserts.append([position, target])
+            continue
+        change = diff_entry(base, target)
+        if change:
+            updates[entry_id] = change
+    if updates:
+        delta["update"] = updates
+    if inserts:
+        delta["insert"] = inserts
+
+    kept_base = [entry_id for entry_id in base_index if entry_id in target_index]
+    kept_target = [entry_id for entry_id in target_index if entry_id in base_index]
+    if kept_base != kept_target:
+        delta["order"] = list(target_index)
+    return delta
+
+
+def diff_corpora(base, target):
+    """
+    두 코퍼스({덱 파일명: 바이트열}) 사이의 델타
+
+    내용이 같은 덱은 디코딩하지 않고 건너뛴다.
+    """
+    decks = {}
+    for name in sorted(set(base) | set(target)):
+        base_data = base.get(name)
+        target_data = target.get(name)
+        if base_data == target_data:
+            continue
+        if target_data is None:
+            decks[name] = {"base": bytes_hash(base_data), "removed": True}
+            continue
+        target_entries = json.loads(target_data)
+        if base_data is None:
+            decks[name] = {"target": bytes_hash(target_data), "entries": target_entries}
+            continue
+        with tracked("diff_deck") as record:
+            base_entries = json.loads(base_data)
+            changes = diff_deck(base_entries, target_entries, name)
+            record.add(entries_in=len(base_entries) + len(target_entries))
+        decks[name] = {"base": bytes_hash(base_data), "target": bytes_hash(target_data), **changes}
+    return {"version": DELTA_VERSION, "decks": decks}
+
+
+def apply_entry_change(entry, change):
+    """diff_entry 결과를 항목 사전에 적용한 새 사전"""
+    result = {field: value for field, value in entry.items() if field not in change.get("unset", ())}
+    result.update(change.get("set", {}))
+    if "keys" in change:
+        result = {field: result[field] for field in change["keys"]}
+    return result
+
+
+def apply_deck_delta(entries, delta, name):
+    """한 덱의 항목 리스트에 diff_deck 결과를 적용한 새 항목 리스트"""
+    index = _index_by_id(entries, name)
+    for entry_id in delta.get("delete", ()):
+        if index.pop(entry_id, None) is None:
+            raise ValueError(f"{name}: 지울 항목이 없습니다: {entry_id}")
+    for entry_id, change in delta.get("update", {}).items():
+        if entry_id not in index:
+            raise ValueError(f"{name}: 바꿀 항목이 없습니다: {entry_id}")
+        index[entry_id] = apply_entry_change(index[entry_id], change)
+
+    inserts = delta.get("insert", ())
+    if "order" in delta:
+        for _, entry in inserts:
+            index[entry["id"]] = entry
+        return [index[entry_id] for entry_id in delta["order"]]
+    # 남은 항목 순서는 그대로이므로, 새 항목 위치까지 남은 항목을 채우면서 한 번에 합친다
+    result = []
+    kept = iter(index.values())
+    for position, entry in inserts:
+        while len(result) < position:
+            result.append(next(kept))
+        result.append(entry)
+    result.extend(kept)
+    return result
+
+
+def apply_delta(base, delta):
+    """
+    코퍼스({덱 파일명: 바이트열})에 델타를 적용한 새 코퍼스 (바뀐 덱만 포함, 없어진 덱은 None)
+
+    Raises:
+        ValueError: 기준 덱의 해시가 델타와 다르거나, 적용 결과가 결과 파일 해시와 다를 때
+    """
+    if delta.get("version") != DELTA_VERSION:
+        raise ValueError(f"지원하지 않는 델타 버전입니다: {delta.get('version')}")
+    result = {}
+    for name, deck_delta in delta["decks"].items():
+        base_data = base.get(name)
+        if "base" in deck_delta:
+            if base_data is None or bytes_hash(base_data) != deck_delta["base"]:
+                raise ValueError(f"{name}: 기준 덱이 델타를 만든 버전과 다릅니다")
+        elif base_data is not None:
+            raise ValueError(f"{name}: 새로 추가할 덱이 이미 있습니다")
+
+        if deck_delta.get("removed"):
+            result[name] = None
+            continue
+        if "entries" in deck_delta:
+            entries = deck_delta["entries"]
+        else:
+            with tracked("apply_deck_delta"):
+                entries = apply_deck_delta(json.loads(base_data), deck_delta, name)
+        data = dump_deck(entries).encode('utf-8')
+        if bytes_hash(data) != deck_delta["target"]:
+            raise ValueError(f"{name}: 델타를 적용한 결과가 결과 덱과 다릅니다")
+        add_counts(entries_out=len(entries))
+        result[name] = data
+    return result
+
+
+def encode_delta(delta):
+    """델타를 델타 파일 바이트열로 (공백 없는 JSON + gzip, 같은 델타면 같은 바이트)"""
+    text = json.dumps(delta, ensure_ascii=False, separators=(',', ':'))
+    return gzip.compress(text.encode('utf-8'), compresslevel=9, mtime=0)
+
+
+def decode_delta(data):
+    return json.loads(gzip.decompress(data))
+
+
+def summarize_delta(delta):
+    """델타의 덱/항목 변경 수 (추가 덱, 삭제 덱, 항목 삭제/수정/추가, 바뀐 필드 수)"""
+    summary = dict.fromkeys(("decks", "added_decks", "removed_decks", "delete", "update", "insert", "fields"), 0)
+    for deck_delta in delta["decks"].values():
+        summary["decks"] += 1
+        summary["added_decks"] += "entries" in deck_delta
+        summary["removed_decks"] += bool(deck_delta.get("removed"))
+        summary["delete"] += len(deck_delta.get("delete", ()))
+        summary["insert"] += len(deck_delta.get("insert", ()))
+        for change in deck_delta.get("update", {}).values():
+            summary["update"] += 1
+            summary["fields"] += len(change.get("set", ())) + len(change.get("unset", ()))
+    return summary
+
+
+def print_summary(delta, delta_size, target):
+    """델타 요약과 전체 배포(바뀐 덱 전체를 gzip으로) 대비 크기 출력"""
+    summary = summarize_delta(delta)
+    changed = [name for name, deck_delta in delta["decks"].items() if not deck_delta.get("removed")]
+    full_size = sum(len(gzip.compress(target[name], compresslevel=9, mtime=0)) for name in changed)
+    print(f"덱 {summary['decks']}개 변경 (추가 {summary['added_decks']}, 삭제 {summary['removed_decks']}), "
+          f"항목 삭제 {summary['delete']:,} / 수정 {summary['update']:,} (필드 {summary['fields']:,}) / "
+          f"추가 {summary['insert']:,}")
+    ratio = f" ({full_size / delta_size:,.0f}배 작음)" if delta_size else ""
+    print(f"📦 델타 {delta_size:,} bytes, 바뀐 덱 전체 gzip {full_size:,} bytes{ratio}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="코퍼스 버전 사이의 항목 단위 델타 생성/적용")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    diff_parser = subparsers.add_parser("diff", help="두 코퍼스의 델타 파일 생성")
+    diff_parser.add_argument("base", help="기준 코퍼스 (덱 디렉토리 또는 snapshot:<실행 ID>[:before])")
+    diff_parser.add_argument("target", help="결과 코퍼스 (덱 디렉토리 또는 snapshot:<실행 ID>[:before])")
+    diff_parser.add_argument("-o", "--output", type=Path, required=True, help="델타 파일 경로 (.delta.json.gz)")
+
+    apply_parser = subparsers.add_parser("apply", help="덱 디렉토리에 델타 파일 적용")
+    apply_parser.add_argument("delta", type=Path, help="델타 파일 경로")
+    apply_parser.add_argument("--data-dir", type=Path, default=default_data_dir(), help="델타를 적용할 덱 디렉토리")
+
+    verify_parser = subparsers.add_parser("verify", help="델타를 만들어 기준 코퍼스에 적용한 결과가 결과 코퍼스와 같은지 확인")
+    verify_parser.add_argument("base", help="기준 코퍼스")
+    verify_parser.add_argument("target", help="결과 코퍼스")
+
+    for subparser in (diff_parser, apply_parser, verify_parser):
+        add_metrics_arguments(subparser)
+        add_profile_argument(subparser)
+    args = parser.parse_args()
+
+    with profiled(f"deck_delta_{args.command}", args.profile), \
+            metered(f"deck_delta_{args.command}", args.metrics, args.prometheus):
+        try:
+            if args.command == "apply":
+                with tracked("load_corpus"):
+                    base, _ = load_corpus(str(args.data_dir))
+                    delta = decode_delta(args.delta.read_bytes())
+                result = apply_delta(base, delta)
+                # 새로 생기는 덱도 스냅샷에 기록 (실행 후 상태에 들어감)
+                snapshot_paths = sorted({*deck_files(args.data_dir), *(args.data_dir / name for name in result)})
+                with tracked("save_decks"), \
+                        snapshot_run(f"deck_delta apply {args.delta.name}", snapshot_paths), \
+                        deck_transaction(args.data_dir) as transaction:
+                    for name, data in sorted(result.items()):
+                        if data is not None:
+                            write_bytes_if_changed(args.data_dir / name, data, transaction)
+                        else:
+                            # 없어진 덱은 나머지 덱과 같은 트랜잭션에서 지운다
+                            transaction.remove(args.data_dir / name)
+                            print(f"🗑️  {name}: 삭제")
+                print(f"✅ 덱 {len(result)}개에 델타를 적용했습니다 🎉")
+                return
+
+            with tracked("load_corpus"):
+                base, base_recorded = load_corpus(args.base)
+                target, target_recorded = load_corpus(args.target)
+                base, target = limit_corpora(base, target, base_recorded, target_recorded)
+            start = time.perf_counter()
+            delta = diff_corpora(base, target)
+            diff_time = time.perf_counter() - start
+            data = encode_delta(delta)
+
+            if args.command == "diff":
+                args.output.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write_bytes(args.output, data)
+                print(f"✅ {args.output} ({diff_time:.3f}s)")
+                print_summary(delta, len(data), target)
+                return
+
+            start = time.perf_counter()
+            result = apply_delta(base, decode_delta(data))
+            apply_time = time.perf_counter() - start
+            patched = {name: content for name, content in {**base, **result}.items() if content is not None}
+            if patched != target:
+                mismatched = sorted(name for name in set(patched) | set(target) if patched.get(name) != target.get(name))
+                print(f"❌ 델타를 적용한 결과가 결과 코퍼스와 다릅니다: {', '.join(mismatched)}")
+                sys.exit(1)
+            entries = sum(len(json.loads(content)) for content in target.values())
+            print(f"✅ 왕복 확인 통과: 덱 {len(target)}개, 항목 {entries:,}개 "
+                  f"(diff {diff_time:.3f}s, apply {apply_time:.3f}s)")
+            print_summary(delta, len(data), target)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+assets/data 덱 JSON 파일을 읽고 쓰는 공통 유틸리티
+"""
+
+import filecmp
+import json
+import os
+from pathlib import Path
+
+from atomic_io import AtomicFile, atomic_write_bytes, stage_bytes
+from metrics import add_counts
+
+# 덱 스키마 버전 - validate_decks.py의 필드 규칙이 바뀌면 올린다
+# (빌드 캐시에 기록된 검사 통과 결과를 무효화하고, 에셋 매니페스트에 덱의 스키마 버전으로 기록됨)
+DECK_SCHEMA_VERSION = 1
+
+# 레벨/카테고리 (기존 update_json_files 스크립트들의 파일 순서와 동일)
+LEVELS = ["기초다지기", "표현력확장", "원어민수준"]
+CATEGORIES = ["일상회화", "비즈니스", "여행", "뉴스-시사"]
+
+# 덱 항목의 category 값 -> 파일명의 카테고리
+# (뉴스-시사 덱의 항목은 category가 "뉴스/회화"로 되어 있고, 기존 데이터의 두 항목은 "뉴스/회회"로 되어 있음)
+CATEGORY_ALIASES = {
+    "뉴스/회화": "뉴스-시사",
+    "뉴스/회회": "뉴스-시사",
+}
+
+# 스트리밍 읽기 시 한 번에 읽는 글자 수
+STREAM_CHUNK_SIZE = 1 << 16
+
+_JSON_WHITESPACE = ' \t\r\n'
+
+# 영어 덱 파일 목록
+ENGLISH_DECK_FILES = [
+    f"EN_{level}_{category}.json" for level in LEVELS for category in CATEGORIES
+]
+
+
+def deck_category(category):
+    """덱 항목의 category 값을 파일명의 카테고리로 변환 (별칭이 아니면 그대로)"""
+    return CATEGORY_ALIASES.get(category, category)
+
+
+def default_data_dir():
+    """프로젝트의 assets/data 경로를 반환"""
+    return Path(__file__).parent.parent / "assets" / "data"
+
+
+def deck_files(data_dir):
+    """data_dir 안의 EN_/KO_ 덱 파일들을 이름순으로 반환"""
+    data_path = Path(data_dir)
+    return sorted(list(data_path.glob("EN_*.json")) + list(data_path.glob("KO_*.json")))
+
+
+def counterpart_filename(filename):
+    """EN 덱 파일명은 KO 덱 파일명으로, KO 덱 파일명은 EN 덱 파일명으로 바꿔서 반환"""
+    if filename.startswith("EN_"):
+        return "KO_" + filename[len("EN_"):]
+    if filename.startswith("KO_"):
+        return "EN_" + filename[len("KO_"):]
+    raise ValueError(f"덱 파일명이 아닙니다: {filename}")
+
+
+def load_word_frequency(data_dir):
+    """data_dir의 word_frequency.json (단어 -> 빈도 순위, 소문자로 바꾼 단어도 키로 함께)"""
+    with open(Path(data_dir) / "word_frequency.json", 'r', encoding='utf-8') as f:
+        ranks = json.load(f)
+    for word, rank in list(ranks.items()):
+        ranks.setdefault(word.lower(), rank)
+    return ranks
+
+
+def load_deck(path):
+    """덱 JSON 파일을 읽어서 항목 리스트로 반환"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+        add_counts(entries_in=len(data), bytes_read=os.fstat(f.fileno()).st_size)
+    return data
+
+
+def dump_deck(data):
+    """덱 항목 리스트를 저장할 때와 같은 형식의 문자열로 변환"""
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def write_text_if_changed(path, text, transaction=None):
+    """
+    파일 내용이 text와 다를 때만 저장
+
+    Returns:
+        bool: 실제로 파일을 저장했으면 (transaction이 주어지면 트랜잭션에 추가했으면) True
+    """
+    return write_bytes_if_changed(path, text.encode('utf-8'), transaction)
+
+
+def _same_content(path, data):
+    """path 파일의 내용이 data와 같은지 확인"""
+    try:
+        return path.stat().st_size == len(data) and path.read_bytes() == data
+    except FileNotFoundError:
+        return False
+
+
+def write_bytes_if_changed(path, data, transaction=None):
+    """
+    파일 내용이 data와 다를 때만 저장 (임시 파일에 쓴 뒤 원자적으로 교체)
+
+    Returns:
+        bool: 실제로 파일을 저장했으면 (transaction이 주어지면 트랜잭션에 추가했으면) True
+    """
+    path = Path(path)
+    if _same_content(path, data):
+        return False
+    atomic_write_bytes(path, data, transaction)
+    add_counts(bytes_written=len(data))
+    return True
+
+
+def save_deck(path, data, transaction=None):
+    """
+    덱 항목 리스트를 JSON 파일로 저장 (내용이 같으면 저장하지 않음)
+
+    Returns:
+        bool: 실제로 파일을 저장했으면 (transaction이 주어지면 트랜잭션에 추가했으면) True
+    """
+    add_counts(entries_out=len(data))
+    return write_text_if_changed(path, dump_deck(data), transaction)
+
+
+def stage_deck(path, data):
+    """
+    덱을 path 옆의 임시 파일에만 저장하고 임시 파일 경로를 반환 (내용이 같으면 None)
+
+    병렬 작업 프로세스에서 덱을 쓰고, 메인 프로세스의 WriteTransaction.add로 한꺼번에 반영할 때 사용한다.
+    """
+    path = Path(path)
+    add_counts(entries_out=len(data))
+    data = dump_deck(data).encode('utf-8')
+    if _same_content(path, data):
+        return None
+    add_counts(bytes_written=len(data))
+    return stage_bytes(path, data)
+
+
+def iter_deck_entries(path, chunk_size=STREAM_CHUNK_SIZE, offset=None):
+    """
+    덱 JSON 파일의 최상위 배열 항목을 하나씩 읽어서 반환하는 제너레이터
+
+    파일 전체를 메모리에 올리지 않고 chunk_size 글자씩 읽으므로,
+    메모리 사용량은 덱 크기와 무관하게 (chunk_size + 가장 큰 항목 크기) 정도로 유지된다.
+    offset이 주어지면 배열 처음 대신 그 바이트 위치에서 시작하는 항목부터 읽는다 (정렬된 덱의 색인 조회용).
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        pos = 0
+        eof = False
+        state = 'start'  # start -> first -> (value -> after)*
+        yielded = 0
+        if offset is not None:
+            # 아직 읽기 전인 UTF-8 텍스트 파일은 바이트 위치로 seek할 수 있다
+            f.seek(offset)
+            state = 'first'
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                pos += 1
+
+            if pos >= len(buffer):
+                if eof:
+                    raise ValueError(f"덱 JSON이 중간에 끝났습니다: {path}")
+                chunk = f.read(max(chunk_size, len(buffer) - pos))
+                eof = not chunk
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+
+            char = buffer[pos]
+            if state == 'start':
+                if char != '[':
+                    raise ValueError(f"덱 JSON의 최상위가 배열이 아닙니다: {path}")
+                pos += 1
+                state = 'first'
+                continue
+            if char == ']' and state in ('first', 'after'):
+                add_counts(entries_in=yielded, bytes_read=os.fstat(f.fileno()).st_size - (offset or 0))
+                return
+            if state == 'after':
+                if char != ',':
+                    raise ValueError(f"덱 JSON 항목 사이에 ','가 없습니다: {path} (위치 {pos})")
+                pos += 1
+                state = 'value'
+                continue
+
+            try:
+                entry, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            # 항목이 버퍼 끝에서 잘렸을 수 있으면 더 읽고 다시 시도
+            if end is None or (end == len(buffer) and not eof):
+                chunk = f.read(max(chunk_size, len(buffer) - pos))
+                eof = not chunk
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+
+            yielded += 1
+            yield entry
+            pos = end
+            state = 'after'
+
+
+def write_deck_entries(path, entries, transaction=None):
+    """
+    항목 iterable을 하나씩 덱 JSON 파일로 저장 (dump_deck과 같은 형식)
+
+    같은 디렉토리의 임시 파일에 쓴 뒤 교체하므로 path를 읽는 iter_deck_entries의 결과를
+    그대로 넘겨도 된다. 결과가 기존 파일과 같으면 기존 파일을 그대로 둔다.
+    transaction이 주어지면 바로 교체하지 않고 트랜잭션에 추가한다.
+
+    Returns:
+        tuple: (저장한 항목 수, 실제로 파일을 교체했으면 (트랜잭션에 추가했으면) True)
+    """
+    path = Path(path)
+    output = AtomicFile(path, 'w')
+    count = 0
+    try:
+        for entry in entries:
+            text = json.dumps(entry, ensure_ascii=False, indent=2)
+            output.write('[\n  ' if count == 0 else ',\n  ')
+            output.write(text.replace('\n', '\n  '))
+            count += 1
+        output.write('\n]' if count else '[]')
+        output.finish()
+
+        add_counts(entries_out=count)
+        if path.exists() and filecmp.cmp(output.temp_path, path, shallow=False):
+            output.discard()
+            return count, False
+        add_counts(bytes_written=output.temp_path.stat().st_size)
+        output.commit(transaction)
+        return count, True
+    except BaseException:
+        output.discard()
+        raise
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+모든 덱을 한 번만 읽고, 등록된 변환들을 순서대로 적용한 뒤, 각 덱을 한 번만 저장하는 스크립트
+
+기존에는 fix_korean_meanings, improve_all_examples, swap_en_ko_files, update_ko_examples가
+각각 모든 덱을 읽고 저장했지만, 이 스크립트는 메모리에 올린 덱들에 변환을 연달아 적용한다.
+
+변환 순서 (기본값):
+1. assign_ids: ID가 없는 항목에 안정적인 ID 부여
+2. fix_meanings: EN 덱의 영어 meaning_ko를 한국어 뜻으로 교체
+3. improve_examples: EN 덱의 템플릿 예문을 자연스러운 예문으로 교체
+4. derive_ko: EN 덱으로부터 KO 덱 생성 (기존 KO 덱의 example은 항목 ID로 찾아 그대로 유지)
+5. join_examples 또는 inject_examples: KO 덱의 example을 translate_examples.csv의 한국어 예문으로 교체
+   (번역 파일에 항목 ID가 있으면 ID로, 없으면 all_ko_examples.txt의 위치로 적용)
+
+덱이 하나라도 저장되면 assets/data/manifest.json(asset_manifest.py)도 다시 만든다.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from asset_manifest import deck_transaction
+from build_cache import (
+    DEFAULT_CACHE_FILE,
+    file_hash,
+    forget_missing_files,
+    inputs_key,
+    is_up_to_date,
+    load_cache,
+    record_step,
+    save_cache,
+)
+from deck_io import counterpart_filename, deck_files, default_data_dir, load_deck, save_deck
+from entry_ids import assign_entry_ids
+from fix_korean_meanings import fix_deck_meanings
+from improve_all_examples import improve_deck_examples
+from lexicon import LEXICON_FILE
+from metrics import add_metrics_arguments, metered, tracked
+from numbered_text import TOKENIZER_VERSION
+from profiling import add_profile_argument, profiled
+from snapshot_store import snapshot_run
+from swap_en_ko_files import convert_en_to_ko
+from update_ko_examples import (
+    apply_translated_examples,
+    apply_translations_by_id,
+    filtered_export_count,
+    has_entry_ids,
+    read_all_ko_examples_order,
+    read_translated_examples,
+    read_translated_examples_by_id,
+    report_unmatched_translations,
+)
+from validate_decks import print_deck_result, validate_entries
+
+# 등록된 변환 (이름 -> {"func", "inputs", "scope"})
+TRANSFORMS = {}
+
+DEFAULT_CHAIN = ["assign_ids", "fix_meanings", "improve_examples", "derive_ko", "inject_examples"]
+
+
+def register_transform(name, inputs=None, scope="deck"):
+    """
+    덱 변환 함수를 등록하는 데코레이터
+
+    변환 함수는 (corpus, context)를 받아 corpus(파일명 -> 항목 리스트)를 직접 수정하고,
+    변경된 덱 파일명들의 set을 반환한다.
+
+    Args:
+        name (str): 변환 이름
+        inputs (callable): context를 받아 덱 외의 입력 이름 -> 해시 딕셔너리를 반환하는 함수
+        scope (str): "deck"이면 EN/KO 덱 쌍 단위로 독립적으로 적용 가능,
+            "corpus"이면 전체 덱을 함께 봐야 하는 변환 (예: 파일 순서에 따른 위치 기반 주입)
+    """
+    def decorator(func):
+        TRANSFORMS[name] = {"func": func, "inputs": inputs, "scope": scope}
+        return func
+    return decorator
+
+
+@register_transform("assign_ids")
+def assign_ids_transform(corpus, context):
+    """ID가 없는 항목에 ID 부여"""
+    changed = set()
+    for filename, data in corpus.items():
+        if assign_entry_ids(data):
+            changed.add(filename)
+    return changed
+
+
+@register_transform("fix_meanings", inputs=lambda context: {"lexicon": file_hash(LEXICON_FILE, context.get("cache"))})
+def fix_meanings_transform(corpus, context):
+    """EN 덱들의 meaning_ko 교체"""
+    changed = set()
+    for filename, data in corpus.items():
+        if filename.startswith("EN_") and fix_deck_meanings(data):
+            changed.add(filename)
+    return changed
+
+
+@register_transform("improve_examples", inputs=lambda context: {"lexicon": file_hash(LEXICON_FILE, context.get("cache"))})
+def improve_examples_transform(corpus, context):
+    """EN 덱들의 템플릿 예문 교체"""
+    changed = set()
+    for filename, data in corpus.items():
+        if filename.startswith("EN_") and improve_deck_examples(data):
+            changed.add(filename)
+    return changed
+
+
+@register_transform("derive_ko")
+def derive_ko_transform(corpus, context):
+    """
+    EN 덱으로부터 대응하는 KO 덱 생성 (KO 덱이 있는 경우만)
+
+    KO 덱에 이미 있던 example은 항목 ID로 찾아 그대로 둔다. 그렇지 않으면 번역 파일에 없는 항목의
+    예문이 모두 영어 예문으로 되돌아가서, 일부 예문만 다시 번역해 적용할 수 없다.
+    """
+    changed = set()
+    for filename in sorted(corpus):
+        if not filename.startswith("EN_"):
+            continue
+        ko_filename = counterpart_filename(filename)
+        if ko_filename not in corpus:
+            print(f"⚠️  해당하는 KO 파일을 찾을 수 없습니다: {ko_filename}")
+            continue
+        existing_examples = {
+            item["id"]: item["example"] for item in corpus[ko_filename] if "id" in item and item.get("example")
+        }
+        ko_data = convert_en_to_ko(corpus[filename])
+        for item in ko_data:
+            if item.get("id") in existing_examples:
+                item["example"] = existing_examples[item["id"]]
+        corpus[ko_filename] = ko_data
+        changed.add(ko_filename)
+    return changed
+
+
+@register_transform(
+    "inject_examples",
+    inputs=lambda context: {
+        "translate_examples.csv": file_hash(context["csv_file"], context.get("cache")),
+        "all_ko_examples.txt": file_hash(context["txt_file"], context.get("cache")),
+        "tokenizer": TOKENIZER_VERSION,
+    },
+    scope="corpus",
+)
+def inject_examples_transform(corpus, context):
+    """KO 덱들의 example을 all_ko_examples.txt 순서대로 번역 예문으로 교체"""
+    if filtered_export_count(context["txt_file"]):
+        raise ValueError("번역 메모리로 예문을 건너뛴 all_ko_examples.txt에는 위치 기준 적용(inject_examples)을 쓸 수 없습니다")
+    translated_examples = read_translated_examples(context["csv_file"])
+    file_order = read_all_ko_examples_order(context["txt_file"])
+
+    changed = set()
+    example_index = 0
+    for filename, _ in file_order:
+        if filename not in corpus:
+            print(f"❌ 파일을 찾을 수 없습니다: {filename}")
+            continue
+        data = corpus[filename]
+        start_index = example_index
+        example_index, _ = apply_translated_examples(data, translated_examples, example_index)
+        if example_index - start_index < len(data):
+            print(f"⚠️  번역된 예문이 부족합니다. {filename}의 일부 예문이 업데이트되지 않았습니다.")
+        changed.add(filename)
+    return changed
+
+
+@register_transform(
+    "join_examples",
+    inputs=lambda context: {
+        "translate_examples.csv": file_hash(context["csv_file"], context.get("cache")),
+        "tokenizer": TOKENIZER_VERSION,
+    },
+)
+def join_examples_transform(corpus, context):
+    """KO 덱들의 example을 항목 ID로 찾은 번역 예문으로 교체"""
+    translations = read_translated_examples_by_id(context["csv_file"])
+
+    changed = set()
+    matched_ids = set()
+    for filename in sorted(corpus):
+        if filename.startswith("KO_") and apply_translations_by_id(corpus[filename], translations, matched_ids):
+            changed.add(filename)
+
+    # 일부 덱만 다시 처리할 때는 나머지 덱의 ID를 볼 수 없으므로, 전체 덱을 처리한 경우에만 보고
+    if context.get("full_corpus", True):
+        report_unmatched_translations(translations, matched_ids)
+    return changed
+
+
+def default_chain(csv_file):
+    """번역 파일에 항목 ID가 있으면 ID 조인, 없으면 위치 기반 주입을 쓰는 기본 변환 순서"""
+    if Path(csv_file).exists() and has_entry_ids(csv_file):
+        return [name if name != "inject_examples" else "join_examples" for name in DEFAULT_CHAIN]
+    return list(DEFAULT_CHAIN)
+
+
+def chain_key(chain, context):
+    """변환 순서와 각 변환의 덱 외 입력 해시로 만든 캐시 키"""
+    inputs = []
+    for name in chain:
+        transform_inputs = TRANSFORMS[name]["inputs"]
+        inputs.append([name, transform_inputs(context) if transform_inputs else {}])
+    return inputs_key(inputs)
+
+
+def group_deck_units(paths):
+    """덱 파일들을 레벨/카테고리가 같은 EN/KO 쌍 단위로 묶음 (단위 이름 -> 경로 리스트)"""
+    units = {}
+    for path in paths:
+        unit = path.name.split("_", 1)[1]
+        units.setdefault(unit, []).append(path)
+    return units
+
+
+def run_pipeline(data_dir, chain, context, cache_file=None):
+    """
+    덱을 한 번 읽고 chain의 변환들을 차례로 적용한 뒤, 내용이 바뀐 덱만 한 번씩 저장
+
+    cache_file이 주어지면 EN/KO 덱 쌍 단위로 입력 해시를 비교해서,
+    입력이 바뀌지 않았고 덱 파일이 마지막 실행 결과 그대로인 쌍은 읽지도 않고 건너뛴다.
+    전체 덱을 함께 봐야 하는 변환(scope="corpus")이 포함되면 한 쌍이라도 바뀌었을 때 전체를 다시 처리한다.
+
+    Args:
+        data_dir (Path): 덱 파일들이 있는 디렉토리
+        chain (list): 적용할 변환 이름 리스트 (순서대로 적용)
+        context (dict): 변환들이 사용하는 부가 입력 경로 (csv_file, txt_file)와 옵션 (validate: 저장 전 스키마 검사)
+        cache_file (Path): 빌드 캐시 파일 경로 (None이면 캐시 없이 전체 처리)
+
+    Returns:
+        set: 실제로 저장된 덱 파일명들
+    """
+    unknown = [name for name in chain if name not in TRANSFORMS]
+    if unknown:
+        raise ValueError(f"등록되지 않은 변환: {', '.join(unknown)}")
+
+    data_path = Path(data_dir)
+    units = group_deck_units(deck_files(data_path))
+
+    cache = load_cache(cache_file) if cache_file else None
+    context = dict(context, cache=cache)
+
+    if cache is not None:
+        key = chain_key(chain, context)
+        stale_units = [
+            unit for unit, paths in sorted(units.items())
+            if not is_up_to_date(cache, f"pipeline:{unit}", key, paths)
+        ]
+        if stale_units and any(TRANSFORMS[name]["scope"] == "corpus" for name in chain):
+            stale_units = sorted(units)
+        if not stale_units:
+            save_cache(cache, cache_file)
+            print("변경된 입력이 없습니다. 모든 덱이 최신 상태입니다.")
+            return set()
+    else:
+        stale_units = sorted(units)
+
+    context["full_corpus"] = len(stale_units) == len(units)
+    with tracked("load_decks"):
+        corpus = {path.name: load_deck(path) for unit in stale_units for path in units[unit]}
+    print(f"덱 {len(corpus)}개 로드 완료 (전체 {sum(len(paths) for paths in units.values())}개)")
+
+    dirty = set()
+    for name in chain:
+        with tracked(name) as record:
+            entries_in = sum(len(deck) for deck in corpus.values())
+            changed = TRANSFORMS[name]["func"](corpus, context)
+            record.add(entries_in=entries_in, entries_out=sum(len(deck) for deck in corpus.values()))
+        print(f"✅ {name}: {len(changed)}개 덱 변경")
+        dirty |= changed
+
+    # 저장하기 전에 바뀐 덱들을 스키마로 검사 (위반이 있으면 어떤 덱도 저장하지 않음)
+    if context.get("validate"):
+        with tracked("validate"):
+            violation_count = 0
+            for filename in sorted(dirty):
+                count, reported = validate_entries(corpus[filename], filename)
+                violation_count += count
+                if count:
+                    print_deck_result(filename, len(corpus[filename]), count, reported)
+        if violation_count:
+            print(f"\n❌ 위반 {violation_count:,}개가 있어 어떤 덱도 저장하지 않았습니다.")
+            return set()
+        print(f"✅ validate: {len(dirty)}개 덱 검사 통과")
+
+    # 바뀐 덱들을 하나의 트랜잭션으로 저장 (중간에 중단되면 어떤 덱도 바뀌지 않음)
+    # 실행 전후 덱 상태는 스냅샷 저장소에 기록된다.
+    # 덱이 바뀌었으면 assets/data/manifest.json의 해시/크기/항목 수도 같은 트랜잭션으로 갱신
+    written = set()
+    with tracked("save_decks"), snapshot_run(f"deck_pipeline {','.join(chain)}", deck_files(data_path)), \
+            deck_transaction(data_path) as transaction:
+        for filename in sorted(dirty):
+            if save_deck(data_path / filename, corpus[filename], transaction):
+                written.add(filename)
+
+    if cache is not None:
+        for unit in stale_units:
+            record_step(cache, f"pipeline:{unit}", key, units[unit])
+        forget_missing_files(cache)
+        save_cache(cache, cache_file)
+
+    print(f"\n총 {len(written)}개 덱 저장 완료 (내용이 같은 {len(dirty) - len(written)}개는 건너뜀) 🎉")
+    return written
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="덱 변환 파이프라인")
+    parser.add_argument(
+        "--transforms",
+        help=f"적용할 변환 목록 (쉼표 구분, 기본값: {','.join(DEFAULT_CHAIN)}, "
+             "번역 파일에 항목 ID가 있으면 inject_examples 대신 join_examples)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="빌드 캐시를 무시하고 모든 덱을 다시 처리",
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="저장하기 전에 바뀐 덱들을 validate_decks 스키마로 검사하고, 위반이 있으면 저장하지 않음",
+    )
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    project_root = Path(__file__).parent.parent
+    data_dir = default_data_dir()
+    context = {
+        "csv_file": project_root / "translate_examples.csv",
+        "txt_file": project_root / "all_ko_examples.txt",
+        "validate": args.validate,
+    }
+
+    if not data_dir.exists():
+        print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
+        return
+
+    if args.transforms:
+        chain = [name.strip() for name in args.transforms.split(",") if name.strip()]
+    else:
+        chain = default_chain(context["csv_file"])
+
+    if "inject_examples" in chain and context["txt_file"].exists() and filtered_export_count(context["txt_file"]):
+        print("❌ all_ko_examples.txt는 번역 메모리로 예문을 건너뛴 내보내기라서 위치 기준으로 적용할 수 없습니다. "
+              "번역 파일의 예문마다 {ID}를 남겨 주세요.")
+        sys.exit(1)
+
+    print(f"데이터 디렉토리: {data_dir}")
+    print(f"변환 순서: {' -> '.join(chain)}")
+    print("=" * 50)
+
+    cache_file = None if args.no_cache else DEFAULT_CACHE_FILE
+    with profiled("deck_pipeline", args.profile), metered("deck_pipeline", args.metrics, args.prometheus):
+        run_pipeline(data_dir, chain, context, cache_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+샤드로 나눈 덱 (.shards)과 매니페스트의 인코더, 지연 로딩 참조 리더
+
+덱 하나를 고정 크기(shard_size개 항목) 샤드로 나누고, 샤드마다 공백 없는 JSON 배열을 만들어
+덱별 파일 하나({덱}.shards)에 이어 붙인다. 매니페스트(manifest.json)에는 덱마다 샤드별
+(바이트 위치, 바이트 길이, 항목 수, sha256, 빈도 순위 범위)가 들어 있으므로, 리더는 필요한
+샤드의 바이트 범위만 읽어서 디코딩한다 (앱에서는 에셋 일부 읽기나 HTTP Range 요청에 해당).
+
+매니페스트 구조:
+    {
+      "version": 1,
+      "order": "rank" 또는 "shuffle",
+      "shard_size": 64,
+      "seed": 0,
+      "decks": {
+        "EN_기초다지기_일상회화": {
+          "file": "EN_기초다지기_일상회화.shards",
+          "entry_count": 102,
+          "source_sha256": "...",
+          "shards": [{"offset": 0, "length": 9876, "count": 64, "sha256": "...",
+                      "min_rank": 3, "max_rank": 740}, ...]
+        }
+      }
+    }
+
+min_rank/max_rank는 샤드 안에서 빈도 순위가 있는 항목들의 범위이다 (없으면 null).
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+MANIFEST_VERSION = 1
+MANIFEST_FILE_NAME = "manifest.json"
+SHARD_FILE_SUFFIX = ".shards"
+
+# 샤드 순서: 빈도 순위순 (compile_ranked_decks와 같은 정렬) / 시드로 고정한 섞기
+ORDERS = ("rank", "shuffle")
+
+RANK_FIELD = "frequency_rank"
+
+
+def encode_shards(entries, shard_size):
+    """
+    정렬된 덱 항목들을 샤드 파일 바이트열로 변환
+
+    Returns:
+        tuple: (샤드 파일 바이트열, 매니페스트의 샤드 정보 리스트)
+    """
+    if shard_size < 1:
+        raise ValueError(f"샤드 크기는 1 이상이어야 합니다: {shard_size}")
+    parts = []
+    shards = []
+    offset = 0
+    for start in range(0, len(entries), shard_size):
+        chunk = entries[start:start + shard_size]
+        data = json.dumps(chunk, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        ranks = [entry[RANK_FIELD] for entry in chunk if entry.get(RANK_FIELD) is not None]
+        shards.append({
+            "offset": offset,
+            "length": len(data),
+            "count": len(chunk),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "min_rank": min(ranks) if ranks else None,
+            "max_rank": max(ranks) if ranks else None,
+        })
+        parts.append(data)
+        offset += len(data)
+    return b"".join(parts), shards
+
+
+class ShardedDecks:
+    """
+    샤드 덱 지연 로딩 참조 리더
+
+    매니페스트만 읽어 두고, 샤드는 처음 필요할 때 바이트 범위만 읽어서 해시를 확인하고 디코딩한다.
+    한 번 읽은 샤드는 캐시한다. shards_read는 지금까지 파일에서 읽은 샤드 수이다.
+    """
+
+    def __init__(self, manifest, shard_dir):
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"지원하지 않는 샤드 매니페스트 버전입니다: {manifest.get('version')}")
+        if manifest.get("order") not in ORDERS:
+            raise ValueError(f"알 수 없는 샤드 순서입니다: {manifest.get('order')}")
+        self.order = manifest["order"]
+        self.shard_size = manifest["shard_size"]
+        self.shard_dir = Path(shard_dir)
+        self._decks = manifest["decks"]
+        self._cache = {}
+        self.shards_read = 0
+        self.bytes_read = 0
+
+    @property
+    def decks(self):
+        """매니페스트에 있는 덱 이름 리스트"""
+        return list(self._decks)
+
+    def entry_count(self, deck):
+        return self._decks[deck]["entry_count"]
+
+    def shard_count(self, deck):
+        return len(self._decks[deck]["shards"])
+
+    def load_shard(self, deck, index):
+        """
+        deck의 index번째 샤드 항목 리스트
+
+        Raises:
+            ValueError: 샤드 내용이 매니페스트의 해시/항목 수와 다를 때
+        """
+        key = (deck, index)
+        if key in self._cache:
+            return self._cache[key]
+        info = self._decks[deck]
+        shard = info["shards"][index]
+        with open(self.shard_dir / info["file"], 'rb') as f:
+            f.seek(shard["offset"])
+            data = f.read(shard["length"])
+        if len(data) != shard["length"] or hashlib.sha256(data).hexdigest() != shard["sha256"]:
+            raise ValueError(f"{deck} 샤드 {index}의 내용이 매니페스트와 다릅니다")
+        entries = json.loads(data)
+        if len(entries) != shard["count"]:
+            raise ValueError(f"{deck} 샤드 {index}의 항목 수가 매니페스트와 다릅니다: {len(entries)}")
+        self.shards_read += 1
+        self.bytes_read += len(data)
+        self._cache[key] = entries
+        return entries
+
+    def entry(self, deck, position):
+        """deck의 position번째 항목 (그 항목이 든 샤드만 읽음)"""
+        if not 0 <= position < self.entry_count(deck):
+            raise IndexError(f"덱 항목 위치가 범위를 벗어났습니다: {position}")
+        shard, offset = divmod(position, self.shard_size)
+        return self.load_shard(deck, shard)[offset]
+
+    def pick(self, deck, count, start=0, exclude=None):
+        """
+        deck의 start번째 항목부터 (끝에 닿으면 처음으로 돌아가서) exclude(예: 학습한 단어)에 없는
+        항목을 count개까지 순서대로 반환
+
+        shuffle 순서 덱이면 무작위 start로 앱의 "섞어서 앞에서 count개"와 같은 선택을 할 수 있고,
+        rank 순서 덱이면 start=0이 가장 흔한 단어부터이다. 필요한 샤드만 읽는다.
+        """
+        total = self.entry_count(deck)
+        picked = []
+        for step in range(total):
+            if len(picked) >= count:
+                break
+            entry = self.entry(deck, (start + step) % total)
+            if exclude and entry.get("word") in exclude:
+                continue
+            picked.append(entry)
+        return picked
+
+    def entries_in_rank_range(self, deck, low, high):
+        """
+        rank 순서 덱에서 빈도 순위가 low 이상 high 이하인 항목들 (매니페스트의 샤드 순위 범위로
+        겹치는 샤드만 읽음)
+        """
+        if self.order != "rank":
+            raise ValueError("빈도 순위 범위 조회는 rank 순서 샤드에서만 가능합니다")
+        results = []
+        for index, shard in enumerate(self._decks[deck]["shards"]):
+            if shard["min_rank"] is None or shard["min_rank"] > high:
+                # 정렬되어 있으므로 뒤 샤드는 순위가 더 크거나 순위가 없다
+                break
+            if shard["max_rank"] < low:
+                continue
+            results.extend(entry for entry in self.load_shard(deck, index)
+                           if entry.get(RANK_FIELD) is not None and low <= entry[RANK_FIELD] <= high)
+        return results
+
+
+def read_shard_manifest(path, shard_dir=None):
+    """매니페스트 파일을 읽어서 ShardedDecks로 반환 (shard_dir 기본값: 매니페스트가 있는 디렉토리)"""
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    return ShardedDecks(manifest, shard_dir if shard_dir is not None else path.parent)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 항목에 안정적인 ID("id" 필드)를 부여하는 스크립트
+
+ID는 (레벨, 카테고리, 영어 단어, 같은 덱 안에서 그 단어의 등장 순번)의 해시로 만든다.
+- EN 덱은 word, KO 덱은 meaning_en을 영어 단어로 사용하므로, 같은 위치의 EN/KO 항목은 같은 ID를 갖는다.
+- 한 번 부여된 ID는 덱 순서가 바뀌거나 다른 필드가 바뀌어도 그대로 유지된다.
+
+예문 추출(all_ko_examples.txt)과 번역 결과(translate_examples.csv)에는 "{ID}" 형태로 ID가 함께 기록되어,
+번역 예문을 위치가 아니라 ID로 다시 적용할 수 있다.
+"""
+
+import argparse
+import hashlib
+import re
+
+from asset_manifest import deck_transaction
+from deck_io import deck_files, default_data_dir, load_deck, save_deck
+from metrics import add_metrics_arguments, metered
+from profiling import add_profile_argument, profiled
+from snapshot_store import snapshot_run
+
+ID_LENGTH = 12
+
+# 예문 추출/번역 파일에서 ID를 표시하는 형식 ({a1b2c3d4e5f6})
+# clean_cite_text가 대괄호 안의 내용을 지우므로 중괄호를 사용한다.
+ID_TOKEN_PATTERN = re.compile(r'\{([0-9a-f]{%d})\}' % ID_LENGTH)
+
+
+def format_id_token(entry_id):
+    """예문 추출/번역 파일에 기록할 ID 표시 문자열"""
+    return f"{{{entry_id}}}"
+
+
+def make_entry_id(level, category, source_word, occurrence):
+    """(레벨, 카테고리, 영어 단어, 등장 순번)으로 항목 ID 생성"""
+    key = f"{level}\x1f{category}\x1f{source_word}\x1f{occurrence}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:ID_LENGTH]
+
+
+def _source_word(item):
+    """ID 계산에 쓰는 영어 단어 (EN 항목은 word, KO 항목은 meaning_en)"""
+    return item.get("meaning_en", item.get("word", ""))
+
+
+def assign_entry_ids(data):
+    """
+    ID가 없는 항목에 ID를 부여 (이미 있는 ID는 유지)
+
+    새 ID는 덱 안에서 이미 쓰인 ID와 겹치지 않도록 등장 순번을 늘려가며 만든다.
+    ID는 항목의 첫 번째 필드로 넣는다.
+
+    Returns:
+        int: 새로 ID를 부여한 항목 수
+    """
+    used = {item["id"] for item in data if isinstance(item, dict) and "id" in item}
+    occurrences = {}
+    assigned = 0
+
+    for position, item in enumerate(data):
+        if not isinstance(item, dict):
+            continue
+        key = (item.get("level"), item.get("category"), _source_word(item))
+        occurrence = occurrences.get(key, 0)
+        if "id" not in item:
+            entry_id = make_entry_id(*key, occurrence)
+            while entry_id in used:
+                occurrence += 1
+                entry_id = make_entry_id(*key, occurrence)
+            used.add(entry_id)
+            data[position] = {"id": entry_id, **item}
+            assigned += 1
+        occurrences[key] = occurrence + 1
+
+    return assigned
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="ID가 없는 덱 항목에 ID 부여")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    with profiled("entry_ids", args.profile), metered("entry_ids", args.metrics, args.prometheus):
+        data_dir = default_data_dir()
+
+        if not data_dir.exists():
+            print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
+            return
+
+        print(f"데이터 디렉토리: {data_dir}")
+        print("=" * 50)
+
+        total = 0
+        with snapshot_run("entry_ids", deck_files(data_dir)), deck_transaction(data_dir) as transaction:
+            for deck_file in deck_files(data_dir):
+                data = load_deck(deck_file)
+                assigned = assign_entry_ids(data)
+                if assigned:
+                    save_deck(deck_file, data, transaction)
+                total += assigned
+                print(f"✅ {deck_file.name}: {assigned}개 ID 부여")
+
+        print(f"\n총 {total}개 항목에 ID를 부여했습니다.")
+
+
+if __name__ == "__main__":
+    main()
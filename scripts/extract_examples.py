@@ -1,19 +1,90 @@
 #!/usr/bin/env python3
 """
 모든 KO 파일에서 example 문장들을 추출하여 텍스트 파일로 저장하는 스크립트
+
+--tm을 주면 번역 메모리(translation_memory.py)에 번역이 있는 예문과 이미 번역된 예문은 내보내지 않고,
+내보내는 예문 중 비슷한 원문의 번역이 있는 것은 all_ko_examples.tm_hints.txt에 참고용으로 기록한다.
 """
 
-import json
-import os
+import argparse
+import shutil
+import tempfile
 from pathlib import Path
 
-def extract_examples_from_ko_files(data_dir, output_file):
+from atomic_io import atomic_open, atomic_write_text
+from deck_io import iter_deck_entries
+from entry_ids import format_id_token
+from metrics import add_counts, add_metrics_arguments, metered, tracked
+from parallel import add_jobs_argument, map_in_order, print_worker_timings, resolve_jobs
+from profiling import add_profile_argument, profiled
+from translation_memory import TranslationMemory, default_tm_file
+
+# 번역 메모리로 건너뛴 예문이 있는 내보내기의 헤더 줄 (이 파일은 덱의 모든 예문을 순서대로 담고 있지 않으므로
+# 번역을 위치로 적용할 수 없고, 항목 ID로만 적용할 수 있다)
+FILTERED_EXPORT_LABEL = "번역 메모리로 제외한 예문 수:"
+
+def extract_file_examples(task):
+    """
+    KO 파일 하나에서 비어있지 않은 example 문장들을 번호를 붙여 section_file에 스트리밍으로 기록
+    
+    덱을 항목 단위로 읽으므로 덱 크기와 무관하게 메모리 사용량이 일정하다.
+    항목에 ID가 있으면 번호 뒤에 "{ID}"를 함께 기록해서 번역 결과를 ID로 다시 적용할 수 있게 한다.
+    
+    tm_file이 주어지면 번역 메모리에 번역이 있거나 이미 번역문인 예문은 건너뛰고,
+    내보내는 예문 중 비슷한 원문의 번역이 있는 것은 참고용 힌트로 모은다.
+    
+    Args:
+        task (tuple): (KO 파일 경로, 예문 줄을 기록할 임시 파일 경로, 번역 메모리 파일 경로 또는 None)
+    
+    Returns:
+        tuple: (예문 수, 번역 메모리로 건너뛴 예문 수, 힌트 줄 리스트, 오류 메시지) - 오류가 없으면 오류 메시지는 None
+    """
+    ko_file, section_file, tm_file = task
+    count = 0
+    skipped = 0
+    hints = []
+    memory = None
+    try:
+        memory = TranslationMemory(tm_file, readonly=True) if tm_file else None
+        with open(section_file, 'w', encoding='utf-8') as f:
+            # 각 항목의 example 추출
+            for item in iter_deck_entries(ko_file):
+                if 'example' in item:
+                    example = item['example'].strip()
+                    if example and memory is not None and (
+                            memory.lookup(example) is not None or memory.is_translation(example)):
+                        skipped += 1
+                        continue
+                    if example:  # 빈 문자열이 아닌 경우만
+                        count += 1
+                        if memory is not None:
+                            for score, source, target in memory.fuzzy_lookup(example, limit=1):
+                                hints.append(f"{ko_file.name} {count}. {example}\n"
+                                             f"    ≈{score:.2f} {source}\n    -> {target}")
+                        if 'id' in item:
+                            f.write(f"\n{count:3d}. {format_id_token(item['id'])} {example}")
+                        else:
+                            f.write(f"\n{count:3d}. {example}")
+    except Exception as e:
+        add_counts(errors=1)
+        return None, skipped, hints, str(e)
+    finally:
+        if memory is not None:
+            memory.close()
+    return count, skipped, hints, None
+
+def extract_examples_from_ko_files(data_dir, output_file, jobs=1, tm_file=None):
     """
     모든 KO 파일에서 example 문장들을 추출하여 텍스트 파일로 저장
     
+    파일별 예문은 임시 파일에 먼저 기록한 뒤 파일명 순서대로 이어 붙이므로,
+    전체 예문을 메모리에 모으지 않는다.
+    
     Args:
         data_dir (str): 데이터 파일들이 있는 디렉토리 경로
         output_file (str): 출력할 텍스트 파일 경로
+        jobs (int): 병렬로 처리할 프로세스 수 (결과는 항상 파일명 순서대로 합쳐짐)
+        tm_file (Path): 번역 메모리 파일 경로 (주어지면 번역 메모리에 있는 예문은 내보내지 않음)
     """
     data_path = Path(data_dir)
     
@@ -22,86 +93,115 @@ def extract_examples_from_ko_files(data_dir, output_file):
     
     print(f"발견된 KO 파일 수: {len(ko_files)}")
     
-    all_examples = []
-    
-    for ko_file in ko_files:
-        print(f"처리 중: {ko_file.name}")
+    with tempfile.TemporaryDirectory() as section_dir:
+        section_files = [Path(section_dir) / f"{i:05d}.txt" for i in range(len(ko_files))]
         
-        try:
-            # KO 파일 읽기
-            with open(ko_file, 'r', encoding='utf-8') as f:
-                ko_data = json.load(f)
-            
-            # 파일명에서 카테고리 정보 추출
-            filename = ko_file.stem  # 확장자 제거
-            category_info = filename.replace("KO_", "")
-            
-            # 각 항목의 example 추출
-            file_examples = []
-            for item in ko_data:
-                if 'example' in item:
-                    example = item['example'].strip()
-                    if example:  # 빈 문자열이 아닌 경우만
-                        file_examples.append(example)
-            
-            # 파일별로 섹션 구분하여 추가
-            all_examples.append(f"\n{'='*80}")
-            all_examples.append(f"파일: {ko_file.name}")
-            all_examples.append(f"카테고리: {category_info}")
-            all_examples.append(f"예문 수: {len(file_examples)}")
-            all_examples.append(f"{'='*80}\n")
-            
-            # 예문들을 번호와 함께 추가
-            for i, example in enumerate(file_examples, 1):
-                all_examples.append(f"{i:3d}. {example}")
+        # 파일별 추출은 병렬로 실행하고, 결과는 파일명 순서대로 합침
+        with tracked("extract_file_examples"):
+            tasks = [(ko_file, section_file, tm_file) for ko_file, section_file in zip(ko_files, section_files)]
+            results, timings = map_in_order(extract_file_examples, tasks, jobs)
+        
+        sections = []
+        total_skipped = 0
+        all_hints = []
+        for ko_file, section_file, (count, skipped, hints, error) in zip(ko_files, section_files, results):
+            print(f"처리 중: {ko_file.name}")
             
-            print(f"  ✅ 완료: {len(file_examples)}개 예문 추출")
+            if error is not None:
+                print(f"  ❌ 오류 발생: {error}")
+                continue
             
-        except Exception as e:
-            print(f"  ❌ 오류 발생: {e}")
-            continue
-    
-    # 전체 통계
-    total_examples = sum(1 for line in all_examples if line.strip() and not line.startswith('=') and not line.startswith('파일:') and not line.startswith('카테고리:') and not line.startswith('예문 수:'))
-    
-    # 헤더 정보 추가
-    header = [
-        "=" * 80,
-        "VOCATCH - 모든 KO 파일의 Example 문장 모음",
-        "=" * 80,
-        f"총 파일 수: {len(ko_files)}",
-        f"총 예문 수: {total_examples}",
-        f"생성일: {Path().cwd()}",
-        "=" * 80,
-        ""
-    ]
-    
-    # 최종 결과를 파일에 저장
-    final_content = header + all_examples
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(final_content))
+            sections.append((ko_file, section_file, count))
+            total_skipped += skipped
+            all_hints.extend(hints)
+            print(f"  ✅ 완료: {count}개 예문 추출" + (f" (번역 메모리로 {skipped}개 건너뜀)" if skipped else ""))
+        
+        # 전체 통계
+        total_examples = sum(count for _, _, count in sections)
+        
+        # 헤더 정보 추가
+        header = [
+            "=" * 80,
+            "VOCATCH - 모든 KO 파일의 Example 문장 모음",
+            "=" * 80,
+            f"총 파일 수: {len(ko_files)}",
+            f"총 예문 수: {total_examples}",
+            f"생성일: {Path().cwd()}",
+            *([f"{FILTERED_EXPORT_LABEL} {total_skipped} (ID가 있는 번역 파일로만 적용 가능)"] if total_skipped else []),
+            "=" * 80,
+            ""
+        ]
+        
+        # 최종 결과를 파일에 저장 (임시 파일에 다 쓴 뒤 교체하므로 중단되어도 기존 파일이 그대로 남음)
+        with tracked("write_output"):
+            with atomic_open(output_file, 'w') as f:
+                f.write('\n'.join(header))
+                
+                for ko_file, section_file, count in sections:
+                    # 파일명에서 카테고리 정보 추출
+                    filename = ko_file.stem  # 확장자 제거
+                    category_info = filename.replace("KO_", "")
+                    
+                    # 파일별로 섹션 구분하여 추가
+                    section_header = [
+                        f"\n{'='*80}",
+                        f"파일: {ko_file.name}",
+                        f"카테고리: {category_info}",
+                        f"예문 수: {count}",
+                        f"{'='*80}\n",
+                    ]
+                    f.write('\n' + '\n'.join(section_header))
+                    
+                    # 번호가 붙은 예문들을 이어 붙임
+                    with open(section_file, 'r', encoding='utf-8') as section:
+                        shutil.copyfileobj(section, f)
+            add_counts(entries_out=total_examples, bytes_written=Path(output_file).stat().st_size)
     
     print(f"\n모든 예문이 '{output_file}' 파일에 저장되었습니다!")
     print(f"총 {len(ko_files)}개 파일에서 {total_examples}개의 예문을 추출했습니다.")
+    if tm_file:
+        print(f"번역 메모리에 번역이 있는 {total_skipped}개 예문은 내보내지 않았습니다.")
+        if total_skipped:
+            print("⚠️  일부 예문을 건너뛰었으므로 번역 파일에 {ID}가 있어야 적용할 수 있습니다 (위치 기준 적용 불가).")
+        hints_file = Path(output_file).with_suffix(".tm_hints.txt")
+        atomic_write_text(hints_file, "\n".join(all_hints) + "\n" if all_hints else "")
+        print(f"비슷한 원문의 번역이 있는 예문 {len(all_hints)}개를 '{hints_file}'에 기록했습니다.")
+    
+    if jobs > 1:
+        print_worker_timings(timings)
 
 def main():
     """메인 함수"""
-    # 현재 스크립트의 상위 디렉토리에서 assets/data 경로 찾기
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    data_dir = project_root / "assets" / "data"
-    output_file = project_root / "all_ko_examples.txt"
-    
-    if not data_dir.exists():
-        print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
-        return
+    parser = argparse.ArgumentParser(description="모든 KO 파일의 example 문장 추출")
+    parser.add_argument("--tm", nargs="?", type=Path, const=default_tm_file(), default=None,
+                        help="번역 메모리에 번역이 있는 예문은 내보내지 않음 (기본 경로: .translation_memory.sqlite)")
+    add_jobs_argument(parser)
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    jobs = resolve_jobs(args.jobs)
     
-    print(f"데이터 디렉토리: {data_dir}")
-    print(f"출력 파일: {output_file}")
-    print("=" * 50)
-    
-    extract_examples_from_ko_files(data_dir, output_file)
+    with profiled("extract_examples", args.profile), metered("extract_examples", args.metrics, args.prometheus):
+        # 현재 스크립트의 상위 디렉토리에서 assets/data 경로 찾기
+        script_dir = Path(__file__).parent
+        project_root = script_dir.parent
+        data_dir = project_root / "assets" / "data"
+        output_file = project_root / "all_ko_examples.txt"
+        
+        if not data_dir.exists():
+            print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
+            return
+        
+        print(f"데이터 디렉토리: {data_dir}")
+        print(f"출력 파일: {output_file}")
+        print("=" * 50)
+        
+        tm_file = args.tm
+        if tm_file is not None and not tm_file.exists():
+            print(f"⚠️  번역 메모리 파일이 없어서 모든 예문을 내보냅니다: {tm_file}")
+            tm_file = None
+        
+        extract_examples_from_ko_files(data_dir, output_file, jobs, tm_file)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱들의 예문(example) 중 같거나 거의 같은 예문을 찾아서 묶는 스크립트
+
+모든 EN/KO 덱의 예문을 언어별로 비교한다.
+1. 정규화 (소문자, 문장부호 제거, 공백 정리) 결과가 같은 예문은 바로 같은 묶음 (완전 중복)
+2. 서로 다른 정규화 예문은 글자 n-gram(shingle) 집합의 MinHash 서명을 만들고,
+   서명을 밴드로 나눈 LSH 버킷에서 만난 예문 쌍만 실제 자카드 유사도로 확인한다 (--threshold 이상이면 같은 묶음)
+
+모든 쌍을 비교하지 않으므로 예문 수에 거의 비례하는 시간에 끝난다.
+MinHash 서명은 shingle 하나에 해시 하나만 계산하는 one permutation hashing으로 만든다.
+(해시값의 상위 비트로 칸을 고르고 칸마다 최솟값을 남김, 빈 칸은 칸마다 정해진 순서로 다른 칸을 찾아 그 값으로 채움)
+
+묶음마다 남길 예문 하나(낮은 레벨 덱의 가장 앞 예문)와 바꿀 것을 권장하는 나머지 예문을 보고서로 저장한다.
+- build/near_duplicates/near_duplicates.txt: 사람이 읽는 보고서
+- build/near_duplicates/near_duplicates.json: 같은 내용 (도구용)
+
+    python scripts/find_near_duplicates.py --jobs 0
+    python scripts/find_near_duplicates.py --threshold 0.8 build/synthetic/1m/assets/data/*.json
+"""
+
+import argparse
+import json
+import operator
+import re
+import zlib
+from array import array
+from pathlib import Path
+
+from atomic_io import atomic_write_text
+from deck_io import LEVELS, deck_files, default_data_dir, iter_deck_entries
+from metrics import add_metrics_arguments, metered, tracked
+from parallel import add_jobs_argument, map_in_order, print_worker_timings, resolve_jobs
+from profiling import add_profile_argument, profiled
+
+REPORT_VERSION = 1
+DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / "build" / "near_duplicates"
+
+# 언어별 shingle 글자 수 (한글은 음절 하나에 정보가 많아서 짧게)
+SHINGLE_SIZES = {"EN": 4, "KO": 2}
+
+# MinHash 서명 길이 (2의 거듭제곱), LSH 밴드 수와 밴드당 값 수
+# 자카드 유사도 s인 쌍이 후보가 될 확률은 1 - (1 - s^ROWS)^BANDS
+# (0.3: 6%, 0.5: 41%, 0.7: 88%, 0.8: 99%)
+SIGNATURE_SIZE = 32
+BANDS = 8
+ROWS = 4
+
+DEFAULT_THRESHOLD = 0.7
+
+# 버킷 하나에 보관/비교하는 예문 수 상한 (아주 흔한 shingle 조합 때문에 제곱 시간이 되지 않도록)
+MAX_BUCKET_SIZE = 32
+
+# 서명으로 추정한 유사도(같은 칸 비율)가 threshold보다 이만큼 낮으면 실제 자카드 유사도를 계산하지 않음
+# (서명 32칸의 추정 오차는 표준편차 0.08 정도)
+ESTIMATE_MARGIN = 0.2
+
+# 출력에 보여 줄 묶음 수
+SHOW_CLUSTERS = 10
+
+_BIN_BITS = SIGNATURE_SIZE.bit_length() - 1
+_VALUE_BITS = 32 - _BIN_BITS
+_VALUE_MASK = (1 << _VALUE_BITS) - 1
+_EMPTY = 1 << 32
+
+# 빈 칸마다 값을 빌려 올 다른 칸들의 순서 (칸마다 다른 고정된 순서)
+# 오른쪽 칸만 보면 흔한 shingle 하나의 값이 이웃한 빈 칸들에 번져서 관계없는 예문끼리 같은 버킷에 모인다.
+_DENSIFY_ORDER = [
+    sorted((other for other in range(SIGNATURE_SIZE) if other != slot),
+           key=lambda other, slot=slot: zlib.crc32(f"{slot}:{other}".encode('ascii')))
+    for slot in range(SIGNATURE_SIZE)
+]
+
+_PUNCTUATION = re.compile(r"[^\w\s]|_")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_text(text):
+    """비교용 정규화 (소문자, 문장부호 제거, 연속 공백을 하나로)"""
+    return _SPACES.sub(" ", _PUNCTUATION.sub(" ", text.lower())).strip()
+
+
+def shingles(text, size):
+    """정규화된 문장의 글자 size-gram 집합 (size보다 짧으면 문장 전체)"""
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def minhash_signature(shingle_set):
+    """
+    shingle 집합의 one permutation MinHash 서명 (SIGNATURE_SIZE개의 32비트 정수)
+
+    shingle마다 crc32에 곱셈 해시를 섞은 값 하나로 칸(상위 비트)과 값(나머지 비트)을 정한다.
+    빈 칸은 _DENSIFY_ORDER 순서로 처음 만나는 채워진 칸의 값에, 몇 번째로 찾았는지를 상위 비트로 더해서 채운다.
+    """
+    bins = [_EMPTY] * SIGNATURE_SIZE
+    for shingle in shingle_set:
+        h = (zlib.crc32(shingle.encode('utf-8')) * 0x9E3779B1) & 0xFFFFFFFF
+        slot = h >> _VALUE_BITS
+        value = h & _VALUE_MASK
+        if value < bins[slot]:
+            bins[slot] = value
+    if _EMPTY in bins:
+        filled = list(bins)
+        for slot in range(SIGNATURE_SIZE):
+            if bins[slot] != _EMPTY:
+                continue
+            for attempt, other in enumerate(_DENSIFY_ORDER[slot], 1):
+                if bins[other] != _EMPTY:
+                    filled[slot] = bins[other] + (attempt << _VALUE_BITS)
+                    break
+        bins = filled
+    return bins
+
+
+def jaccard(a, b):
+    """두 집합의 자카드 유사도"""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def deck_language(path):
+    """덱 파일명의 언어 (EN, KO)"""
+    return Path(path).name.split("_", 1)[0]
+
+
+def _level_order(filename):
+    """덱 파일명의 레벨 순서 (알 수 없는 레벨은 맨 뒤)"""
+    parts = Path(filename).stem.split("_")
+    return LEVELS.index(parts[1]) if len(parts) > 1 and parts[1] in LEVELS else len(LEVELS)
+
+
+def sign_deck_examples(path):
+    """
+    덱 파일 하나의 예문들을 정규화하고 MinHash 서명을 계산 (작업 프로세스에서 실행)
+
+    같은 덱 안에서 정규화 결과가 같은 예문은 서명을 한 번만 계산한다.
+
+    Returns:
+        tuple: ([(항목 번호, ID, 예문, 정규화된 예문)], 항목마다 SIGNATURE_SIZE개씩 이어 붙인 서명 바이트)
+    """
+    size = SHINGLE_SIZES.get(deck_language(path), max(SHINGLE_SIZES.values()))
+    rows = []
+    signatures = array('I')
+    known = {}
+    for index, entry in enumerate(iter_deck_entries(path)):
+        example = entry.get("example") if isinstance(entry, dict) else None
+        if not isinstance(example, str):
+            continue
+        normalized = normalize_text(example)
+        if not normalized:
+            continue
+        signature = known.get(normalized)
+        if signature is None:
+            signature = known[normalized] = minhash_signature(shingles(normalized, size))
+        rows.append((index, entry.get("id"), example, normalized))
+        signatures.extend(signature)
+    return rows, signatures.tobytes()
+
+
+def cluster_examples(texts, signatures, size, threshold=DEFAULT_THRESHOLD):
+    """
+    서로 다른 정규화 예문들을 LSH로 후보를 찾고 자카드 유사도로 확인해서 묶음
+
+    앞에서부터 예문마다 LSH 버킷에서 만난 묶음 대표 예문들과 비교해서, 처음으로 threshold 이상인 대표의 묶음에 넣는다.
+    그런 대표가 없으면 새 묶음의 대표가 된다. 묶음의 모든 예문이 대표와 threshold 이상 비슷하므로,
+    비슷한 예문을 사슬처럼 이어서 관계없는 예문까지 한 묶음이 되는 일이 없다.
+    버킷에는 대표만 넣으므로 중복이 많을수록 비교할 후보도 줄어든다.
+
+    Args:
+        texts (list): 중복 없는 정규화 예문 리스트 (남길 예문이 앞에 오도록 정렬된 순서)
+        signatures (array): texts 순서대로 SIGNATURE_SIZE개씩 이어 붙인 서명
+        size (int): shingle 글자 수
+        threshold (float): 같은 묶음으로 볼 최소 자카드 유사도
+
+    Returns:
+        tuple: (texts 번호별 묶음 대표 번호 리스트, 확인한 후보 쌍 수)
+    """
+    leaders = list(range(len(texts)))
+    buckets = [{} for _ in range(BANDS)]
+    compared = 0
+    min_matches = int((threshold - ESTIMATE_MARGIN) * SIGNATURE_SIZE)
+
+    for item in range(len(texts)):
+        offset = item * SIGNATURE_SIZE
+        item_signature = signatures[offset:offset + SIGNATURE_SIZE]
+        keys = [signatures[start:start + ROWS].tobytes() for start in range(offset, offset + BANDS * ROWS, ROWS)]
+        item_shingles = None
+        checked = set()
+        for band, bucket_key in enumerate(keys):
+            for other in buckets[band].get(bucket_key, ()):
+                if other in checked:
+                    continue
+                checked.add(other)
+                compared += 1
+                other_offset = other * SIGNATURE_SIZE
+                other_signature = signatures[other_offset:other_offset + SIGNATURE_SIZE]
+                if sum(map(operator.eq, item_signature, other_signature)) < min_matches:
+                    continue
+                if item_shingles is None:
+                    item_shingles = shingles(texts[item], size)
+                if jaccard(item_shingles, shingles(texts[other], size)) >= threshold:
+                    leaders[item] = other
+                    break
+            if leaders[item] != item:
+                break
+        else:
+            for band, bucket_key in enumerate(keys):
+                bucket = buckets[band].setdefault(bucket_key, [])
+                if len(bucket) < MAX_BUCKET_SIZE:
+                    bucket.append(item)
+
+    return leaders, compared
+
+
+def find_near_duplicates(paths, threshold=DEFAULT_THRESHOLD, jobs=1):
+    """
+    덱 파일들의 예문에서 중복/유사 예문 묶음을 찾음
+
+    Returns:
+        dict: 언어별 {"examples", "unique", "compared", "clusters"} (clusters는 크기가 큰 순서)
+    """
+    paths = [Path(path) for path in paths]
+    with tracked("sign_deck_examples"):
+        results, timings = map_in_order(sign_deck_examples, paths, jobs)
+
+    # 남길 예문(낮은 레벨 덱의 앞쪽 예문)이 묶음 대표가 되도록 레벨 순서로 처리
+    languages = {}
+    decks = sorted(zip(paths, results), key=lambda deck: (_level_order(deck[0].name), deck[0].name))
+    for path, (rows, signature_bytes) in decks:
+        languages.setdefault(deck_language(path), []).append((path.name, rows, signature_bytes))
+
+    report = {}
+    for language, decks in languages.items():
+        size = SHINGLE_SIZES.get(language, max(SHINGLE_SIZES.values()))
+        with tracked("cluster_examples"):
+            # 1단계: 정규화 결과가 같은 예문은 서명 하나만 남김
+            members = []  # (파일명, 항목 번호, ID, 예문, 정규화 예문 번호)
+            text_ids = {}
+            texts = []
+            signatures = array('I')
+            for filename, rows, signature_bytes in decks:
+                deck_signatures = array('I')
+                deck_signatures.frombytes(signature_bytes)
+                for row, (index, entry_id, example, normalized) in enumerate(rows):
+                    text_id = text_ids.get(normalized)
+                    if text_id is None:
+                        text_id = text_ids[normalized] = len(texts)
+                        texts.append(normalized)
+                        signatures.extend(deck_signatures[row * SIGNATURE_SIZE:(row + 1) * SIGNATURE_SIZE])
+                    members.append((filename, index, entry_id, example, text_id))
+
+            # 2단계: 서로 다른 정규화 예문을 LSH로 묶음
+            leaders, compared = cluster_examples(texts, signatures, size, threshold)
+
+        with tracked("build_clusters"):
+            groups = {}
+            for member in members:
+                groups.setdefault(leaders[member[4]], []).append(member)
+            clusters = [
+                _describe_cluster(group, texts, size)
+                for group in groups.values() if len(group) > 1
+            ]
+            clusters.sort(key=lambda cluster: (-cluster["size"], cluster["keep"]["file"], cluster["keep"]["index"]))
+        report[language] = {
+            "examples": len(members),
+            "unique": len(texts),
+            "compared": compared,
+            "clusters": clusters,
+        }
+
+    if jobs > 1 and paths:
+        print_worker_timings(timings)
+    return report
+
+
+def _describe_cluster(group, texts, size):
+    """묶음 하나를 남길 예문과 바꿀 예문들로 정리 (낮은 레벨 덱의 가장 앞 예문, 곧 묶음 대표를 남김)"""
+    group.sort(key=lambda member: (_level_order(member[0]), member[0], member[1]))
+    keep = group[0]
+    keep_shingles = shingles(texts[keep[4]], size)
+
+    def describe(member):
+        filename, index, entry_id, example, _ = member
+        return {"file": filename, "index": index, "id": entry_id, "example": example}
+
+    duplicates = []
+    for member in group[1:]:
+        similarity = 1.0 if member[4] == keep[4] else jaccard(keep_shingles, shingles(texts[member[4]], size))
+        duplicates.append({**describe(member), "similarity": round(similarity, 3)})
+    return {
+        "size": len(group),
+        "exact": all(member[4] == keep[4] for member in group),
+        "keep": describe(keep),
+        "duplicates": duplicates,
+    }
+
+
+def _location(member):
+    entry_id = f" {{{member['id']}}}" if member["id"] else ""
+    return f"{member['file']}[{member['index']}]{entry_id}"
+
+
+def format_cluster(cluster):
+    """묶음 하나를 보고서 텍스트 줄들로"""
+    kind = "완전 중복" if cluster["exact"] else "유사"
+    lines = [f"묶음 {cluster['size']}개 ({kind})",
+             f"  유지: {_location(cluster['keep'])} {cluster['keep']['example']}"]
+    for member in cluster["duplicates"]:
+        lines.append(f"  교체: {_location(member)} (유사도 {member['similarity']:.2f}) {member['example']}")
+    return lines
+
+
+def format_report(report, threshold):
+    """보고서 딕셔너리를 사람이 읽을 수 있는 텍스트로 변환"""
+    lines = [f"예문 중복/유사 보고서 (자카드 유사도 {threshold} 이상)"]
+    for language, result in report.items():
+        suggested = sum(len(cluster["duplicates"]) for cluster in result["clusters"])
+        lines.append("")
+        lines.append("=" * 80)
+        lines.append(f"[{language}] 예문 {result['examples']:,}개 (정규화 후 서로 다른 예문 {result['unique']:,}개), "
+                     f"묶음 {len(result['clusters']):,}개, 교체 권장 {suggested:,}개")
+        lines.append("=" * 80)
+        for cluster in result["clusters"]:
+            lines.extend(format_cluster(cluster))
+    return "\n".join(lines) + "\n"
+
+
+def write_report(report, threshold, output_dir=None):
+    """보고서를 output_dir에 .txt, .json으로 저장하고 저장한 기본 경로를 반환"""
+    output_dir = Path(output_dir) if output_dir is not None else DEFAULT_OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    base = output_dir / "near_duplicates"
+    document = {
+        "version": REPORT_VERSION,
+        "threshold": threshold,
+        "shingle_sizes": SHINGLE_SIZES,
+        "signature": {"size": SIGNATURE_SIZE, "bands": BANDS, "rows": ROWS},
+        "languages": report,
+    }
+    atomic_write_text(base.with_suffix(".txt"), format_report(report, threshold))
+    atomic_write_text(base.with_suffix(".json"), json.dumps(document, ensure_ascii=False, indent=2))
+    return base
+
+
+def print_summary(report, show=SHOW_CLUSTERS):
+    """언어별 요약과 큰 묶음 몇 개를 출력"""
+    for language, result in report.items():
+        clusters = result["clusters"]
+        exact = sum(1 for cluster in clusters if cluster["exact"])
+        suggested = sum(len(cluster["duplicates"]) for cluster in clusters)
+        print(f"\n[{language}] 예문 {result['examples']:,}개 (서로 다른 예문 {result['unique']:,}개, "
+              f"확인한 후보 쌍 {result['compared']:,}개)")
+        print(f"   묶음 {len(clusters):,}개 (완전 중복 {exact:,}개, 유사 {len(clusters) - exact:,}개), "
+              f"교체 권장 예문 {suggested:,}개")
+        for cluster in clusters[:show]:
+            for line in format_cluster(cluster)[:4]:
+                print(f"   {line}")
+            if cluster["size"] > 3:
+                print(f"     ... 외 {cluster['size'] - 3:,}개")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="덱 예문 중 같거나 거의 같은 예문 묶음 찾기 (MinHash LSH)")
+    parser.add_argument("files", nargs="*", type=Path, help="검사할 덱 파일 (기본값: assets/data의 모든 덱)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"같은 묶음으로 볼 최소 자카드 유사도 (기본값: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_DIR,
+                        help="보고서를 저장할 디렉토리 (기본값: build/near_duplicates)")
+    parser.add_argument("--show", type=int, default=SHOW_CLUSTERS,
+                        help=f"언어별로 출력할 묶음 수 (기본값: {SHOW_CLUSTERS})")
+    add_jobs_argument(parser)
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    if not 0 < args.threshold <= 1:
+        parser.error("--threshold는 0보다 크고 1 이하여야 합니다")
+
+    paths = args.files or deck_files(default_data_dir())
+    with profiled("find_near_duplicates", args.profile), \
+            metered("find_near_duplicates", args.metrics, args.prometheus):
+        report = find_near_duplicates(paths, args.threshold, resolve_jobs(args.jobs))
+        print_summary(report, args.show)
+        with tracked("write_report"):
+            base = write_report(report, args.threshold, args.output)
+    print(f"\n✅ 보고서 저장: {base}.txt, .json")
+
+
+if __name__ == "__main__":
+    main()
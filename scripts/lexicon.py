@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+(단어, 카테고리, 레벨)을 키로 하는 어휘 사전 (scripts/data/lexicon.jsonl)
+
+기존에 스크립트마다 모듈 수준 딕셔너리로 들고 있던 사전 데이터를 하나로 합친 것이다.
+- fix_korean_meanings.KOREAN_MEANINGS -> meaning_ko (레벨/카테고리별)
+- improve_all_examples.EXAMPLE_DATABASE -> example (레벨/카테고리별)
+- update_with_oxford.OXFORD_WORDS -> oxford (레벨/카테고리 안에서의 순서)
+- update_with_oxford.KOREAN_TRANSLATIONS, POS_MAPPING -> 카테고리/레벨이 빈 문자열인 공통 항목의 meaning_ko, pos
+
+한 줄이 항목 하나이고, 같은 단어라도 레벨/카테고리가 다르면 다른 항목이므로 뜻/예문이 서로 덮어쓰지 않는다.
+
+조회할 때는 build/lexicon.idx 인덱스(정렬된 키 -> 줄 위치)를 mmap으로 열어 이진 탐색하고,
+찾은 줄만 JSON으로 읽는다. 그래서 import나 첫 조회 시간이 사전 크기에 비례하지 않는다.
+인덱스는 사전 파일이 바뀌면 첫 조회 때 다시 만든다.
+
+사용 예:
+    python scripts/lexicon.py compile
+    python scripts/lexicon.py get debate --level 표현력확장 --category 일상회화
+    python scripts/lexicon.py stats
+"""
+
+import argparse
+import json
+import mmap
+import struct
+import time
+from pathlib import Path
+
+from atomic_io import atomic_write_bytes
+from deck_io import deck_category
+
+PROJECT_ROOT = Path(__file__).parent.parent
+LEXICON_FILE = Path(__file__).parent / "data" / "lexicon.jsonl"
+INDEX_FILE = PROJECT_ROOT / "build" / "lexicon.idx"
+
+INDEX_MAGIC = b"LEXIDX\x00\x00"
+INDEX_VERSION = 1
+
+# 헤더: 매직, 버전, 항목 수, 사전 파일 크기, 사전 파일 수정 시각(ns), 키 영역 크기
+HEADER = struct.Struct("<8sIIQQQ")
+# 항목: 사전 파일에서의 줄 위치, 줄 길이, 키 영역에서의 키 위치, 키 길이 (키 순서로 정렬)
+ENTRY = struct.Struct("<QIII")
+# 단어 순서: 항목 번호 (단어, 카테고리, 레벨 순서로 정렬)
+POSITION = struct.Struct("<I")
+
+KEY_SEPARATOR = "\x00"
+
+# 공통 항목(레벨/카테고리 구분 없음)의 카테고리/레벨 값
+GENERAL = ""
+
+def make_key(word, category=GENERAL, level=GENERAL):
+    """인덱스 키 (카테고리, 레벨, 단어 순서로 비교되는 UTF-8 바이트열)"""
+    return KEY_SEPARATOR.join((category, level, word)).encode('utf-8')
+
+
+def _split_key(key):
+    category, level, word = key.decode('utf-8').split(KEY_SEPARATOR)
+    return category, level, word
+
+
+def compile_index(source=None, index_file=None):
+    """
+    사전 파일을 읽어서 인덱스 파일을 생성
+
+    Returns:
+        int: 항목 수
+
+    Raises:
+        ValueError: 필수 필드가 없거나 같은 (단어, 카테고리, 레벨) 항목이 두 번 나오는 경우
+    """
+    source = Path(source or LEXICON_FILE)
+    index_file = Path(index_file or INDEX_FILE)
+
+    stat = source.stat()
+    records = []    # (키, 줄 위치, 줄 길이)
+    line_numbers = {}
+    offset = 0
+    with open(source, 'rb') as f:
+        for line_number, line in enumerate(f, 1):
+            length = len(line)
+            if line.strip():
+                record = json.loads(line)
+                if not isinstance(record.get("word"), str) or not record["word"]:
+                    raise ValueError(f"{source.name}:{line_number}: word가 없습니다")
+                key = make_key(record["word"], record.get("category", GENERAL), record.get("level", GENERAL))
+                if key in line_numbers:
+                    raise ValueError(
+                        f"{source.name}:{line_number}: {line_numbers[key]}번 줄과 같은 항목입니다 "
+                        f"({', '.join(repr(part) for part in _split_key(key)[::-1])})"
+                    )
+                line_numbers[key] = line_number
+                records.append((key, offset, length))
+            offset += length
+
+    records.sort()
+    keys = bytearray()
+    entries = bytearray()
+    for key, line_offset, line_length in records:
+        entries += ENTRY.pack(line_offset, line_length, len(keys), len(key))
+        keys += key
+
+    word_order = sorted(range(len(records)), key=lambda position: _split_key(records[position][0])[::-1])
+    positions = b"".join(POSITION.pack(position) for position in word_order)
+
+    header = HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(records), stat.st_size, stat.st_mtime_ns, len(keys))
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(index_file, header + bytes(entries) + positions + bytes(keys))
+    return len(records)
+
+
+def _read_header(index_file):
+    try:
+        with open(index_file, 'rb') as f:
+            data = f.read(HEADER.size)
+    except FileNotFoundError:
+        return None
+    if len(data) != HEADER.size:
+        return None
+    header = HEADER.unpack(data)
+    if header[0] != INDEX_MAGIC or header[1] != INDEX_VERSION:
+        return None
+    return header
+
+
+def index_is_current(source=None, index_file=None):
+    """인덱스가 있고 사전 파일의 크기/수정 시각이 인덱스를 만들 때와 같은지 확인"""
+    header = _read_header(index_file or INDEX_FILE)
+    if header is None:
+        return False
+    stat = Path(source or LEXICON_FILE).stat()
+    return header[3] == stat.st_size and header[4] == stat.st_mtime_ns
+
+
+def _map_file(path):
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class Lexicon:
+    """
+    mmap으로 연 사전 파일과 인덱스
+
+    조회 결과는 사전 파일의 한 줄을 읽은 딕셔너리이고, 읽은 줄은 다시 파싱하지 않도록 보관한다.
+    """
+
+    def __init__(self, source=None, index_file=None):
+        self.source = Path(source or LEXICON_FILE)
+        self.index_file = Path(index_file or INDEX_FILE)
+        if not index_is_current(self.source, self.index_file):
+            compile_index(self.source, self.index_file)
+
+        self._index = _map_file(self.index_file)
+        self._data = _map_file(self.source)
+        _, _, self._count, _, _, _ = HEADER.unpack_from(self._index, 0)
+        self._entries_start = HEADER.size
+        self._positions_start = self._entries_start + ENTRY.size * self._count
+        self._keys_start = self._positions_start + POSITION.size * self._count
+        self._records = {}
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        for mapped in (self._index, self._data):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+
+    def _key(self, position):
+        _, _, key_offset, key_length = ENTRY.unpack_from(self._index, self._entries_start + ENTRY.size * position)
+        start = self._keys_start + key_offset
+        return self._index[start:start + key_length]
+
+    def _record(self, position):
+        record = self._records.get(position)
+        if record is None:
+            line_offset, line_length, _, _ = ENTRY.unpack_from(
+                self._index, self._entries_start + ENTRY.size * position)
+            record = json.loads(self._data[line_offset:line_offset + line_length])
+            self._records[position] = record
+        return record
+
+    def _word_position(self, rank):
+        return POSITION.unpack_from(self._index, self._positions_start + POSITION.size * rank)[0]
+
+    def _bisect_key(self, key):
+        """key 이상인 첫 항목 번호 (키 순서)"""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _bisect_word(self, word):
+        """word 이상인 첫 단어 순서 번호"""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if _split_key(self._key(self._word_position(middle)))[2] < word:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def get(self, word, category=GENERAL, level=GENERAL):
+        """(단어, 카테고리, 레벨)이 정확히 일치하는 항목 (없으면 None, 카테고리 별칭은 사전의 카테고리로 바꿔서 찾음)"""
+        key = make_key(word, deck_category(category), level)
+        position = self._bisect_key(key)
+        if position < self._count and self._key(position) == key:
+            return self._record(position)
+        return None
+
+    def entries_for_word(self, word):
+        """word의 모든 항목 (공통 항목 먼저, 그다음 카테고리/레벨 순서)"""
+        entries = []
+        for rank in range(self._bisect_word(word), self._count):
+            position = self._word_position(rank)
+            if _split_key(self._key(position))[2] != word:
+                break
+            entries.append(self._record(position))
+        return entries
+
+    def context_entries(self, category, level):
+        """카테고리/레벨에 속한 모든 항목 (단어 순서)"""
+        prefix = KEY_SEPARATOR.join((deck_category(category), level, "")).encode('utf-8')
+        entries = []
+        for position in range(self._bisect_key(prefix), self._count):
+            if not self._key(position).startswith(prefix):
+                break
+            entries.append(self._record(position))
+        return entries
+
+    def lookup(self, word, field, category=GENERAL, level=GENERAL, default=None):
+        """
+        word의 field 값을 찾음
+
+        (단어, 카테고리, 레벨) 항목 -> 공통 항목 -> 다른 카테고리/레벨 항목 순서로 찾고,
+        어디에도 없으면 default를 반환한다.
+        """
+        for record in (self.get(word, category, level), self.get(word)):
+            if record is not None and field in record:
+                return record[field]
+        for record in self.entries_for_word(word):
+            if field in record:
+                return record[field]
+        return default
+
+    def oxford_words(self, category, level):
+        """카테고리/레벨의 Oxford 3000 단어 리스트 (oxford 순서)"""
+        entries = [record for record in self.context_entries(category, level) if "oxford" in record]
+        return [record["word"] for record in sorted(entries, key=lambda record: record["oxford"])]
+
+    def contexts(self):
+        """항목이 있는 (카테고리, 레벨) 리스트 (공통 항목 제외)"""
+        contexts = []
+        position = 0
+        while position < self._count:
+            category, level, _ = _split_key(self._key(position))
+            if (category, level) != (GENERAL, GENERAL):
+                contexts.append((category, level))
+            position = self._bisect_key(KEY_SEPARATOR.join((category, level + "\x01", "")).encode('utf-8'))
+        return contexts
+
+
+_LEXICON = None
+
+
+def get_lexicon():
+    """프로세스마다 한 번만 여는 기본 사전 (첫 호출 때 열고, 필요하면 인덱스를 다시 만듦)"""
+    global _LEXICON
+    if _LEXICON is None:
+        _LEXICON = Lexicon()
+    return _LEXICON
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="어휘 사전 인덱스 생성 및 조회")
+    parser.add_argument("--source", type=Path, default=LEXICON_FILE, help="사전 파일 (JSON Lines)")
+    parser.add_argument("--index", type=Path, default=INDEX_FILE, help="인덱스 파일")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("compile", help="인덱스 다시 만들기")
+
+    get_parser = subparsers.add_parser("get", help="단어의 항목 조회")
+    get_parser.add_argument("word")
+    get_parser.add_argument("--level", default=GENERAL)
+    get_parser.add_argument("--category", default=GENERAL)
+
+    subparsers.add_parser("stats", help="항목 수와 조회 시간")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "compile":
+            count = compile_index(args.source, args.index)
+            print(f"✅ 인덱스 생성 완료: {args.index} ({count}개 항목)")
+            return
+
+        start = time.perf_counter()
+        lexicon = Lexicon(args.source, args.index)
+        open_time = time.perf_counter() - start
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+
+    with lexicon:
+        if args.command == "get":
+            if args.level or args.category:
+                record = lexicon.get(args.word, args.category, args.level)
+                entries = [record] if record is not None else []
+            else:
+                entries = lexicon.entries_for_word(args.word)
+            for record in entries:
+                context = f"{record.get('level') or '공통'} {record.get('category') or ''}".strip()
+                fields = ", ".join(f"{field}={record[field]!r}" for field in ("pos", "meaning_ko", "example", "oxford")
+                                   if field in record)
+                print(f"[{context}] {record['word']}: {fields}")
+            print(f"\n총 {len(entries)}개 항목")
+        else:
+            contexts = lexicon.contexts()
+            start = time.perf_counter()
+            for category, level in contexts:
+                lexicon.oxford_words(category, level)
+            scan_time = time.perf_counter() - start
+            print(f"항목 수: {len(lexicon):,} (레벨/카테고리 {len(contexts)}개)")
+            print(f"사전 파일: {args.source.stat().st_size:,} bytes, 인덱스: {args.index.stat().st_size:,} bytes")
+            print(f"열기: {open_time * 1000:.2f} ms, 전체 레벨/카테고리 조회: {scan_time * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
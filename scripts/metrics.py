@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실행 단계별 처리량/자원 사용량을 JSONL(과 Prometheus textfile)로 남기는 --metrics 옵션 공통 유틸리티
+
+    parser = argparse.ArgumentParser(...)
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    with metered("fix_korean_meanings", args.metrics, args.prometheus):
+        ...
+            with tracked("update_deck_file"):
+                ...
+
+기록 하나는 단계(stage) 하나, 또는 단계 안의 덱 하나(deck)에 대한 값이다.
+- entries_in/entries_out: 읽은/내보낸 항목 수
+- bytes_read/bytes_written: 읽은/쓴 바이트 수
+- wall_seconds, cpu_seconds: 경과 시간, CPU 시간 (단계 안에서 끝난 자식 프로세스의 CPU 시간 포함)
+- peak_rss_bytes: 단계가 끝난 시점까지 그 프로세스의 최대 RSS
+- errors: 오류 수 (블록에서 예외가 나면 1 증가)
+
+deck_io의 덱 읽기/쓰기 함수가 항목 수와 바이트 수를 add_counts로 보고하고,
+parallel.map_in_order가 작업마다 덱 단위 기록을 만들므로 (--jobs 작업 프로세스 포함)
+스크립트는 단계만 tracked로 나누면 된다. 열려 있는 모든 단계(바깥 단계 포함)에 합산된다.
+실행 전체는 "main" 단계로 기록된다.
+
+tracked 단계는 --profile의 단계로도 쓰인다 (덱 단위 기록은 프로파일 단계로 나누지 않음).
+--metrics/--prometheus가 없으면 기록을 만들기만 하고 저장하지 않는다.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from atomic_io import atomic_write_text
+from profiling import stage as profile_stage
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+METRICS_VERSION = 1
+DEFAULT_METRICS_FILE = Path(__file__).parent.parent / "build" / "metrics" / "runs.jsonl"
+
+# Prometheus 지표 이름 접두사
+PROMETHEUS_PREFIX = "vocatch"
+
+COUNTERS = ("entries_in", "entries_out", "bytes_read", "bytes_written", "errors")
+
+# (필드, Prometheus 지표 이름, 설명) - 같은 단계/덱의 기록은 합산 (peak_rss_bytes는 최댓값)
+PROMETHEUS_METRICS = [
+    ("entries_in", "stage_entries_in", "단계에서 읽은 항목 수"),
+    ("entries_out", "stage_entries_out", "단계에서 내보낸 항목 수"),
+    ("bytes_read", "stage_bytes_read", "단계에서 읽은 바이트 수"),
+    ("bytes_written", "stage_bytes_written", "단계에서 쓴 바이트 수"),
+    ("wall_seconds", "stage_wall_seconds", "단계 경과 시간(초)"),
+    ("cpu_seconds", "stage_cpu_seconds", "단계 CPU 시간(초)"),
+    ("peak_rss_bytes", "stage_peak_rss_bytes", "단계가 끝난 시점의 프로세스 최대 RSS"),
+    ("errors", "stage_errors", "단계에서 발생한 오류 수"),
+]
+
+# 현재 프로세스에서 열려 있는 기록들 (바깥 단계부터)
+_OPEN = []
+_ACTIVE = None
+
+# 마지막으로 센 예외 (여러 단계를 빠져나가는 예외를 한 번만 세기 위함)
+_counted_error = None
+
+
+def _peak_rss():
+    """현재 프로세스의 최대 RSS (바이트, 알 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _children_cpu():
+    """지금까지 끝난 자식 프로세스들의 CPU 시간 합"""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class StageRecord:
+    """단계(또는 단계 안의 덱) 하나의 측정값"""
+
+    def __init__(self, stage, deck=None):
+        self.stage = stage
+        self.deck = deck
+        self.pid = os.getpid()
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_rss_bytes = None
+
+    def add(self, **counts):
+        """이 기록에만 값을 더함 (바깥 단계에는 더하지 않음)"""
+        for name, value in counts.items():
+            self.counters[name] += value
+
+    def to_dict(self):
+        return {
+            "stage": self.stage,
+            "deck": self.deck,
+            "pid": self.pid,
+            **self.counters,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+
+
+class MetricsRecorder:
+    """실행 하나의 기록들을 모아서 저장하는 객체"""
+
+    def __init__(self, script):
+        self.script = script
+        self.started = datetime.now(timezone.utc)
+        self.run_id = f"{self.started:%Y%m%d-%H%M%S-%f}"
+        self.records = []
+
+    def add(self, record):
+        """끝난 기록(딕셔너리)을 추가"""
+        self.records.append({
+            "version": METRICS_VERSION,
+            "run": self.run_id,
+            "script": self.script,
+            "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            **record,
+        })
+
+    def write_jsonl(self, metrics_file):
+        """기록들을 JSONL 파일 끝에 한 번에 추가"""
+        metrics_file = Path(metrics_file)
+        metrics_file.parent.mkdir(parents=True, exist_ok=True)
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in self.records)
+        with open(metrics_file, 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+    def write_prometheus(self, prometheus_file):
+        """이번 실행의 값을 Prometheus textfile 형식으로 저장 (node_exporter가 반쯤 쓰인 파일을 읽지 않도록 원자적으로 교체)"""
+        prometheus_file = Path(prometheus_file)
+        prometheus_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(prometheus_file, format_prometheus(self.script, self.started, self.records))
+
+
+def _label(value):
+    """Prometheus 레이블 값 이스케이프"""
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _number(value):
+    """Prometheus 샘플 값 (정수는 지수 표기 없이 그대로)"""
+    return str(value) if isinstance(value, int) else f"{value:.6f}"
+
+
+def format_prometheus(script, started, records):
+    """기록들을 단계/덱별로 합쳐서 Prometheus textfile 형식 문자열로 변환"""
+    merged = {}
+    for record in records:
+        key = (record["stage"], record["deck"] or "")
+        entry = merged.setdefault(key, {field: 0 for field, _, _ in PROMETHEUS_METRICS})
+        for field, _, _ in PROMETHEUS_METRICS:
+            value = record[field] or 0
+            entry[field] = max(entry[field], value) if field == "peak_rss_bytes" else entry[field] + value
+
+    lines = []
+    for field, name, description in PROMETHEUS_METRICS:
+        lines.append(f"# HELP {PROMETHEUS_PREFIX}_{name} {description}")
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_{name} gauge")
+        for (stage_name, deck), entry in merged.items():
+            lines.append(f"{PROMETHEUS_PREFIX}_{name}{{script=\"{_label(script)}\",stage=\"{_label(stage_name)}\","
+                         f"deck=\"{_label(deck)}\"}} {_number(entry[field])}")
+    lines.append(f"# HELP {PROMETHEUS_PREFIX}_run_timestamp_seconds 실행 시작 시각 (유닉스 시간)")
+    lines.append(f"# TYPE {PROMETHEUS_PREFIX}_run_timestamp_seconds gauge")
+    lines.append(f"{PROMETHEUS_PREFIX}_run_timestamp_seconds{{script=\"{_label(script)}\"}} {started.timestamp():.3f}")
+    return "\n".join(lines) + "\n"
+
+
+def add_counts(**counts):
+    """열려 있는 모든 기록에 값을 더함 (열린 기록이 없으면 아무 일도 하지 않음)"""
+    for record in _OPEN:
+        record.add(**counts)
+
+
+@contextmanager
+def _measure(record):
+    """with 블록 동안 record를 열어 두고 시간과 자원 사용량을 측정"""
+    global _counted_error
+    wall = time.perf_counter()
+    cpu = time.process_time() + _children_cpu()
+    _OPEN.append(record)
+    try:
+        yield record
+    except BaseException as e:
+        # 바깥 단계들에는 안쪽 단계에서 이미 더했으므로 예외 하나를 한 번만 센다
+        if e is not _counted_error:
+            add_counts(errors=1)
+            _counted_error = e
+        raise
+    finally:
+        _OPEN.remove(record)
+        record.wall_seconds = time.perf_counter() - wall
+        record.cpu_seconds = time.process_time() + _children_cpu() - cpu
+        record.peak_rss_bytes = _peak_rss()
+        if _ACTIVE is not None:
+            _ACTIVE.add(record.to_dict())
+
+
+@contextmanager
+def tracked(stage, deck=None):
+    """
+    with 블록을 stage 단계 (deck이 주어지면 그 덱) 기록으로 측정
+
+    deck 없이 쓰면 --profile의 단계로도 집계된다.
+
+    Yields:
+        StageRecord: 블록 안에서 add로 이 단계에만 값을 더할 수 있는 기록
+    """
+    record = StageRecord(stage, deck)
+    if deck is not None:
+        with _measure(record):
+            yield record
+        return
+    with profile_stage(stage), _measure(record):
+        yield record
+
+
+def merge_worker_record(record):
+    """
+    다른 프로세스에서 끝난 기록(to_dict 결과)을 이 실행에 추가하고, 지금 열린 단계들에 값을 합산
+
+    같은 프로세스의 기록은 이미 반영되어 있으므로 무시한다.
+    """
+    if record["pid"] == os.getpid():
+        return
+    add_counts(**{name: record[name] for name in COUNTERS})
+    if _ACTIVE is not None:
+        _ACTIVE.add(record)
+
+
+def add_metrics_arguments(parser):
+    """argparse 파서에 --metrics, --prometheus 옵션 추가"""
+    parser.add_argument(
+        "--metrics",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_METRICS_FILE,
+        default=None,
+        metavar="FILE",
+        help="단계별 처리량/자원 사용량 기록을 JSONL 파일 FILE 끝에 추가 (기본값: build/metrics/runs.jsonl)",
+    )
+    parser.add_argument(
+        "--prometheus",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="이번 실행의 단계별 값을 Prometheus textfile 형식으로 FILE에 저장 (node_exporter textfile collector용)",
+    )
+
+
+@contextmanager
+def metered(script, metrics_file=None, prometheus_file=None):
+    """
+    with 블록을 "main" 단계로 측정하고, 블록이 끝나면 기록들을 저장하는 컨텍스트 매니저
+
+    블록에서 예외가 나도 그때까지의 기록은 남긴다 (main 단계의 errors가 1 이상이 됨).
+    """
+    global _ACTIVE
+    if (metrics_file is None and prometheus_file is None) or _ACTIVE is not None:
+        yield
+        return
+
+    recorder = MetricsRecorder(script)
+    _ACTIVE = recorder
+    try:
+        with _measure(StageRecord("main")):
+            yield
+    finally:
+        _ACTIVE = None
+        if metrics_file is not None:
+            recorder.write_jsonl(metrics_file)
+        if prometheus_file is not None:
+            recorder.write_prometheus(prometheus_file)
+        saved = ", ".join(str(path) for path in (metrics_file, prometheus_file) if path is not None)
+        print(f"📊 실행 기록 {len(recorder.records)}개 저장: {saved}")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+"1. 문장 2. 문장 3. 문장 ..." 형식의 번호 매긴 텍스트를 한 번만 훑어서 문장 단위로 나누는 토크나이저
+
+숫자가 나올 때마다 문장을 자르던 정규식 대신 기다리던 번호("N.")만 번호 표시로 보기 때문에
+- 문장 안의 숫자("3 PM", "5th floor", "2.5%")에서 문장이 잘리지 않고,
+- 입력 길이에 비례하는 시간으로 동작하며,
+- 파일을 조금씩 읽으면서 문장을 하나씩 내보낸다.
+
+번호 표시는 "N." 앞이 텍스트 시작이거나 공백이고, 뒤가 숫자가 아닌 경우만 인정한다.
+"... at 10. 10. Next"처럼 문장이 다음 번호와 같은 숫자로 끝나면 뒤쪽의 "10."을 번호로 본다.
+"437. ... 440. ... 441."처럼 번호가 빠진 경우에도 다음 번호가 이어지면 번호 표시로 인정한다.
+
+python scripts/numbered_text.py --benchmark 로 기존 정규식 방식과의 처리 시간을 비교할 수 있다.
+"""
+
+import argparse
+import io
+import random
+import re
+import time
+
+# 파싱 규칙이 바뀌면 올린다 (빌드 캐시 키에 포함되어 이전 파싱 결과를 무효화)
+TOKENIZER_VERSION = 2
+
+STREAM_CHUNK_SIZE = 1 << 16
+
+# 문장 하나가 이 글자 수를 넘으면 번호가 어긋난 것으로 보고 오류를 낸다
+MAX_SENTENCE_LENGTH = 1 << 16
+
+# 기존 read_translated_examples의 정규식 (벤치마크 비교용)
+LEGACY_PATTERN = re.compile(r'(\d+)\.\s*([^0-9]+?)(?=\s*\d+\.|$)')
+
+# 번호 표시 후보: 앞이 텍스트 시작이나 공백이고, 뒤에 숫자가 오지 않는 "N."
+MARKER_CANDIDATE = re.compile(r'(?<!\S)(\d{1,9})\.(?!\d)')
+MARKER_MAX_LENGTH = 11
+
+# 번호가 이 개수 이상 한꺼번에 빠진 경우는 번호 표시로 보지 않는다
+MAX_NUMBER_GAP = 100
+
+
+def iter_numbered_sentences(stream, start=1, chunk_size=STREAM_CHUNK_SIZE,
+                            max_sentence_length=MAX_SENTENCE_LENGTH, skipped=None):
+    """
+    번호 매긴 텍스트 스트림에서 (번호, 문장)을 순서대로 내보내는 제너레이터
+
+    후보 "N."를 앞에서부터 한 번씩만 보고 다음 규칙으로 번호 표시인지 정한다.
+    - N이 기다리던 번호이면 번호 표시 (단, 바로 뒤에 같은 "N."이 또 오면 앞의 것은 문장의 끝으로 봄)
+    - N이 기다리던 번호보다 크고 바로 다음 후보가 N+1이면 번호가 빠진 것으로 보고 번호 표시
+    - 그 밖의 "N."은 문장 내용
+
+    Args:
+        stream: read(size)를 지원하는 텍스트 스트림
+        start (int): 첫 번호
+        chunk_size (int): 한 번에 읽는 글자 수
+        max_sentence_length (int): 문장 하나의 최대 길이 (넘으면 번호가 어긋난 것으로 보고 ValueError)
+        skipped (list): 주어지면 빠진 번호들을 추가
+    """
+    buffer = ''
+    eof = False
+    candidates = []    # 아직 판단하지 않은 후보 (시작, 끝, 번호) - 버퍼 기준 위치
+    scan_from = 0      # 후보를 아직 찾지 않은 버퍼 위치
+    number = None      # 현재 문장 번호 (첫 번호 표시를 찾기 전에는 None)
+    expected = start
+    text_start = 0
+
+    while True:
+        # 새로 읽은 부분에서 후보 찾기 (버퍼 끝에 걸친 후보는 다음에 다시 찾음)
+        for match in MARKER_CANDIDATE.finditer(buffer, scan_from):
+            if match.end() >= len(buffer) and not eof:
+                break
+            candidates.append((match.start(), match.end(), int(match.group(1))))
+            scan_from = match.end()
+        scan_from = max(scan_from, len(buffer) - MARKER_MAX_LENGTH, 0) if not eof else len(buffer)
+
+        # 다음 후보까지 보고 판단할 수 있는 후보들 처리
+        position = 0
+        while position < len(candidates) and (eof or position + 1 < len(candidates)):
+            begin, end, value = candidates[position]
+            following = candidates[position + 1] if position + 1 < len(candidates) else None
+            position += 1
+
+            if value == expected:
+                if following and following[2] == value and buffer[end:following[0]].isspace():
+                    continue
+            elif not (expected < value <= expected + MAX_NUMBER_GAP and following and following[2] == value + 1):
+                continue
+            elif skipped is not None:
+                skipped.extend(range(expected, value))
+
+            if number is not None:
+                yield number, buffer[text_start:begin].strip()
+            number = value
+            expected = value + 1
+            text_start = end
+        del candidates[:position]
+
+        if eof:
+            if number is not None:
+                sentence = buffer[text_start:].strip()
+                if sentence:
+                    yield number, sentence
+            return
+
+        if number is not None and len(buffer) - text_start > max_sentence_length:
+            raise ValueError(f"{expected}번 표시를 찾을 수 없습니다 ({number}번 문장 이후)")
+
+        # 처리한 부분을 버퍼에서 제거 (후보 앞 글자 확인용으로 한 글자 남김)
+        keep = min(text_start if number is not None else len(buffer), scan_from,
+                   candidates[0][0] if candidates else len(buffer))
+        drop = keep - 1
+        if drop > chunk_size:
+            buffer = buffer[drop:]
+            text_start -= drop
+            scan_from -= drop
+            candidates = [(begin - drop, end - drop, value) for begin, end, value in candidates]
+
+        chunk = stream.read(chunk_size)
+        if chunk:
+            buffer += chunk
+        else:
+            eof = True
+
+
+def read_numbered_sentences(path, start=1):
+    """번호 매긴 텍스트 파일의 문장들을 리스트로 반환"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [sentence for _, sentence in iter_numbered_sentences(f, start)]
+
+
+def _legacy_parse(content):
+    """기존 정규식 방식 (벤치마크 비교용)"""
+    return [match[1].strip() for match in LEGACY_PATTERN.findall(content) if match[1].strip()]
+
+
+def _make_dump(sentence_count, seed=0):
+    """숫자가 섞인 문장으로 이루어진 번호 매긴 텍스트 생성 (벤치마크용)"""
+    rng = random.Random(seed)
+    words = ["회의는", "오후", "3시에", "시작합니다", "5층", "사무실에서", "만나요", "the", "meeting", "at",
+             "3", "PM", "on", "the", "5th", "floor", "가격이", "2.5%", "올랐습니다", "today"]
+    parts = []
+    for number in range(1, sentence_count + 1):
+        sentence = " ".join(rng.choice(words) for _ in range(rng.randint(4, 12)))
+        parts.append(f"{number}. {sentence}.")
+    return " ".join(parts)
+
+
+def benchmark(sizes=(1_000, 10_000, 100_000, 200_000), repeat=3):
+    """문장 수를 늘려가며 새 토크나이저와 기존 정규식의 처리 시간을 비교"""
+    print(f"{'문장 수':>10} {'크기(KB)':>10} {'토크나이저(s)':>14} {'µs/문장':>9} {'정규식(s)':>10} {'정규식 문장 수':>14}")
+    print("-" * 74)
+    for size in sizes:
+        content = _make_dump(size)
+
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            sentences = [s for _, s in iter_numbered_sentences(io.StringIO(content))]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        if len(sentences) != size:
+            raise ValueError(f"문장 수가 맞지 않습니다: {len(sentences)} != {size}")
+
+        start = time.perf_counter()
+        legacy = _legacy_parse(content)
+        legacy_time = time.perf_counter() - start
+
+        print(f"{size:>10,} {len(content.encode('utf-8')) / 1024:>10,.0f} {best:>14.3f} "
+              f"{best / size * 1e6:>9.2f} {legacy_time:>10.3f} {len(legacy):>14,}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="번호 매긴 텍스트를 문장 단위로 나누기")
+    parser.add_argument("file", nargs="?", help="번호 매긴 텍스트 파일 (예: translate_examples.csv)")
+    parser.add_argument("--benchmark", action="store_true", help="문장 수에 따른 처리 시간 측정")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+        return
+    if not args.file:
+        parser.error("파일 경로나 --benchmark 옵션이 필요합니다")
+
+    with open(args.file, 'r', encoding='utf-8') as f:
+        count = 0
+        for number, sentence in iter_numbered_sentences(f):
+            print(f"{number}. {sentence}")
+            count += 1
+    print(f"\n총 {count}개 문장")
+
+
+if __name__ == "__main__":
+    main()
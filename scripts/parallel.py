@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 단위 작업을 여러 프로세스에 나눠서 실행하는 공통 유틸리티
+
+결과는 항상 입력 순서대로 반환하므로, 병렬 실행 결과를 순서대로 합치면 직렬 실행과 같은 출력이 나온다.
+작업마다 함수 이름을 단계로, 작업 대상 파일명을 덱으로 하는 실행 기록(metrics)을 남긴다.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from metrics import merge_worker_record, tracked
+
+
+def _item_name(item):
+    """실행 기록에 남길 작업 대상 이름 (경로이면 파일명, 튜플이면 첫 번째 값 기준)"""
+    if isinstance(item, tuple) and item:
+        item = item[0]
+    return getattr(item, "name", str(item))
+
+
+def _timed_call(func, item):
+    """func(item)을 실행하고 (결과, 프로세스 ID, 소요 시간, 실행 기록)을 반환"""
+    start = time.perf_counter()
+    with tracked(func.__name__, deck=_item_name(item)) as record:
+        result = func(item)
+    return result, os.getpid(), time.perf_counter() - start, record.to_dict()
+
+
+def map_in_order(func, items, jobs=1):
+    """
+    items 각각에 func를 적용하고 입력 순서대로 결과를 반환
+
+    Args:
+        func (callable): 모듈 최상위에 정의된 함수 (프로세스 간 전달 가능해야 함)
+        items (list): 작업 대상 리스트
+        jobs (int): 작업 프로세스 수 (1 이하이면 현재 프로세스에서 순서대로 실행)
+
+    Returns:
+        tuple: (결과 리스트, 작업별 (프로세스 ID, 소요 시간) 리스트)
+    """
+    items = list(items)
+    if jobs <= 1 or len(items) <= 1:
+        calls = [_timed_call(func, item) for item in items]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as executor:
+            futures = [executor.submit(_timed_call, func, item) for item in items]
+            calls = [future.result() for future in futures]
+
+    # 작업 프로세스의 기록은 여기서 현재 실행에 합침
+    for _, _, _, record in calls:
+        merge_worker_record(record)
+
+    results = [result for result, _, _, _ in calls]
+    timings = [(pid, elapsed) for _, pid, elapsed, _ in calls]
+    return results, timings
+
+
+def print_worker_timings(timings):
+    """작업 프로세스별 처리 개수와 소요 시간을 출력"""
+    workers = {}
+    for pid, elapsed in timings:
+        count, total = workers.get(pid, (0, 0.0))
+        workers[pid] = (count + 1, total + elapsed)
+
+    print(f"\n작업 프로세스별 처리 시간 ({len(workers)}개 프로세스):")
+    for pid, (count, total) in sorted(workers.items()):
+        print(f"  PID {pid}: {count}개 덱, {total:.3f}초")
+
+
+def add_jobs_argument(parser):
+    """argparse 파서에 --jobs 옵션 추가"""
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="병렬로 처리할 프로세스 수 (기본값: 1, 0이면 CPU 코어 수)",
+    )
+
+
+def resolve_jobs(jobs):
+    """--jobs 값을 실제 프로세스 수로 변환 (0이면 CPU 코어 수)"""
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return max(jobs, 1)
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스크립트 실행을 cProfile과 tracemalloc으로 측정하는 --profile 옵션 공통 유틸리티
+
+    parser = argparse.ArgumentParser(...)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    with profiled("fix_korean_meanings", args.profile):
+        ...
+            with stage("read_translated_examples"):
+                ...
+
+--profile을 주면 실행이 끝난 뒤 단계별로
+- 누적 시간 기준 상위 함수 (cProfile)
+- 파일:줄 단위 메모리 할당 상위 위치 (단계 시작 대비 늘어난 크기, tracemalloc)
+- 최대 추적 메모리
+를 출력하고, 같은 내용을 build/profiles/<스크립트>-<시각>.txt, .json으로 저장한다.
+stage로 나누지 않은 부분은 "main" 단계로 집계된다. 단계의 시간과 함수 목록에는 안쪽 단계가 빠지지만,
+할당 위치는 단계 시작과 끝의 차이라서 안쪽 단계에서 남긴 메모리도 포함된다.
+--profile이 없으면 stage는 아무 일도 하지 않는다.
+--jobs로 실행한 작업 프로세스 안의 시간과 메모리는 포함되지 않는다.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from atomic_io import atomic_write_text
+
+REPORT_VERSION = 1
+DEFAULT_PROFILE_DIR = Path(__file__).parent.parent / "build" / "profiles"
+
+# 보고서에 넣는 상위 함수/할당 위치 수
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 15
+
+# tracemalloc이 할당마다 기록하는 호출 스택 깊이
+TRACE_FRAMES = 1
+
+_ACTIVE = None
+
+
+# 할당 위치에서 제외할 측정 도구 자신의 파일
+_OWN_FILES = {tracemalloc.__file__, __file__}
+
+
+def _allocation_diff(after, before):
+    """두 스냅샷의 파일:줄별 할당 차이 (큰 순서, 측정 도구 자신의 할당은 제외)"""
+    statistics = after.compare_to(before, 'lineno')
+    return [statistic for statistic in statistics if statistic.traceback[0].filename not in _OWN_FILES]
+
+
+class _Stage:
+    """단계 하나의 측정 상태"""
+
+    def __init__(self, name):
+        self.name = name
+        self.profile = cProfile.Profile()
+        self.wall = 0.0
+        self.resumed = None
+        self.peak = 0
+        self.snapshot = None
+        self.allocations = []
+
+
+class Profiler:
+    """단계별 cProfile 프로파일과 tracemalloc 결과를 모으는 객체"""
+
+    def __init__(self, script):
+        self.script = script
+        self.stages = []
+        self.stack = []
+        self.started = None
+        self.wall = 0.0
+
+    def _pause(self, current):
+        current.profile.disable()
+        current.wall += time.perf_counter() - current.resumed
+        current.peak = max(current.peak, tracemalloc.get_traced_memory()[1])
+
+    def _resume(self, current):
+        tracemalloc.reset_peak()
+        current.resumed = time.perf_counter()
+        current.profile.enable()
+
+    def enter(self, name):
+        if self.stack:
+            self._pause(self.stack[-1])
+        current = _Stage(name)
+        self.stages.append(current)
+        self.stack.append(current)
+        current.snapshot = tracemalloc.take_snapshot()
+        self._resume(current)
+
+    def exit(self):
+        current = self.stack.pop()
+        self._pause(current)
+        after = tracemalloc.take_snapshot()
+        current.allocations = _allocation_diff(after, current.snapshot)[:TOP_ALLOCATIONS]
+        current.snapshot = None
+        if self.stack:
+            parent = self.stack[-1]
+            parent.peak = max(parent.peak, current.peak)
+            self._resume(parent)
+
+    def start(self):
+        tracemalloc.start(TRACE_FRAMES)
+        self.started = datetime.now(timezone.utc)
+        self.wall = time.perf_counter()
+        self.enter("main")
+
+    def stop(self):
+        while self.stack:
+            self.exit()
+        self.wall = time.perf_counter() - self.wall
+        tracemalloc.stop()
+
+    def report(self):
+        """JSON으로 저장할 보고서 딕셔너리"""
+        # 같은 이름의 단계는 (예: 덱마다 반복) 하나로 합친다
+        merged = {}
+        for current in self.stages:
+            entry = merged.setdefault(current.name, {"stages": [], "wall": 0.0, "peak": 0, "allocations": {}})
+            entry["stages"].append(current)
+            entry["wall"] += current.wall
+            entry["peak"] = max(entry["peak"], current.peak)
+            for statistic in current.allocations:
+                frame = statistic.traceback[0]
+                location = f"{frame.filename}:{frame.lineno}"
+                size, count = entry["allocations"].get(location, (0, 0))
+                entry["allocations"][location] = (size + statistic.size_diff, count + statistic.count_diff)
+
+        stages = []
+        for name, entry in merged.items():
+            stats = pstats.Stats(entry["stages"][0].profile)
+            for current in entry["stages"][1:]:
+                stats.add(current.profile)
+            allocations = sorted(entry["allocations"].items(), key=lambda item: item[1][0], reverse=True)
+            stages.append({
+                "name": name,
+                "runs": len(entry["stages"]),
+                "wall_seconds": round(entry["wall"], 6),
+                "peak_memory_bytes": entry["peak"],
+                "functions": _top_functions(stats),
+                "allocations": [
+                    {"location": location, "size_bytes": size, "count": count}
+                    for location, (size, count) in allocations[:TOP_ALLOCATIONS]
+                ],
+            })
+
+        return {
+            "version": REPORT_VERSION,
+            "script": self.script,
+            "argv": sys.argv[1:],
+            "created": self.started.isoformat(timespec="seconds"),
+            "wall_seconds": round(self.wall, 6),
+            "peak_memory_bytes": max((current.peak for current in self.stages), default=0),
+            "stages": stages,
+        }
+
+
+def _function_name(key):
+    filename, line, name = key
+    if filename == "~":
+        return name
+    return f"{filename}:{line}({name})"
+
+
+def _top_functions(stats):
+    """pstats 결과에서 누적 시간 상위 함수들"""
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    return [
+        {
+            "function": _function_name(key),
+            "calls": calls,
+            "primitive_calls": primitive_calls,
+            "total_seconds": round(total, 6),
+            "cumulative_seconds": round(cumulative, 6),
+        }
+        for key, (primitive_calls, calls, total, cumulative, _) in rows[:TOP_FUNCTIONS]
+    ]
+
+
+def format_report(report):
+    """보고서 딕셔너리를 사람이 읽을 수 있는 텍스트로 변환"""
+    out = io.StringIO()
+    out.write(f"프로파일: {report['script']} {' '.join(report['argv'])}".rstrip() + "\n")
+    out.write(f"전체 {report['wall_seconds']:.3f}초, 최대 추적 메모리 "
+              f"{report['peak_memory_bytes'] / 1024 / 1024:,.1f} MB\n")
+    for current in report["stages"]:
+        runs = f" x{current['runs']}" if current["runs"] > 1 else ""
+        out.write(f"\n{'=' * 80}\n[{current['name']}{runs}] {current['wall_seconds']:.3f}초, "
+                  f"최대 추적 메모리 {current['peak_memory_bytes'] / 1024 / 1024:,.1f} MB\n{'=' * 80}\n")
+        out.write(f"{'누적(s)':>10} {'자체(s)':>10} {'호출 수':>10}  함수\n")
+        for function in current["functions"]:
+            out.write(f"{function['cumulative_seconds']:>10.3f} {function['total_seconds']:>10.3f} "
+                      f"{function['calls']:>10,}  {function['function']}\n")
+        if current["allocations"]:
+            out.write(f"\n{'할당(KB)':>10} {'개수':>10}  위치\n")
+            for allocation in current["allocations"]:
+                out.write(f"{allocation['size_bytes'] / 1024:>10,.1f} {allocation['count']:>10,}  "
+                          f"{allocation['location']}\n")
+    return out.getvalue()
+
+
+def add_profile_argument(parser):
+    """argparse 파서에 --profile 옵션 추가"""
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_PROFILE_DIR,
+        default=None,
+        metavar="DIR",
+        help="cProfile/tracemalloc으로 단계별 시간과 메모리를 측정하고 보고서를 DIR에 저장 (기본값: build/profiles)",
+    )
+
+
+@contextmanager
+def profiled(script, output_dir=None):
+    """
+    output_dir이 주어지면 with 블록을 프로파일링하고 보고서를 출력/저장하는 컨텍스트 매니저
+
+    블록에서 예외가 나도 그때까지의 보고서는 남긴다.
+    """
+    global _ACTIVE
+    if output_dir is None or _ACTIVE is not None:
+        yield
+        return
+
+    profiler = Profiler(script)
+    _ACTIVE = profiler
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        _ACTIVE = None
+        report = profiler.report()
+        text = format_report(report)
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        base_name = f"{script}-{profiler.started:%Y%m%d-%H%M%S}"
+        atomic_write_text(output_dir / f"{base_name}.txt", text)
+        atomic_write_text(output_dir / f"{base_name}.json", json.dumps(report, ensure_ascii=False, indent=2))
+        print("\n" + text)
+        print(f"📊 프로파일 보고서 저장: {output_dir / base_name}.txt, .json")
+
+
+@contextmanager
+def stage(name):
+    """프로파일링 중이면 with 블록을 name 단계로 따로 집계 (아니면 아무 일도 하지 않음)"""
+    profiler = _ACTIVE
+    if profiler is None:
+        yield
+        return
+    profiler.enter(name)
+    try:
+        yield
+    finally:
+        profiler.exit()
+
+
+def best_time(func, repeat):
+    """func를 repeat번 실행해서 가장 짧은 실행 시간(초)을 반환 (compile_* 스크립트의 --benchmark용)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
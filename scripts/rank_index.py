@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+빈도 순위로 정렬한 덱(build/ranked/*.json)의 희소 순위 색인 (.idx) 인코더와 참조 리더
+
+정렬된 덱의 순위가 있는 항목 중 stride번째마다 하나씩 (빈도 순위, 덱 파일 안의 바이트 위치)를 저장한다.
+"순위 X~Y인 항목"은 색인에서 X가 들어갈 위치를 이진 탐색한 뒤, 그 표본의 바이트 위치부터
+덱 파일을 읽어서 순위가 Y를 넘을 때까지만 디코딩한다 (덱 전체를 읽고 거르지 않음).
+
+파일 구조 (리틀 엔디언):
+1. 헤더: magic "RANKIDX\\0", 버전, stride, 덱 수
+2. 덱 테이블: 덱마다 (이름 오프셋 u32, 이름 길이 u32, 항목 수 u32, 순위가 있는 항목 수 u32,
+   표본 위치 u32, 표본 수 u32) - 이름순으로 정렬
+3. 이름 blob: 덱 이름(파일명에서 .json을 뺀 것)의 UTF-8 바이트
+4. 덱마다 표본: 빈도 순위 u32 배열, (8바이트 정렬 후) 바이트 위치 u64 배열
+   -> i번째 표본은 정렬된 덱의 i * stride번째 항목이다.
+"""
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+from deck_io import iter_deck_entries
+
+INDEX_MAGIC = b"RANKIDX\x00"
+INDEX_VERSION = 1
+
+# magic, version, stride, deck_count
+HEADER = struct.Struct("<8sIII")
+# name_offset, name_length, entry_count, ranked_count, samples_offset, sample_count
+DECK = struct.Struct("<IIIIII")
+
+RANK_FIELD = "frequency_rank"
+
+
+def _aligned(size, alignment=8):
+    return (size + alignment - 1) // alignment * alignment
+
+
+def _little_endian(values):
+    """array를 파일에 쓸 리틀 엔디언 바이트열로"""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_array(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def encode_rank_index(decks, stride):
+    """
+    덱별 순위/바이트 위치를 희소 순위 색인 바이트열로 변환
+
+    Args:
+        decks (dict): 덱 이름 -> {"entry_count": 항목 수,
+                      "ranks": 정렬된 덱의 순위가 있는 항목들의 순위 (오름차순),
+                      "offsets": 같은 항목들의 덱 파일 안 바이트 위치}
+        stride (int): 표본 간격 (항목 수)
+    """
+    names = sorted(decks)
+    name_blob = bytearray()
+    name_spans = []
+    for name in names:
+        encoded_name = name.encode('utf-8')
+        name_spans.append((len(name_blob), len(encoded_name)))
+        name_blob += encoded_name
+
+    data_offset = _aligned(HEADER.size + DECK.size * len(names) + len(name_blob))
+    deck_table = bytearray()
+    sections = bytearray()
+    for name, (name_offset, name_length) in zip(names, name_spans):
+        deck = decks[name]
+        ranks = array('I', deck["ranks"][::stride])
+        offsets = array('Q', deck["offsets"][::stride])
+        samples_offset = data_offset + len(sections)
+        sections += _little_endian(ranks)
+        sections += bytes(_aligned(len(sections)) - len(sections))
+        sections += _little_endian(offsets)
+        deck_table += DECK.pack(name_offset, name_length, deck["entry_count"], len(deck["ranks"]),
+                                samples_offset, len(ranks))
+
+    header = HEADER.pack(INDEX_MAGIC, INDEX_VERSION, stride, len(names))
+    head = b"".join((header, deck_table, name_blob))
+    return b"".join((head, bytes(data_offset - len(head)), sections))
+
+
+class RankIndex:
+    """
+    희소 순위 색인 참조 리더
+
+    생성 시 덱마다 표본 배열만 읽어 두고, 조회할 때 이진 탐색으로 읽기 시작할 위치를 찾는다.
+    """
+
+    def __init__(self, data, deck_dir):
+        magic, version, stride, deck_count = HEADER.unpack_from(data, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"순위 색인 형식이 아닙니다 (magic: {bytes(magic)!r})")
+        if version != INDEX_VERSION:
+            raise ValueError(f"지원하지 않는 순위 색인 버전입니다: {version}")
+
+        self.stride = stride
+        self.deck_dir = Path(deck_dir)
+        # 덱 이름 -> (항목 수, 순위가 있는 항목 수, 표본 순위 배열, 표본 바이트 위치 배열)
+        self._decks = {}
+        names_start = HEADER.size + deck_count * DECK.size
+        for i in range(deck_count):
+            name_offset, name_length, entry_count, ranked_count, samples_offset, sample_count = \
+                DECK.unpack_from(data, HEADER.size + i * DECK.size)
+            start = names_start + name_offset
+            name = bytes(data[start:start + name_length]).decode('utf-8')
+            ranks_end = samples_offset + sample_count * 4
+            offsets_start = _aligned(ranks_end)
+            ranks = _read_array('I', data[samples_offset:ranks_end])
+            offsets = _read_array('Q', data[offsets_start:offsets_start + sample_count * 8])
+            self._decks[name] = (entry_count, ranked_count, ranks, offsets)
+
+    @property
+    def decks(self):
+        """색인된 덱 이름 리스트 (이름순)"""
+        return list(self._decks)
+
+    def ranked_count(self, deck):
+        """deck에서 빈도 순위가 있는 항목 수"""
+        return self._decks[deck][1]
+
+    def start_position(self, deck, low):
+        """
+        순위 low 이상인 첫 항목이 들어 있는 구간의 시작 (정렬된 덱 안의 항목 번호, 바이트 위치)
+
+        순위가 low 이상인 항목이 없으면 None.
+        """
+        _, ranked_count, ranks, offsets = self._decks[deck]
+        if not ranked_count:
+            return None
+        sample = bisect_left(ranks, low)
+        # 표본 sample-1과 sample 사이에도 low 이상인 항목이 있을 수 있으므로 한 표본 앞에서 시작
+        sample = max(sample - 1, 0)
+        return sample * self.stride, offsets[sample]
+
+    def entries_in_rank_range(self, deck, low, high):
+        """deck의 정렬된 덱에서 빈도 순위가 low 이상 high 이하인 항목들을 순서대로 반환하는 제너레이터"""
+        start = self.start_position(deck, low)
+        if start is None:
+            return
+        position, offset = start
+        ranked_count = self._decks[deck][1]
+        for entry in iter_deck_entries(self.deck_dir / f"{deck}.json", offset=offset):
+            if position >= ranked_count:
+                return
+            rank = entry[RANK_FIELD]
+            if rank > high:
+                return
+            if rank >= low:
+                yield entry
+            position += 1
+
+
+def read_rank_index(path, deck_dir=None):
+    """순위 색인 파일을 읽어서 RankIndex로 반환 (deck_dir 기본값: 색인 파일이 있는 디렉토리)"""
+    path = Path(path)
+    with open(path, 'rb') as f:
+        return RankIndex(f.read(), deck_dir if deck_dir is not None else path.parent)
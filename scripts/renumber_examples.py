@@ -3,9 +3,15 @@
 텍스트 파일의 예문 넘버링을 파일별에서 전체 넘버링으로 변경하는 스크립트
 """
 
+import argparse
+import os
 import re
 from pathlib import Path
 
+from atomic_io import atomic_write_text, replace_file
+from metrics import add_counts, add_metrics_arguments, metered, tracked
+from profiling import add_profile_argument, profiled
+
 def renumber_examples(input_file, output_file):
     """
     텍스트 파일의 예문 넘버링을 전체 넘버링으로 변경
@@ -17,6 +23,7 @@ def renumber_examples(input_file, output_file):
     
     with open(input_file, 'r', encoding='utf-8') as f:
         lines = f.readlines()
+        add_counts(bytes_read=os.fstat(f.fileno()).st_size)
     
     # 새로운 내용을 저장할 리스트
     new_lines = []
@@ -35,35 +42,44 @@ def renumber_examples(input_file, output_file):
             new_lines.append(line)
     
     # 새로운 파일에 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.writelines(new_lines)
+    # 임시 파일에 쓴 뒤 교체하므로 중단되어도 반쯤 쓰인 파일이 남지 않음
+    output = ''.join(new_lines)
+    atomic_write_text(output_file, output)
+    add_counts(entries_out=example_counter - 1, bytes_written=len(output.encode('utf-8')))
     
     print(f"✅ 완료: {input_file} -> {output_file}")
     print(f"총 {example_counter - 1}개의 예문이 전체 넘버링으로 변경되었습니다.")
 
 def main():
     """메인 함수"""
-    # 파일 경로 설정
-    project_root = Path(__file__).parent.parent
-    input_file = project_root / "all_ko_examples.txt"
-    output_file = project_root / "all_ko_examples_renumbered.txt"
-    
-    if not input_file.exists():
-        print(f"❌ 입력 파일을 찾을 수 없습니다: {input_file}")
-        return
-    
-    print(f"입력 파일: {input_file}")
-    print(f"출력 파일: {output_file}")
-    print("=" * 50)
-    
-    renumber_examples(input_file, output_file)
-    
-    # 원본 파일을 새 파일로 교체
-    print("\n원본 파일을 새 파일로 교체합니다...")
-    input_file.unlink()  # 원본 파일 삭제
-    output_file.rename(input_file)  # 새 파일을 원본 이름으로 변경
+    parser = argparse.ArgumentParser(description="all_ko_examples.txt의 예문을 전체 넘버링으로 변경")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
     
-    print(f"✅ 최종 완료: {input_file}")
+    with profiled("renumber_examples", args.profile), metered("renumber_examples", args.metrics, args.prometheus):
+        # 파일 경로 설정
+        project_root = Path(__file__).parent.parent
+        input_file = project_root / "all_ko_examples.txt"
+        output_file = project_root / "all_ko_examples_renumbered.txt"
+        
+        if not input_file.exists():
+            print(f"❌ 입력 파일을 찾을 수 없습니다: {input_file}")
+            return
+        
+        print(f"입력 파일: {input_file}")
+        print(f"출력 파일: {output_file}")
+        print("=" * 50)
+        
+        with tracked("renumber_examples"):
+            renumber_examples(input_file, output_file)
+        
+        # 원본 파일을 새 파일로 교체
+        print("\n원본 파일을 새 파일로 교체합니다...")
+        with tracked("replace_file"):
+            replace_file(output_file, input_file)  # 원본을 삭제하지 않고 한 번에 교체 (중단되어도 원본이나 새 파일 중 하나는 남음)
+        
+        print(f"✅ 최종 완료: {input_file}")
 
 if __name__ == "__main__":
     main()
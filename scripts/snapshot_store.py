@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 파일의 실행별 스냅샷을 저장하고 복원하는 내용 주소 기반 저장소
+
+구조 (.deck_snapshots/):
+- objects/ab/cdef...: 파일 내용의 sha256 해시를 이름으로 하는 zlib 압축 파일
+  같은 내용은 한 번만 저장되므로, 바뀌지 않은 덱은 스냅샷마다 추가 용량을 차지하지 않는다.
+- runs/<실행 ID>.json: 실행 매니페스트 (실행 이름, 시각, 실행 전/후 파일별 해시)
+
+덱을 저장하는 스크립트는 snapshot_run으로 실행 전후 상태를 기록한다.
+
+사용 예:
+    python scripts/snapshot_store.py list
+    python scripts/snapshot_store.py show latest
+    python scripts/snapshot_store.py restore 20261018-101500
+    python scripts/snapshot_store.py restore latest --before
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from asset_manifest import asset_schema, write_manifest as write_asset_manifest
+from atomic_io import WriteTransaction, atomic_open, atomic_write_bytes, atomic_write_text
+
+MANIFEST_VERSION = 1
+# 파일을 해시/압축할 때 한 번에 읽는 바이트 수 (덱 전체를 메모리에 올리지 않음)
+CHUNK_SIZE = 1 << 20
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_STORE_DIR = PROJECT_ROOT / ".deck_snapshots"
+
+
+def _relative_name(path):
+    """매니페스트에 기록할 경로 (프로젝트 루트 기준, 루트 밖이면 절대 경로)"""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(PROJECT_ROOT.resolve()).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _object_path(store_dir, digest):
+    return Path(store_dir) / "objects" / digest[:2] / digest[2:]
+
+
+def store_object(data, store_dir=None):
+    """
+    바이트열을 저장소에 넣고 sha256 해시를 반환
+
+    Returns:
+        tuple: (해시, 새로 저장한 압축 바이트 수 - 이미 있으면 0)
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    object_path = _object_path(store_dir or DEFAULT_STORE_DIR, digest)
+    if object_path.exists():
+        return digest, 0
+    object_path.parent.mkdir(parents=True, exist_ok=True)
+    compressed = zlib.compress(data, 9)
+    atomic_write_bytes(object_path, compressed)
+    return digest, len(compressed)
+
+
+def _iter_chunks(path):
+    with open(path, 'rb') as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+def store_file(path, store_dir=None):
+    """
+    파일 내용을 저장소에 넣고 sha256 해시를 반환 (store_object와 같지만 CHUNK_SIZE 단위로 스트리밍)
+
+    먼저 해시만 계산해서 이미 있는 객체면 압축하지 않고, 없으면 다시 읽으면서 임시 파일에 압축해 쓴다.
+
+    Returns:
+        tuple: (해시, 새로 저장한 압축 바이트 수 - 이미 있으면 0)
+    """
+    hasher = hashlib.sha256()
+    for chunk in _iter_chunks(path):
+        hasher.update(chunk)
+    digest = hasher.hexdigest()
+    object_path = _object_path(store_dir or DEFAULT_STORE_DIR, digest)
+    if object_path.exists():
+        return digest, 0
+    object_path.parent.mkdir(parents=True, exist_ok=True)
+    compressor = zlib.compressobj(9)
+    size = 0
+    with atomic_open(object_path, 'wb') as f:
+        for chunk in _iter_chunks(path):
+            compressed = compressor.compress(chunk)
+            f.write(compressed)
+            size += len(compressed)
+        compressed = compressor.flush()
+        f.write(compressed)
+        size += len(compressed)
+    return digest, size
+
+
+def load_object(digest, store_dir=None):
+    """해시에 해당하는 내용을 읽어서 반환 (내용이 해시와 다르면 ValueError)"""
+    object_path = _object_path(store_dir or DEFAULT_STORE_DIR, digest)
+    data = zlib.decompress(object_path.read_bytes())
+    if hashlib.sha256(data).hexdigest() != digest:
+        raise ValueError(f"스냅샷 객체가 손상되었습니다: {object_path}")
+    return data
+
+
+def store_files(paths, store_dir=None):
+    """
+    파일들을 저장소에 넣음
+
+    Returns:
+        tuple: ({경로 이름: 해시}, 새로 저장한 압축 바이트 수)
+    """
+    files = {}
+    added = 0
+    for path in paths:
+        path = Path(path)
+        if not path.exists():
+            continue
+        digest, size = store_file(path, store_dir)
+        files[_relative_name(path)] = digest
+        added += size
+    return files, added
+
+
+def write_manifest(label, before, after, store_dir=None):
+    """실행 매니페스트를 저장하고 실행 ID(시각 순으로 정렬되는 "날짜-시각-마이크로초")를 반환"""
+    runs_dir = Path(store_dir or DEFAULT_STORE_DIR) / "runs"
+    runs_dir.mkdir(parents=True, exist_ok=True)
+    created = datetime.now(timezone.utc)
+    run_id = f"{created:%Y%m%d-%H%M%S-%f}"
+    while (runs_dir / f"{run_id}.json").exists():
+        created = datetime.now(timezone.utc)
+        run_id = f"{created:%Y%m%d-%H%M%S-%f}"
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "id": run_id,
+        "label": label,
+        "created": created.isoformat(timespec="seconds"),
+        "before": before,
+        "after": after,
+    }
+    atomic_write_text(runs_dir / f"{run_id}.json", json.dumps(manifest, ensure_ascii=False, indent=2))
+    return run_id
+
+
+@contextmanager
+def snapshot_run(label, paths, store_dir=None):
+    """
+    with 블록 전후의 파일 상태를 하나의 실행 매니페스트로 기록하는 컨텍스트 매니저
+
+    블록 안에서 예외가 나면 매니페스트를 남기지 않는다 (이미 저장한 객체는 다음 스냅샷에서 재사용됨).
+    """
+    paths = [Path(path) for path in paths]
+    before, added_before = store_files(paths, store_dir)
+    yield
+    after, added_after = store_files(paths, store_dir)
+    run_id = write_manifest(label, before, after, store_dir)
+    changed = sum(1 for name, digest in after.items() if before.get(name) != digest)
+    print(f"📸 스냅샷 {run_id}: 파일 {len(after)}개 중 {changed}개 변경, "
+          f"새로 저장한 객체 {added_before + added_after:,} bytes")
+
+
+def list_runs(store_dir=None):
+    """저장된 실행 매니페스트들을 오래된 순서로 반환"""
+    runs_dir = Path(store_dir or DEFAULT_STORE_DIR) / "runs"
+    manifests = []
+    for manifest_file in sorted(runs_dir.glob("*.json")):
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifests.append(json.load(f))
+    return manifests
+
+
+def find_run(run_id, store_dir=None):
+    """실행 ID(앞부분만 써도 됨) 또는 "latest"에 해당하는 매니페스트를 반환"""
+    manifests = list_runs(store_dir)
+    if not manifests:
+        raise ValueError("저장된 스냅샷이 없습니다")
+    if run_id == "latest":
+        return manifests[-1]
+    matches = [manifest for manifest in manifests if manifest["id"].startswith(run_id)]
+    if not matches:
+        raise ValueError(f"스냅샷을 찾을 수 없습니다: {run_id}")
+    if len(matches) > 1:
+        raise ValueError(f"여러 스냅샷이 일치합니다: {', '.join(manifest['id'] for manifest in matches)}")
+    return matches[0]
+
+
+def restore_run(run_id, before=False, store_dir=None):
+    """
+    실행 후(before=True이면 실행 전) 상태로 파일들을 복원
+
+    모든 파일을 하나의 트랜잭션으로 교체하고, 복원 자체도 실행으로 기록되므로 다시 되돌릴 수 있다.
+    덱을 복원하면 그 디렉토리의 에셋 매니페스트(manifest.json)도 함께 갱신한다.
+
+    Returns:
+        list: 내용이 바뀐 파일 경로 리스트
+    """
+    manifest = find_run(run_id, store_dir)
+    files = manifest["before" if before else "after"]
+    targets = {name: (PROJECT_ROOT / name if not Path(name).is_absolute() else Path(name)) for name in files}
+
+    restored = []
+    with snapshot_run(f"restore {manifest['id']}{' --before' if before else ''}", targets.values(), store_dir):
+        with WriteTransaction() as transaction:
+            for name, digest in files.items():
+                path = targets[name]
+                data = load_object(digest, store_dir)
+                if path.exists() and path.read_bytes() == data:
+                    continue
+                path.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write_bytes(path, data, transaction)
+                restored.append(path)
+            # 복원한 덱이 있는 디렉토리의 매니페스트도 같은 트랜잭션으로 갱신
+            for data_dir in sorted({path.parent for path in restored if asset_schema(path.name) == "deck"}):
+                write_asset_manifest(data_dir, transaction)
+    return restored
+
+
+def _print_runs(manifests):
+    print(f"{'실행 ID':<23} {'생성 시각':<26} {'파일':>5} {'변경':>5}  실행")
+    print("-" * 80)
+    for manifest in manifests:
+        before, after = manifest["before"], manifest["after"]
+        changed = sum(1 for name, digest in after.items() if before.get(name) != digest)
+        print(f"{manifest['id']:<23} {manifest['created']:<26} {len(after):>5} {changed:>5}  {manifest['label']}")
+    print(f"\n총 {len(manifests)}개 스냅샷")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="덱 스냅샷 조회 및 복원")
+    parser.add_argument("--store", type=Path, default=DEFAULT_STORE_DIR, help="스냅샷 저장소 디렉토리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="저장된 스냅샷 목록")
+
+    show_parser = subparsers.add_parser("show", help="스냅샷의 파일별 변경 내용")
+    show_parser.add_argument("run_id", help="실행 ID (앞부분만 써도 됨) 또는 latest")
+
+    restore_parser = subparsers.add_parser("restore", help="스냅샷 상태로 파일 복원")
+    restore_parser.add_argument("run_id", help="실행 ID (앞부분만 써도 됨) 또는 latest")
+    restore_parser.add_argument("--before", action="store_true", help="실행 후가 아니라 실행 전 상태로 복원")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "list":
+            _print_runs(list_runs(args.store))
+        elif args.command == "show":
+            manifest = find_run(args.run_id, args.store)
+            print(f"실행: {manifest['label']} ({manifest['id']}, {manifest['created']})")
+            for name, digest in sorted(manifest["after"].items()):
+                status = "변경" if manifest["before"].get(name) != digest else "동일"
+                print(f"  [{status}] {name} {digest[:12]}")
+        else:
+            restored = restore_run(args.run_id, args.before, args.store)
+            for path in restored:
+                print(f"✅ 복원: {_relative_name(path)}")
+            print(f"\n총 {len(restored)}개 파일을 복원했습니다.")
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,94 +8,145 @@ EN 파일의 내용을 KO 파일로 교체하는 스크립트
 3. meaning_en 필드의 값은 EN 파일의 word 값으로 설정
 """
 
-import json
-import os
-import shutil
+import argparse
 from pathlib import Path
 
-def swap_en_ko_files(data_dir):
+from asset_manifest import deck_transaction
+from deck_io import load_deck, stage_deck
+from metrics import add_counts, add_metrics_arguments, metered, tracked
+from parallel import add_jobs_argument, map_in_order, print_worker_timings, resolve_jobs
+from profiling import add_profile_argument, profiled
+from snapshot_store import snapshot_run
+
+def convert_en_to_ko(en_data):
+    """
+    EN 덱 항목 리스트를 KO 덱 항목 리스트로 변환
+    
+    Args:
+        en_data (list): EN 덱 항목 리스트
+    
+    Returns:
+        list: 변환된 KO 덱 항목 리스트
+    """
+    converted_data = []
+    
+    for en_item in en_data:
+        # EN 파일의 word를 meaning_ko로, meaning_ko를 meaning_en으로 변환
+        converted_item = {
+            "word": en_item["meaning_ko"],  # EN의 meaning_ko를 word로
+            "meaning_en": en_item["word"],  # EN의 word를 meaning_en으로
+            "pos": en_item["pos"],
+            "example": en_item["example"],
+            "level": en_item["level"],
+            "category": en_item["category"]
+        }
+        if "id" in en_item:
+            # EN 항목의 ID를 그대로 사용해서 EN/KO 항목을 ID로 연결
+            converted_item = {"id": en_item["id"], **converted_item}
+        converted_data.append(converted_item)
+    
+    return converted_data
+
+def swap_deck_file(en_file):
+    """
+    EN 파일 하나를 대응하는 KO 파일로 변환하여 임시 파일에 저장
+    
+    KO 파일은 메인 프로세스가 모든 파일의 임시 파일을 모은 뒤 한 번에 교체한다.
+    
+    Returns:
+        tuple: (출력할 진행 메시지들, KO 파일 경로, 임시 파일 경로 - 내용이 같으면 None, 오류 여부)
+               메시지는 병렬 실행 시에도 파일 순서대로 출력하기 위해 모아서 반환한다.
+    """
+    ko_filename = en_file.name.replace("EN_", "KO_")
+    ko_file = en_file.parent / ko_filename
+    
+    if not ko_file.exists():
+        return [f"⚠️  해당하는 KO 파일을 찾을 수 없습니다: {ko_filename}"], ko_file, None, False
+    
+    messages = [f"처리 중: {en_file.name} -> {ko_filename}"]
+    staged = None
+    failed = False
+    
+    try:
+        # EN 파일 읽기
+        en_data = load_deck(en_file)
+        
+        # EN 파일의 내용을 KO 파일로 변환
+        converted_data = convert_en_to_ko(en_data)
+        
+        # 변환된 데이터를 KO 파일 옆의 임시 파일에 저장
+        staged = stage_deck(ko_file, converted_data)
+        
+        messages.append(f"  ✅ 완료: {ko_filename}")
+        
+    except Exception as e:
+        add_counts(errors=1)
+        messages.append(f"  ❌ 오류 발생: {e}")
+        failed = True
+    
+    return messages, ko_file, staged, failed
+
+def swap_en_ko_files(data_dir, jobs=1):
     """
     EN 파일과 KO 파일을 교체하는 함수
     
     Args:
         data_dir (str): 데이터 파일들이 있는 디렉토리 경로
+        jobs (int): 병렬로 처리할 프로세스 수
     """
     data_path = Path(data_dir)
     
     # EN 파일들 찾기
-    en_files = list(data_path.glob("EN_*.json"))
+    en_files = sorted(data_path.glob("EN_*.json"))
     
     print(f"발견된 EN 파일 수: {len(en_files)}")
     
-    for en_file in en_files:
-        # 해당하는 KO 파일 찾기
-        ko_filename = en_file.name.replace("EN_", "KO_")
-        ko_file = data_path / ko_filename
-        
-        if not ko_file.exists():
-            print(f"⚠️  해당하는 KO 파일을 찾을 수 없습니다: {ko_filename}")
-            continue
-            
-        print(f"처리 중: {en_file.name} -> {ko_filename}")
-        
-        try:
-            # EN 파일 읽기
-            with open(en_file, 'r', encoding='utf-8') as f:
-                en_data = json.load(f)
-            
-            # KO 파일 읽기
-            with open(ko_file, 'r', encoding='utf-8') as f:
-                ko_data = json.load(f)
-            
-            # EN 파일의 내용을 KO 파일로 변환
-            converted_data = []
-            
-            for en_item in en_data:
-                # EN 파일의 word를 meaning_ko로, meaning_ko를 meaning_en으로 변환
-                converted_item = {
-                    "word": en_item["meaning_ko"],  # EN의 meaning_ko를 word로
-                    "meaning_en": en_item["word"],  # EN의 word를 meaning_en으로
-                    "pos": en_item["pos"],
-                    "example": en_item["example"],
-                    "level": en_item["level"],
-                    "category": en_item["category"]
-                }
-                converted_data.append(converted_item)
-            
-            # 백업 생성
-            backup_file = ko_file.with_suffix('.json.backup')
-            shutil.copy2(ko_file, backup_file)
-            print(f"  백업 생성: {backup_file.name}")
-            
-            # 변환된 데이터를 KO 파일에 저장
-            with open(ko_file, 'w', encoding='utf-8') as f:
-                json.dump(converted_data, f, ensure_ascii=False, indent=2)
-            
-            print(f"  ✅ 완료: {ko_filename}")
-            
-        except Exception as e:
-            print(f"  ❌ 오류 발생: {e}")
-            continue
+    with tracked("swap_deck_file"):
+        results, timings = map_in_order(swap_deck_file, en_files, jobs)
+    
+    # 모든 KO 파일을 함께 반영 (하나라도 실패하면 아무 파일도 바꾸지 않음)
+    # 기존 KO 파일은 스냅샷 저장소에 기록되므로 snapshot_store.py restore로 되돌릴 수 있다.
+    ko_files = [ko_file for _, ko_file, _, _ in results]
+    with tracked("commit"), snapshot_run("swap_en_ko_files", ko_files), deck_transaction(data_path) as transaction:
+        for messages, ko_file, staged, _ in results:
+            for message in messages:
+                print(message)
+            if staged is not None:
+                transaction.add(staged, ko_file)
+        if any(failed for _, _, _, failed in results):
+            transaction.rollback()
+            print("\n❌ 오류가 있어 어떤 파일도 변경하지 않았습니다.")
+            return
     
     print("\n모든 파일 처리가 완료되었습니다!")
+    
+    if jobs > 1:
+        print_worker_timings(timings)
 
 def main():
     """메인 함수"""
-    # 현재 스크립트의 상위 디렉토리에서 assets/data 경로 찾기
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    data_dir = project_root / "assets" / "data"
-    
-    if not data_dir.exists():
-        print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
-        return
-    
-    print(f"데이터 디렉토리: {data_dir}")
-    print("=" * 50)
+    parser = argparse.ArgumentParser(description="EN 파일의 내용을 KO 파일로 교체")
+    add_jobs_argument(parser)
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
     
-    # 자동 실행 (사용자 확인 없이)
-    print("EN 파일을 KO 파일로 교체합니다...")
-    swap_en_ko_files(data_dir)
+    with profiled("swap_en_ko_files", args.profile), metered("swap_en_ko_files", args.metrics, args.prometheus):
+        # 현재 스크립트의 상위 디렉토리에서 assets/data 경로 찾기
+        script_dir = Path(__file__).parent
+        project_root = script_dir.parent
+        data_dir = project_root / "assets" / "data"
+        
+        if not data_dir.exists():
+            print(f"❌ 데이터 디렉토리를 찾을 수 없습니다: {data_dir}")
+            return
+        
+        print(f"데이터 디렉토리: {data_dir}")
+        print("=" * 50)
+        
+        # 자동 실행 (사용자 확인 없이)
+        print("EN 파일을 KO 파일로 교체합니다...")
+        swap_en_ko_files(data_dir, resolve_jobs(args.jobs))
 
 if __name__ == "__main__":
     main()
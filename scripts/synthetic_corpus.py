@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실제 덱과 같은 스키마의 대용량 합성 코퍼스를 만드는 스크립트 (부하 테스트용)
+
+실제 덱(assets/data)과 all_ko_examples.txt에서 분포를 학습한다.
+- 레벨/카테고리별 항목 비율
+- 레벨/카테고리별 (단어, 한국어 뜻, 품사, 항목의 category 값) 조합 (품사 분포, category 값 분포 포함 -
+  뉴스-시사 덱의 항목은 category가 파일명과 다른 "뉴스/회화"로 되어 있음)
+- 레벨/카테고리별 영어/한국어 예문의 단어 수 분포와 첫 단어/중간 단어/마지막 단어 분포
+
+같은 시드와 항목 수로 만들면 항상 같은 파일이 나온다. 출력 디렉토리 구조는 프로젝트와 같다.
+- assets/data/EN_{레벨}_{카테고리}.json, KO_{레벨}_{카테고리}.json (항목 ID 포함)
+- all_ko_examples.txt: 예문 추출 결과 (번역 전 영어 예문, extract_examples.py와 같은 형식)
+- translate_examples.csv: 번역 결과 (KO 덱의 한국어 예문, 번호 매긴 한 줄 형식)
+
+사용 예:
+    python scripts/synthetic_corpus.py 1000000 --seed 42 --output build/synthetic/1m
+    python scripts/synthetic_corpus.py 100000 --no-ids
+"""
+
+import argparse
+import random
+import re
+import time
+from json.encoder import encode_basestring
+from pathlib import Path
+
+from atomic_io import atomic_open
+from deck_io import CATEGORIES, LEVELS, default_data_dir, load_deck
+from entry_ids import format_id_token, make_entry_id
+from metrics import add_metrics_arguments, metered, tracked
+from profiling import add_profile_argument, profiled
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_OUTPUT_DIR = PROJECT_ROOT / "build" / "synthetic"
+
+# all_ko_examples.txt의 파일 구분선과 예문 줄
+SECTION_FILE_PATTERN = re.compile(r'^파일: (KO_.+)\.json$')
+EXAMPLE_LINE_PATTERN = re.compile(r'^\s*\d+\.\s+(?:\{[0-9a-f]+\}\s+)?(.+)$')
+
+# 한 번에 만들어서 파일에 쓰는 항목 수
+WRITE_BATCH_SIZE = 4096
+
+
+def _context_name(level, category):
+    return f"{level}_{category}"
+
+
+def _sentence_model(sentences):
+    """예문들의 단어 수 분포와 위치별 단어 분포 (중복을 유지한 리스트라서 그대로 뽑으면 관측 빈도를 따름)"""
+    model = {"lengths": [], "first": [], "middle": [], "last": []}
+    for sentence in sentences:
+        tokens = sentence.split()
+        if not tokens:
+            continue
+        model["lengths"].append(len(tokens))
+        model["first"].append(tokens[0])
+        model["last"].append(tokens[-1])
+        model["middle"].extend(tokens[1:-1])
+    return model
+
+
+def _read_extracted_examples(txt_file):
+    """all_ko_examples.txt를 {레벨_카테고리: 예문 리스트}로 읽음"""
+    sections = {}
+    current = None
+    with open(txt_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            match = SECTION_FILE_PATTERN.match(line)
+            if match:
+                current = sections.setdefault(match.group(1)[len("KO_"):], [])
+                continue
+            match = EXAMPLE_LINE_PATTERN.match(line)
+            if match and current is not None:
+                current.append(match.group(1).strip())
+    return sections
+
+
+def learn_profile(data_dir=None, txt_file=None):
+    """
+    실제 덱과 all_ko_examples.txt에서 합성에 쓸 분포를 학습
+
+    Returns:
+        dict: {레벨_카테고리: {"share", "vocabulary", "en_examples", "ko_examples"}}
+    """
+    data_dir = Path(data_dir or default_data_dir())
+    txt_file = Path(txt_file or PROJECT_ROOT / "all_ko_examples.txt")
+    extracted = _read_extracted_examples(txt_file) if txt_file.exists() else {}
+
+    contexts = {}
+    total = 0
+    for level in LEVELS:
+        for category in CATEGORIES:
+            name = _context_name(level, category)
+            en_file = data_dir / f"EN_{name}.json"
+            ko_file = data_dir / f"KO_{name}.json"
+            if not en_file.exists():
+                continue
+            en_data = load_deck(en_file)
+            ko_data = load_deck(ko_file) if ko_file.exists() else []
+            contexts[name] = {
+                "level": level,
+                "category": category,
+                "count": len(en_data),
+                "vocabulary": [(item["word"], item["meaning_ko"], item["pos"], item.get("category", category))
+                               for item in en_data],
+                "en_examples": _sentence_model(
+                    [item["example"] for item in en_data] + extracted.get(name, [])),
+                "ko_examples": _sentence_model([item["example"] for item in ko_data]),
+            }
+            total += len(en_data)
+
+    if not total:
+        raise ValueError(f"학습할 EN 덱이 없습니다: {data_dir}")
+    for context in contexts.values():
+        context["share"] = context.pop("count") / total
+    return contexts
+
+
+def _allocate(entries, contexts):
+    """전체 항목 수를 레벨/카테고리 비율대로 나눔 (나머지는 소수 부분이 큰 순서로 배분)"""
+    quotas = {name: entries * context["share"] for name, context in contexts.items()}
+    counts = {name: int(quota) for name, quota in quotas.items()}
+    remainder = entries - sum(counts.values())
+    for name in sorted(quotas, key=lambda name: (counts[name] - quotas[name], name))[:remainder]:
+        counts[name] += 1
+    return counts
+
+
+def _make_sentences(rng, model, count):
+    """학습한 분포로 예문 count개 생성"""
+    lengths = rng.choices(model["lengths"], k=count)
+    firsts = rng.choices(model["first"], k=count)
+    lasts = rng.choices(model["last"], k=count)
+    middles = rng.choices(model["middle"] or model["first"], k=sum(max(length - 2, 0) for length in lengths))
+
+    sentences = []
+    position = 0
+    for length, first, last in zip(lengths, firsts, lasts):
+        if length == 1:
+            sentences.append(last)
+            continue
+        middle_count = length - 2
+        sentences.append(" ".join([first, *middles[position:position + middle_count], last]))
+        position += middle_count
+    return sentences
+
+
+def _render_fields(fields):
+    """
+    덱 저장 형식(json.dumps(..., ensure_ascii=False, indent=2))의 항목 필드 줄들
+
+    항목마다 바뀌지 않는 필드는 미리 만들어 두고 이어 붙여서 항목 하나를 json.dumps 없이 만든다.
+    """
+    return ",\n".join(f'    "{key}": {encode_basestring(value)}' for key, value in fields)
+
+
+def generate_corpus(entries, output_dir=None, seed=0, profile=None, with_ids=True):
+    """
+    언어별 entries개 항목의 합성 코퍼스를 output_dir에 생성
+
+    덱은 WRITE_BATCH_SIZE개씩 만들어서 바로 파일에 쓰므로 메모리 사용량이 항목 수에 비례하지 않는다.
+
+    Returns:
+        dict: 항목 수 ({"EN": EN 항목 수, "KO": KO 항목 수, "sentences": 번역 예문 수})
+    """
+    output_dir = Path(output_dir or DEFAULT_OUTPUT_DIR)
+    profile = profile or learn_profile()
+    data_dir = output_dir / "assets" / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+
+    counts = _allocate(entries, profile)
+    with atomic_open(output_dir / "all_ko_examples.txt") as txt, \
+            atomic_open(output_dir / "translate_examples.csv") as csv:
+        txt.write('\n'.join([
+            "=" * 80,
+            "VOCATCH - 모든 KO 파일의 Example 문장 모음",
+            "=" * 80,
+            f"총 파일 수: {len(profile)}",
+            f"총 예문 수: {entries}",
+            f"생성일: 합성 코퍼스 (seed={seed})",
+            "=" * 80,
+            "",
+        ]))
+        sentence_number = 0
+
+        # all_ko_examples.txt와 같은 파일 이름 순서로 생성
+        for name in sorted(profile):
+            context = profile[name]
+            level = context["level"]
+            count = counts[name]
+            txt.write('\n' + '\n'.join([
+                f"\n{'=' * 80}",
+                f"파일: KO_{name}.json",
+                f"카테고리: {name}",
+                f"예문 수: {count}",
+                f"{'=' * 80}\n",
+            ]))
+
+            occurrences = {}
+            vocabulary_fields = {
+                entry: (
+                    _render_fields([("word", entry[0]), ("meaning_ko", entry[1]), ("pos", entry[2])]),
+                    _render_fields([("word", entry[1]), ("meaning_en", entry[0]), ("pos", entry[2])]),
+                    _render_fields([("level", level), ("category", entry[3])]) + "\n  }",
+                )
+                for entry in set(context["vocabulary"])
+            }
+            with atomic_open(data_dir / f"EN_{name}.json") as en_file, \
+                    atomic_open(data_dir / f"KO_{name}.json") as ko_file:
+                if not count:
+                    en_file.write("[]")
+                    ko_file.write("[]")
+                for start in range(0, count, WRITE_BATCH_SIZE):
+                    batch = min(WRITE_BATCH_SIZE, count - start)
+                    vocabulary = rng.choices(context["vocabulary"], k=batch)
+                    en_examples = _make_sentences(rng, context["en_examples"], batch)
+                    ko_examples = _make_sentences(rng, context["ko_examples"], batch)
+
+                    en_entries = []
+                    ko_entries = []
+                    txt_lines = []
+                    csv_parts = []
+                    for offset, (entry, en_example, ko_example) in enumerate(
+                            zip(vocabulary, en_examples, ko_examples)):
+                        word, entry_category = entry[0], entry[3]
+                        occurrence = occurrences.get((entry_category, word), 0)
+                        occurrences[(entry_category, word)] = occurrence + 1
+                        id_field = "  {\n"
+                        id_token = ""
+                        if with_ids:
+                            # entry_ids.assign_entry_ids와 같이 항목의 category 값으로 ID를 만듦
+                            entry_id = make_entry_id(level, entry_category, word, occurrence)
+                            id_field = f'  {{\n    "id": "{entry_id}",\n'
+                            id_token = f"{format_id_token(entry_id)} "
+
+                        en_fields, ko_fields, context_fields = vocabulary_fields[entry]
+                        en_entries.append(f'{id_field}{en_fields},\n    "example": '
+                                          f'{encode_basestring(en_example)},\n{context_fields}')
+                        ko_entries.append(f'{id_field}{ko_fields},\n    "example": '
+                                          f'{encode_basestring(ko_example)},\n{context_fields}')
+                        txt_lines.append(f"\n{start + offset + 1:3d}. {id_token}{en_example}")
+                        sentence_number += 1
+                        csv_parts.append(f"{sentence_number}. {id_token}{ko_example} ")
+
+                    prefix = "[\n" if start == 0 else ",\n"
+                    en_file.write(prefix + ",\n".join(en_entries))
+                    ko_file.write(prefix + ",\n".join(ko_entries))
+                    txt.write("".join(txt_lines))
+                    csv.write("".join(csv_parts))
+                if count:
+                    en_file.write("\n]")
+                    ko_file.write("\n]")
+
+    return {"EN": entries, "KO": entries, "sentences": sentence_number}
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="실제 덱의 분포를 따르는 합성 코퍼스 생성")
+    parser.add_argument("entries", type=int, help="언어별 항목 수 (EN/KO 덱에 각각 이만큼 생성)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드 (같은 시드면 같은 결과)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_DIR, help="출력 디렉토리")
+    parser.add_argument("--no-ids", action="store_true",
+                        help="항목 ID 없이 생성 (위치 기반으로 번역 예문을 적용하던 기존 형식)")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    if args.output.resolve() == PROJECT_ROOT.resolve():
+        print("❌ 프로젝트 루트에는 생성할 수 없습니다 (실제 덱을 덮어쓰게 됨)")
+        return
+    if args.entries < 0:
+        parser.error("항목 수는 0 이상이어야 합니다")
+
+    with profiled("synthetic_corpus", args.profile), metered("synthetic_corpus", args.metrics, args.prometheus):
+        start = time.perf_counter()
+        with tracked("learn_profile"):
+            profile = learn_profile()
+        learn_time = time.perf_counter() - start
+        print(f"분포 학습 완료: 레벨/카테고리 {len(profile)}개 ({learn_time:.2f}초)")
+
+        start = time.perf_counter()
+        with tracked("generate_corpus"):
+            counts = generate_corpus(args.entries, args.output, args.seed, profile, with_ids=not args.no_ids)
+        elapsed = time.perf_counter() - start
+        rate = (counts["EN"] + counts["KO"]) / elapsed if elapsed > 0 else 0
+        print(f"✅ {args.output}: EN {counts['EN']:,}개, KO {counts['KO']:,}개 항목, 번역 예문 {counts['sentences']:,}개")
+        print(f"생성 시간: {elapsed:.2f}초 ({rate:,.0f} 항목/초)")
+
+
+if __name__ == "__main__":
+    main()
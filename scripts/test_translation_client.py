@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+translation_client.py 일괄 번역 클라이언트를 로컬 대역 서버(translation_stub_server.py)로 확인하는 테스트
+
+대역 서버는 테스트마다 빈 포트(port=0)로 같은 이벤트 루프에서 띄우고,
+서버가 센 연결/요청/문장 수(stub.connections, stub.requests, stub.texts)로 클라이언트 동작을 확인한다.
+
+사용 예:
+    python -m pytest scripts/test_translation_client.py
+    python scripts/test_translation_client.py
+"""
+
+import time
+import unittest
+
+from translation_client import BatchTranslator, TranslationError
+from translation_stub_server import StubTranslationServer, start_stub_server, stub_translate
+
+
+class ScriptedStub(StubTranslationServer):
+    """처음 요청들을 statuses의 응답 코드로 차례로 실패시키고, drop이면 번역을 하나 빼고 응답하는 대역 서버"""
+
+    def __init__(self, statuses=(), drop=False, **options):
+        super().__init__(**options)
+        self.statuses = list(statuses)
+        self.drop = drop
+
+    async def _handle_request(self, method, path, body, writer):
+        if not self.statuses:
+            await super()._handle_request(method, path, body, writer)
+            return
+        self.requests += 1
+        self.failures += 1
+        status = self.statuses.pop(0)
+        extra_headers = ["Retry-After: 0"] if status == 429 else []
+        await self._respond(writer, status, {"message": f"scripted {status}"}, extra_headers)
+
+    async def _respond(self, writer, status, payload, extra_headers=()):
+        if status == 200 and self.drop:
+            payload = {"translations": payload["translations"][:-1]}
+        await super()._respond(writer, status, payload, extra_headers)
+
+
+class BatchTranslatorTest(unittest.IsolatedAsyncioTestCase):
+    """BatchTranslator를 대역 서버로 확인"""
+
+    async def start(self, stub=None, **options):
+        """대역 서버를 띄우고 (서버 상태, 엔드포인트)를 반환 (테스트가 끝나면 닫음)"""
+        stub, server, endpoint = await start_stub_server(port=0, stub=stub, **options)
+
+        async def close():
+            server.close()
+            await server.wait_closed()
+        self.addAsyncCleanup(close)
+        return stub, endpoint
+
+    async def test_keeps_order_and_merges_duplicates(self):
+        stub, endpoint = await self.start()
+        texts = ["b", "a", "b", "c", "a"]
+        async with BatchTranslator(endpoint, "KO") as translator:
+            translations = await translator.translate(texts)
+        self.assertEqual(translations, [stub_translate(text, "KO") for text in texts])
+        self.assertEqual(stub.texts, 3)
+        self.assertEqual(stub.requests, 1)
+
+    async def test_splits_batches_by_size(self):
+        stub, endpoint = await self.start()
+        texts = [f"sentence {number}" for number in range(7)]
+        async with BatchTranslator(endpoint, "KO", batch_size=3) as translator:
+            translations = await translator.translate(texts)
+        self.assertEqual(translations, [stub_translate(text, "KO") for text in texts])
+        self.assertEqual(stub.requests, 3)
+        self.assertEqual(stub.texts, 7)
+
+    async def test_splits_batches_by_bytes(self):
+        stub, endpoint = await self.start()
+        texts = ["x" * 100, "y" * 100, "z" * 100]
+        # text=... 하나가 106바이트이므로 요청마다 문장 하나만 들어감
+        async with BatchTranslator(endpoint, "KO", max_batch_bytes=150) as translator:
+            translations = await translator.translate(texts)
+        self.assertEqual(translations, [stub_translate(text, "KO") for text in texts])
+        self.assertEqual(stub.requests, 3)
+
+    async def test_retries_on_429_using_retry_after(self):
+        stub, endpoint = await self.start(ScriptedStub(statuses=[429, 429]))
+        start = time.perf_counter()
+        # Retry-After: 0을 따르지 않으면 백오프(5초, 10초)만큼 기다리게 됨
+        async with BatchTranslator(endpoint, "KO", backoff=5.0) as translator:
+            translations = await translator.translate(["hello"])
+        self.assertLess(time.perf_counter() - start, 2.0)
+        self.assertEqual(translations, [stub_translate("hello", "KO")])
+        self.assertEqual(stub.requests, 3)
+        self.assertEqual(translator.stats.retries, 2)
+
+    async def test_retries_on_503_with_backoff(self):
+        stub, endpoint = await self.start(ScriptedStub(statuses=[503]))
+        async with BatchTranslator(endpoint, "KO", backoff=0.01) as translator:
+            translations = await translator.translate(["hello"])
+        self.assertEqual(translations, [stub_translate("hello", "KO")])
+        self.assertEqual(stub.requests, 2)
+        self.assertEqual(translator.stats.retries, 1)
+
+    async def test_gives_up_after_retries(self):
+        stub, endpoint = await self.start(ScriptedStub(statuses=[503] * 3))
+        async with BatchTranslator(endpoint, "KO", retries=2, backoff=0.01) as translator:
+            with self.assertRaises(TranslationError) as context:
+                await translator.translate(["hello"])
+        self.assertEqual(context.exception.status, 503)
+        self.assertEqual(stub.requests, 3)
+
+    async def test_does_not_retry_400(self):
+        stub, endpoint = await self.start()
+        # target_lang이 비어 있으면 대역 서버는 400으로 거부
+        async with BatchTranslator(endpoint, "", backoff=0.01) as translator:
+            with self.assertRaises(TranslationError) as context:
+                await translator.translate(["hello"])
+        self.assertEqual(context.exception.status, 400)
+        self.assertEqual(stub.requests, 1)
+        self.assertEqual(translator.stats.retries, 0)
+
+    async def test_does_not_retry_413(self):
+        stub, endpoint = await self.start(max_texts=2)
+        async with BatchTranslator(endpoint, "KO", batch_size=3, backoff=0.01) as translator:
+            with self.assertRaises(TranslationError) as context:
+                await translator.translate(["a", "b", "c"])
+        self.assertEqual(context.exception.status, 413)
+        self.assertEqual(stub.requests, 1)
+        self.assertEqual(stub.texts, 0)
+
+    async def test_rejects_mismatched_translation_count(self):
+        stub, endpoint = await self.start(ScriptedStub(drop=True))
+        async with BatchTranslator(endpoint, "KO") as translator:
+            with self.assertRaises(TranslationError):
+                await translator.translate(["a", "b"])
+        self.assertEqual(stub.requests, 1)
+
+    async def test_partial_keeps_successful_batches(self):
+        stub, endpoint = await self.start(ScriptedStub(statuses=[400]))
+        async with BatchTranslator(endpoint, "KO", batch_size=2, concurrency=1) as translator:
+            translations, failures = await translator.translate_partial(["a", "b", "c", "d"])
+        self.assertEqual(translations, [None, None, stub_translate("c", "KO"), stub_translate("d", "KO")])
+        self.assertEqual([batch for batch, _ in failures], [["a", "b"]])
+        self.assertEqual(stub.requests, 2)
+
+    async def test_connections_stay_within_pool_size(self):
+        stub, endpoint = await self.start(latency=0.01)
+        texts = [f"sentence {number}" for number in range(20)]
+        async with BatchTranslator(endpoint, "KO", batch_size=1, concurrency=8, pool_size=2) as translator:
+            translations = await translator.translate(texts)
+        self.assertEqual(translations, [stub_translate(text, "KO") for text in texts])
+        self.assertEqual(stub.requests, 20)
+        self.assertLessEqual(stub.connections, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
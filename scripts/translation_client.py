@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeepL 형식(/v2/translate) 번역 API의 asyncio 일괄 번역 클라이언트 (표준 라이브러리 스트림만 사용)
+
+- 연결 풀: HTTP/1.1 keep-alive 연결을 pool_size개까지 열어 두고 요청마다 재사용한다
+- 일괄 요청: 문장 여러 개를 한 요청의 text 파라미터로 보낸다 (batch_size개, max_batch_bytes 이하)
+- 동시 요청 제한: 세마포어로 동시에 처리 중인 요청을 concurrency개로 제한한다
+- 재시도: 429/5xx와 연결 오류는 지수 백오프(+지터, Retry-After가 있으면 그 시간)로 retries번까지 다시 보낸다
+- 요청별 지연 시간 통계 (LatencyStats)
+
+같은 문장은 한 번만 번역한다. translate_partial은 일부 묶음이 실패해도 성공한 번역과 실패한 묶음을 함께 돌려준다.
+로컬 대역 서버는 translation_stub_server.py에 있다.
+"""
+
+import asyncio
+import json
+import random
+import ssl
+import time
+from urllib.parse import urlencode, urlsplit
+
+# DeepL 제한: 요청당 text 50개, 요청 본문 128 KiB
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_BATCH_BYTES = 128 * 1024
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RETRIES = 4
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+DEFAULT_TIMEOUT = 30.0
+
+# 다시 보내면 성공할 수 있는 응답 코드 (456: DeepL 사용량 초과는 재시도하지 않음)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TranslationError(Exception):
+    """번역 요청이 (재시도 후에도) 실패했을 때"""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def make_batches(texts, batch_size=DEFAULT_BATCH_SIZE, max_batch_bytes=DEFAULT_MAX_BATCH_BYTES):
+    """
+    문장 리스트를 요청 단위로 나눔 (요청마다 batch_size개 이하, 인코딩한 text 파라미터 합이 max_batch_bytes 이하)
+
+    Returns:
+        list: 문장 리스트의 리스트 (원래 순서 유지)
+    """
+    batches = []
+    batch = []
+    size = 0
+    for text in texts:
+        text_size = len(urlencode({"text": text})) + 1
+        if batch and (len(batch) >= batch_size or size + text_size > max_batch_bytes):
+            batches.append(batch)
+            batch = []
+            size = 0
+        batch.append(text)
+        size += text_size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _percentile(sorted_values, fraction):
+    """정렬된 값들의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), round(fraction * len(sorted_values) + 0.5)))
+    return sorted_values[rank - 1]
+
+
+class LatencyStats:
+    """요청별 지연 시간, 문장 수, 재시도 수 기록"""
+
+    def __init__(self):
+        self.latencies = []
+        self.texts = 0
+        self.retries = 0
+        self.failures = 0
+        self.connections = 0
+        self.started = time.perf_counter()
+
+    def record(self, seconds, texts):
+        self.latencies.append(seconds)
+        self.texts += texts
+
+    def summary(self):
+        """통계 요약 dict (지연 시간은 초)"""
+        values = sorted(self.latencies)
+        elapsed = time.perf_counter() - self.started
+        return {
+            "requests": len(values),
+            "texts": self.texts,
+            "retries": self.retries,
+            "failures": self.failures,
+            "connections": self.connections,
+            "p50": _percentile(values, 0.50),
+            "p95": _percentile(values, 0.95),
+            "p99": _percentile(values, 0.99),
+            "max": values[-1] if values else 0.0,
+            "mean": sum(values) / len(values) if values else 0.0,
+            "elapsed": elapsed,
+            "texts_per_second": self.texts / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def format_summary(self):
+        """통계를 사람이 읽는 여러 줄 문자열로"""
+        s = self.summary()
+        return (
+            f"요청 {s['requests']:,}개 (문장 {s['texts']:,}개), 재시도 {s['retries']}번, 실패 {s['failures']}번, "
+            f"연결 {s['connections']}개\n"
+            f"지연 시간 p50 {s['p50'] * 1000:.1f}ms, p95 {s['p95'] * 1000:.1f}ms, p99 {s['p99'] * 1000:.1f}ms, "
+            f"최대 {s['max'] * 1000:.1f}ms (평균 {s['mean'] * 1000:.1f}ms)\n"
+            f"처리량 {s['texts_per_second']:,.0f} 문장/초 ({s['elapsed']:.2f}s)"
+        )
+
+
+class ConnectionPool:
+    """
+    한 호스트에 대한 HTTP/1.1 keep-alive 연결 풀
+
+    쉬고 있는 연결이 있으면 재사용하고, 없으면 size개까지 새로 연다.
+    서버가 연결을 닫았거나 응답을 끝까지 읽지 못한 연결은 풀에 돌려놓지 않는다.
+    """
+
+    def __init__(self, url, size, stats=None, timeout=DEFAULT_TIMEOUT):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"http/https URL이어야 합니다: {url}")
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.timeout = timeout
+        self._idle = []
+        self._slots = asyncio.Semaphore(size)
+        self._stats = stats
+
+    async def acquire(self):
+        """(reader, writer) 연결을 빌림 (release로 돌려줘야 함)"""
+        await self._slots.acquire()
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+        try:
+            connection = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, ssl=self.ssl), self.timeout)
+        except BaseException:
+            self._slots.release()
+            raise
+        if self._stats is not None:
+            self._stats.connections += 1
+        return connection
+
+    def release(self, connection, reusable):
+        """빌린 연결을 돌려줌 (reusable이 아니면 닫음)"""
+        reader, writer = connection
+        if reusable and not reader.at_eof() and not writer.is_closing():
+            self._idle.append(connection)
+        else:
+            writer.close()
+        self._slots.release()
+
+    async def close(self):
+        """쉬고 있는 연결을 모두 닫음"""
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+
+async def _read_response(reader):
+    """
+    HTTP/1.1 응답 하나를 읽음 (Content-Length 또는 chunked 본문)
+
+    Returns:
+        tuple: (상태 코드, 헤더 dict - 소문자 키, 본문 바이트열, 연결을 계속 쓸 수 있는지)
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("서버가 응답 없이 연결을 닫았습니다")
+    parts = status_line.decode('latin-1').split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise ConnectionError(f"잘못된 HTTP 응답입니다: {status_line[:80]!r}")
+    status = int(parts[1])
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode('latin-1').partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b"".join(chunks)
+        reusable = True
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+        reusable = True
+    else:
+        body = await reader.read()
+        reusable = False
+    if headers.get("connection", "").lower() == "close" or parts[0] == "HTTP/1.0":
+        reusable = False
+    return status, headers, body, reusable
+
+
+class BatchTranslator:
+    """
+    DeepL 형식 번역 API의 asyncio 일괄 번역 클라이언트
+
+    async with BatchTranslator(...) as translator:
+        translations = await translator.translate(texts)
+    """
+
+    def __init__(self, endpoint, target_lang, auth_key=None, source_lang=None,
+                 batch_size=DEFAULT_BATCH_SIZE, max_batch_bytes=DEFAULT_MAX_BATCH_BYTES,
+                 concurrency=DEFAULT_CONCURRENCY, pool_size=None, retries=DEFAULT_RETRIES,
+                 backoff=DEFAULT_BACKOFF, timeout=DEFAULT_TIMEOUT, seed=None):
+        parts = urlsplit(endpoint)
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self.host_header = parts.netloc
+        self.target_lang = target_lang
+        self.source_lang = source_lang
+        self.auth_key = auth_key
+        self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.stats = LatencyStats()
+        self._limit = asyncio.Semaphore(concurrency)
+        self._pool = ConnectionPool(endpoint, pool_size or concurrency, self.stats, timeout)
+        self._random = random.Random(seed)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self._pool.close()
+
+    def _request_bytes(self, batch):
+        params = [("text", text) for text in batch] + [("target_lang", self.target_lang)]
+        if self.source_lang:
+            params.append(("source_lang", self.source_lang))
+        body = urlencode(params).encode('utf-8')
+        headers = [
+            f"POST {self.path} HTTP/1.1",
+            f"Host: {self.host_header}",
+            "Content-Type: application/x-www-form-urlencoded",
+            f"Content-Length: {len(body)}",
+            "Connection: keep-alive",
+        ]
+        if self.auth_key:
+            headers.append(f"Authorization: DeepL-Auth-Key {self.auth_key}")
+        return ("\r\n".join(headers) + "\r\n\r\n").encode('latin-1') + body
+
+    async def _send(self, batch):
+        """요청 한 번 (연결 하나를 빌려서 보내고 응답을 읽음)"""
+        connection = await self._pool.acquire()
+        reusable = False
+        try:
+            reader, writer = connection
+            writer.write(self._request_bytes(batch))
+            await writer.drain()
+            status, headers, body, reusable = await asyncio.wait_for(_read_response(reader), self.timeout)
+            return status, headers, body
+        finally:
+            self._pool.release(connection, reusable)
+
+    def _delay(self, attempt, headers):
+        """attempt번째 재시도 전 대기 시간 (Retry-After가 있으면 그 값, 없으면 지수 백오프 + 지터)"""
+        retry_after = headers.get("retry-after") if headers else None
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_BACKOFF)
+            except ValueError:
+                pass
+        base = min(self.backoff * (2 ** attempt), MAX_BACKOFF)
+        return base / 2 + self._random.uniform(0, base / 2)
+
+    async def translate_batch(self, batch):
+        """
+        문장 묶음 하나를 번역 (동시 요청 수 제한, 실패하면 재시도)
+
+        Raises:
+            TranslationError: 재시도해도 실패했거나 재시도할 수 없는 응답일 때
+        """
+        async with self._limit:
+            for attempt in range(self.retries + 1):
+                start = time.perf_counter()
+                headers = None
+                try:
+                    status, headers, body = await self._send(batch)
+                except (ConnectionError, OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+                    error = TranslationError(f"연결 오류: {e!r}")
+                else:
+                    if status == 200:
+                        self.stats.record(time.perf_counter() - start, len(batch))
+                        try:
+                            translations = [item["text"] for item in json.loads(body)["translations"]]
+                        except (ValueError, KeyError, TypeError) as e:
+                            self.stats.failures += 1
+                            raise TranslationError(
+                                f"응답 형식이 잘못되었습니다 ({e!r}): {body[:200].decode('utf-8', 'replace')}", status
+                            ) from e
+                        if len(translations) != len(batch):
+                            self.stats.failures += 1
+                            raise TranslationError(f"번역 수가 요청한 문장 수와 다릅니다: {len(translations)}/{len(batch)}")
+                        return translations
+                    error = TranslationError(f"HTTP {status}: {body[:200].decode('utf-8', 'replace')}", status)
+                    if status not in RETRY_STATUSES:
+                        self.stats.failures += 1
+                        raise error
+                if attempt == self.retries:
+                    self.stats.failures += 1
+                    raise error
+                self.stats.retries += 1
+                await asyncio.sleep(self._delay(attempt, headers))
+
+    async def translate_partial(self, texts):
+        """
+        문장 리스트를 번역 (같은 문장은 한 번만 요청)
+
+        한 묶음이 재시도 후에도 실패해도 나머지 묶음은 끝까지 번역한다.
+
+        Returns:
+            tuple: (texts와 같은 순서의 번역 리스트 - 실패한 묶음의 문장은 None,
+                    [(실패한 묶음의 문장 리스트, TranslationError)])
+        """
+        unique = list(dict.fromkeys(texts))
+        batches = make_batches(unique, self.batch_size, self.max_batch_bytes)
+        tasks = [asyncio.ensure_future(self.translate_batch(batch)) for batch in batches]
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        except BaseException:
+            # 바깥에서 취소되면 남은 요청도 취소하고 끝날 때까지 기다림
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        translated = {}
+        failures = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, TranslationError):
+                failures.append((batch, result))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                translated.update(zip(batch, result))
+        return [translated.get(text) for text in texts], failures
+
+    async def translate(self, texts):
+        """
+        문장 리스트를 번역해서 같은 순서의 번역 리스트로 반환 (같은 문장은 한 번만 요청)
+
+        Raises:
+            TranslationError: 어떤 묶음이라도 실패했을 때 (첫 번째로 실패한 묶음의 오류)
+        """
+        translations, failures = await self.translate_partial(texts)
+        if failures:
+            raise failures[0][1]
+        return translations
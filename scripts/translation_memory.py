@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+예문 번역 메모리 (SQLite)
+
+한 번 번역한 예문(영어 원문 -> 한국어 번역)을 기억해서, 덱을 다시 만들 때 이미 번역한 문장은
+번역 파일로 내보내지 않고 바로 채울 수 있게 한다.
+- 키는 정규화한 원문(NFKC, 대소문자 무시, 공백 하나로)의 sha256이라 공백/대소문자만 다른 문장은 같은 문장이다.
+- 정확히 같은 원문이 없으면 원문 3글자 조각(trigram)의 Dice 계수로 비슷한 원문의 번역을 찾는다 (참고용).
+  trigram마다 그 조각이 든 원문 수를 기록해 두고, 후보는 드문 trigram들로만 찾는다 (prefix filtering).
+- 번역문의 해시도 저장해서, 덱 예문이 이미 번역된 문장인지 확인할 수 있다.
+
+extract_examples.py --tm은 번역 메모리에 있는 예문을 내보내지 않고,
+update_ko_examples.py --tm은 새 번역을 번역 메모리에 기록한 뒤 번역 메모리로 남은 예문을 채운다.
+
+사용 예:
+    python scripts/translation_memory.py stats
+    python scripts/translation_memory.py lookup "Let's go to the airport early."
+"""
+
+import argparse
+import math
+import sqlite3
+import unicodedata
+from datetime import datetime, timezone
+from pathlib import Path
+
+from build_cache import bytes_hash
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE translations (
+    id INTEGER PRIMARY KEY,
+    source_hash TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    target_hash TEXT NOT NULL,
+    trigram_count INTEGER NOT NULL,
+    updated TEXT NOT NULL
+);
+CREATE INDEX translations_target ON translations (target_hash);
+
+CREATE TABLE trigrams (
+    trigram TEXT NOT NULL,
+    translation_id INTEGER NOT NULL,
+    PRIMARY KEY (trigram, translation_id)
+) WITHOUT ROWID;
+
+CREATE TABLE trigram_counts (
+    trigram TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+# 비슷한 원문으로 볼 trigram Dice 계수 하한
+DEFAULT_FUZZY_THRESHOLD = 0.7
+
+
+def default_tm_file():
+    """번역 메모리 파일 경로 (프로젝트 루트의 .translation_memory.sqlite)"""
+    return Path(__file__).parent.parent / ".translation_memory.sqlite"
+
+
+def normalize_sentence(text):
+    """비교용으로 정규화한 문장 (NFKC, 대소문자 무시, 연속 공백은 하나로)"""
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def sentence_hash(text):
+    """정규화한 문장의 sha256 (번역 메모리 키)"""
+    return bytes_hash(normalize_sentence(text).encode('utf-8'))
+
+
+def trigrams(normalized):
+    """정규화한 문장의 3글자 조각 집합 (앞뒤에 공백을 붙여서 짧은 문장도 조각이 나오게 함)"""
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TranslationMemory:
+    """
+    SQLite 번역 메모리
+
+    with 블록으로 쓰면 블록이 예외 없이 끝날 때 커밋하고 닫는다.
+    readonly=True이면 파일을 읽기 전용으로 연다 (병렬 작업 프로세스에서 동시에 조회할 때).
+    """
+
+    def __init__(self, db_file, readonly=False):
+        db_path = Path(db_file)
+        if readonly:
+            if not db_path.exists():
+                raise FileNotFoundError(f"번역 메모리 파일이 없습니다: {db_path}")
+            self._conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path)
+
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == 0 and not readonly:
+            self._conn.executescript(SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        elif version != SCHEMA_VERSION:
+            self._conn.close()
+            raise ValueError(f"지원하지 않는 번역 메모리 스키마 버전입니다: {version}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self._conn.commit()
+        self.close()
+
+    def close(self):
+        """연결을 닫음 (커밋하지 않은 기록은 버림)"""
+        self._conn.close()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def lookup(self, source):
+        """원문과 (정규화해서) 같은 문장의 번역 (없으면 None)"""
+        row = self._conn.execute(
+            "SELECT target FROM translations WHERE source_hash = ?", (sentence_hash(source),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def is_translation(self, text):
+        """text가 번역 메모리에 있는 번역문인지 확인 (이미 번역된 예문)"""
+        row = self._conn.execute(
+            "SELECT 1 FROM translations WHERE target_hash = ? LIMIT 1", (sentence_hash(text),)
+        ).fetchone()
+        return row is not None
+
+    def fuzzy_lookup(self, source, threshold=DEFAULT_FUZZY_THRESHOLD, limit=3):
+        """
+        원문과 비슷한 원문들의 번역 (trigram Dice 계수가 threshold 이상, 높은 순)
+
+        Dice 계수가 threshold 이상이려면 trigram 수가 질의의 t/(2-t) ~ (2-t)/t배 안에 있고
+        질의 trigram 중 최소 ceil(t * n / (2-t))개를 공유해야 한다. 그러므로 질의 trigram을 드문 순서로
+        정렬했을 때 앞의 (n - 최소 공유 수 + 1)개 중 하나는 반드시 공유하므로, 그 조각들로만 후보를 찾고
+        후보마다 공유 trigram 수를 센다.
+
+        Returns:
+            list: (유사도, 원문, 번역) 리스트
+        """
+        query = trigrams(normalize_sentence(source))
+        if not query or not 0 < threshold <= 1:
+            return []
+        count = len(query)
+        frequencies = dict(self._conn.execute(
+            f"SELECT trigram, count FROM trigram_counts WHERE trigram IN ({', '.join('?' * count)})", tuple(query)
+        ).fetchall())
+        min_shared = math.ceil(threshold * count / (2 - threshold) - 1e-9)
+        rare = sorted(query, key=lambda gram: frequencies.get(gram, 0))[:count - min_shared + 1]
+        rare = [gram for gram in rare if gram in frequencies]
+        if not rare:
+            return []
+
+        rows = self._conn.execute(
+            f"""
+            SELECT t.id, t.source, t.target, t.trigram_count FROM translations t
+            WHERE t.id IN (SELECT translation_id FROM trigrams WHERE trigram IN ({', '.join('?' * len(rare))}))
+              AND t.trigram_count BETWEEN ? AND ?
+            """,
+            (*rare, count * threshold / (2 - threshold), count * (2 - threshold) / threshold),
+        ).fetchall()
+        matches = []
+        for _, row_source, target, trigram_count in rows:
+            score = 2 * len(query & trigrams(normalize_sentence(row_source))) / (count + trigram_count)
+            if score >= threshold:
+                matches.append((score, row_source, target))
+        matches.sort(key=lambda match: (-match[0], match[1]))
+        return matches[:limit]
+
+    def add(self, source, target):
+        """
+        번역 하나를 기록 (같은 원문이 있으면 번역을 바꿈)
+
+        Returns:
+            str: "added", "updated", "unchanged" 중 하나
+        """
+        normalized = normalize_sentence(source)
+        key = bytes_hash(normalized.encode('utf-8'))
+        row = self._conn.execute("SELECT id, target FROM translations WHERE source_hash = ?", (key,)).fetchone()
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        if row:
+            if row[1] == target:
+                return "unchanged"
+            self._conn.execute(
+                "UPDATE translations SET target = ?, target_hash = ?, updated = ? WHERE id = ?",
+                (target, sentence_hash(target), now, row[0]),
+            )
+            return "updated"
+
+        grams = trigrams(normalized)
+        cursor = self._conn.execute(
+            "INSERT INTO translations (source_hash, source, target, target_hash, trigram_count, updated) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, source, target, sentence_hash(target), len(grams), now),
+        )
+        self._conn.executemany("INSERT INTO trigrams VALUES (?, ?)", ((gram, cursor.lastrowid) for gram in grams))
+        self._conn.executemany(
+            "INSERT INTO trigram_counts VALUES (?, 1) ON CONFLICT (trigram) DO UPDATE SET count = count + 1",
+            ((gram,) for gram in grams),
+        )
+        return "added"
+
+    def add_many(self, pairs):
+        """(원문, 번역) 쌍들을 기록하고 {"added", "updated", "unchanged"} 개수를 반환"""
+        counts = dict.fromkeys(("added", "updated", "unchanged"), 0)
+        for source, target in pairs:
+            if source and target:
+                counts[self.add(source, target)] += 1
+        return counts
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="예문 번역 메모리 조회")
+    parser.add_argument("--tm", type=Path, default=default_tm_file(), help="번역 메모리 파일 경로")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("stats", help="저장된 번역 수")
+
+    lookup_parser = subparsers.add_parser("lookup", help="원문의 번역 찾기 (없으면 비슷한 원문의 번역)")
+    lookup_parser.add_argument("sentence", help="영어 원문")
+    lookup_parser.add_argument("--threshold", type=float, default=DEFAULT_FUZZY_THRESHOLD,
+                               help=f"비슷한 원문으로 볼 유사도 하한 (기본값: {DEFAULT_FUZZY_THRESHOLD})")
+    args = parser.parse_args()
+
+    if not args.tm.exists():
+        print(f"❌ 번역 메모리 파일이 없습니다: {args.tm}")
+        return
+
+    with TranslationMemory(args.tm, readonly=True) as memory:
+        if args.command == "stats":
+            print(f"📊 {args.tm}: 번역 {len(memory):,}개")
+            return
+
+        target = memory.lookup(args.sentence)
+        if target is not None:
+            print(f"✅ {target}")
+            return
+        matches = memory.fuzzy_lookup(args.sentence, args.threshold)
+        if not matches:
+            print("❌ 같거나 비슷한 원문이 없습니다")
+            return
+        print("⚠️  같은 원문은 없고, 비슷한 원문이 있습니다:")
+        for score, source, target in matches:
+            print(f"  {score:.2f}  {source}\n        -> {target}")
+
+
+if __name__ == "__main__":
+    main()
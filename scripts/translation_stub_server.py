@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DeepL /v2/translate 형식의 로컬 대역 번역 서버 (asyncio, 표준 라이브러리만 사용)
+
+번역 클라이언트(translation_client.py)를 실제 API 없이 확인하려고 쓴다.
+- POST /v2/translate에 폼 인코딩된 text(여러 개), target_lang을 받아
+  {"translations": [{"detected_source_language": "EN", "text": "[KO] 원문"}, ...]}로 응답한다
+- HTTP/1.1 keep-alive 연결을 지원하고, 연결 수/요청 수/문장 수를 센다 (연결 풀 확인용)
+- 요청마다 latency초 기다리고, failure_rate 확률로 503 또는 429(Retry-After: 0)로 실패한다 (재시도 확인용)
+- 요청당 문장이 max_texts개를 넘으면 413으로 거부한다
+
+사용 예:
+    python scripts/translation_stub_server.py --port 8765 --latency 0.05 --failure-rate 0.1
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from urllib.parse import parse_qs
+
+TRANSLATE_PATH = "/v2/translate"
+DEFAULT_MAX_TEXTS = 50
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large",
+           429: "Too Many Requests", 503: "Service Unavailable"}
+
+
+def stub_translate(text, target_lang):
+    """대역 번역 (원문 앞에 대상 언어 표시를 붙임)"""
+    return f"[{target_lang}] {text}"
+
+
+class StubTranslationServer:
+    """대역 번역 서버 상태와 연결 처리"""
+
+    def __init__(self, latency=0.0, failure_rate=0.0, max_texts=DEFAULT_MAX_TEXTS, seed=0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.max_texts = max_texts
+        self.connections = 0
+        self.requests = 0
+        self.texts = 0
+        self.failures = 0
+        self._random = random.Random(seed)
+
+    async def _respond(self, writer, status, payload, extra_headers=()):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        headers = [
+            f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            "Connection: keep-alive",
+            *extra_headers,
+        ]
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode('latin-1') + body)
+        await writer.drain()
+
+    async def _handle_request(self, method, path, body, writer):
+        self.requests += 1
+        if method != "POST" or path.split("?", 1)[0] != TRANSLATE_PATH:
+            await self._respond(writer, 404, {"message": "Not found"})
+            return
+        params = parse_qs(body.decode('utf-8'), keep_blank_values=True)
+        texts = params.get("text", [])
+        target_lang = params.get("target_lang", [""])[0]
+        if not texts or not target_lang:
+            await self._respond(writer, 400, {"message": "Parameter 'text' and 'target_lang' are required"})
+            return
+        if len(texts) > self.max_texts:
+            await self._respond(writer, 413, {"message": f"Too many texts: {len(texts)}"})
+            return
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._random.random() < self.failure_rate:
+            self.failures += 1
+            if self._random.random() < 0.5:
+                await self._respond(writer, 429, {"message": "Too many requests"}, ["Retry-After: 0"])
+            else:
+                await self._respond(writer, 503, {"message": "Service unavailable"})
+            return
+
+        self.texts += len(texts)
+        translations = [
+            {"detected_source_language": params.get("source_lang", ["EN"])[0], "text": stub_translate(text, target_lang)}
+            for text in texts
+        ]
+        await self._respond(writer, 200, {"translations": translations})
+
+    async def handle_connection(self, reader, writer):
+        """연결 하나에서 클라이언트가 닫을 때까지 요청을 차례로 처리"""
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode('latin-1').split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                await self._handle_request(method, path, body, writer)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # 서버를 닫을 때 처리 중이던 요청은 응답 없이 끝냄
+            pass
+        finally:
+            writer.close()
+
+    def describe(self):
+        return (f"연결 {self.connections}개, 요청 {self.requests:,}개, 번역한 문장 {self.texts:,}개, "
+                f"일부러 실패한 요청 {self.failures}개")
+
+
+async def start_stub_server(host="127.0.0.1", port=0, stub=None, **options):
+    """
+    대역 서버를 시작해서 (StubTranslationServer, asyncio.Server, 엔드포인트 URL)을 반환
+
+    port=0이면 빈 포트를 쓴다. 서버는 호출한 이벤트 루프에서 돌아간다.
+    stub이 주어지면 options 대신 그 서버 객체(응답을 바꾼 하위 클래스 등)로 요청을 처리한다.
+    """
+    stub = stub or StubTranslationServer(**options)
+    server = await asyncio.start_server(stub.handle_connection, host, port)
+    bound_port = server.sockets[0].getsockname()[1]
+    return stub, server, f"http://{host}:{bound_port}{TRANSLATE_PATH}"
+
+
+async def _serve(args):
+    stub, server, endpoint = await start_stub_server(
+        args.host, args.port, latency=args.latency, failure_rate=args.failure_rate,
+        max_texts=args.max_texts, seed=args.seed)
+    print(f"✅ 대역 번역 서버: {endpoint} (Ctrl+C로 종료)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        print(f"\n📊 {stub.describe()}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="DeepL /v2/translate 형식의 로컬 대역 번역 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="포트 (기본값: 8765)")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청마다 기다릴 시간(초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="일부러 실패할 요청 비율 (0~1)")
+    parser.add_argument("--max-texts", type=int, default=DEFAULT_MAX_TEXTS,
+                        help=f"요청당 최대 문장 수 (기본값: {DEFAULT_MAX_TEXTS})")
+    parser.add_argument("--seed", type=int, default=0, help="실패 난수 시드")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
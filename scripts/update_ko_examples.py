@@ -2,41 +2,116 @@
 # -*- coding: utf-8 -*-
 """
 KO 파일들의 example 필드를 translate_examples.csv의 한국어 예문으로 업데이트하는 스크립트
+
+translate_examples.csv의 예문에 "{ID}"가 붙어 있으면 항목 ID로 예문을 찾아 적용하고 (일부 예문만 번역한 파일도 가능),
+ID가 없으면 all_ko_examples.txt의 파일 순서와 예문 위치로 적용한다.
+
+--tm을 주면 all_ko_examples.txt의 원문과 번역을 짝지어 번역 메모리(translation_memory.py)에 기록하고,
+번역 파일에 없는 예문도 번역 메모리에 같은 원문의 번역이 있으면 채운다 (ID 기준일 때).
 """
 
-import json
+import argparse
+import os
 import re
+import sys
 from pathlib import Path
 
+from asset_manifest import deck_transaction
+from deck_io import iter_deck_entries, write_deck_entries
+from entry_ids import ID_TOKEN_PATTERN
+from extract_examples import FILTERED_EXPORT_LABEL
+from metrics import add_counts, add_metrics_arguments, metered, tracked
+from numbered_text import iter_numbered_sentences
+from profiling import add_profile_argument, profiled
+from snapshot_store import snapshot_run
+from translation_memory import TranslationMemory, default_tm_file
+
+# all_ko_examples.txt의 예문 줄 ("  1. {ID} 예문" 또는 "  1. 예문")
+EXPORTED_LINE_PATTERN = re.compile(r'^\s*\d+\.\s(.*)$')
+
 def read_translated_examples(csv_file):
     """
-    translate_examples.csv 파일에서 번역된 한국어 예문들을 읽어서 리스트로 반환
-    """
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        content = f.read().strip()
+    translate_examples.csv 파일에서 번역된 한국어 예문들을 읽어서 번호 위치의 리스트로 반환
     
+    N번 예문은 항상 N-1번째 자리에 둔다. 빠진 번호나 빈 예문의 자리는 None이고,
+    그 자리의 항목은 기존 예문을 그대로 유지한다 (뒤의 예문들이 앞으로 밀리지 않음).
+    """
     # 번호와 함께 있는 예문들을 파싱
     # 예: "1. 오늘 나온 최신 뉴스 봤어요? 2. 그들은 지역 정치에 대해 보도합니다."
+    # 예문 안의 숫자("오후 3시", "20%")에서 잘리지 않도록 다음 번호만 구분자로 본다.
     examples = []
+    skipped = []
     
-    # 번호 패턴으로 분리
-    pattern = r'(\d+)\.\s*([^0-9]+?)(?=\s*\d+\.|$)'
-    matches = re.findall(pattern, content)
-    
-    for match in matches:
-        example_text = match[1].strip()
-        if example_text:
-            examples.append(example_text)
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        for number, example_text in iter_numbered_sentences(f, skipped=skipped):
+            examples.extend([None] * (number - 1 - len(examples)))
+            examples.append(example_text or None)
+        add_counts(entries_in=len(examples), bytes_read=os.fstat(f.fileno()).st_size)
     
-    print(f"총 {len(examples)}개의 번역된 예문을 읽었습니다.")
+    holes = sum(1 for example in examples if example is None)
+    print(f"총 {len(examples) - holes}개의 번역된 예문을 읽었습니다.")
+    if skipped:
+        print(f"⚠️  빠진 번호 {len(skipped)}개: {skipped[:20]} (해당 항목은 기존 예문을 유지합니다)")
     return examples
 
+def has_entry_ids(csv_file):
+    """번역 파일의 예문에 항목 ID가 붙어 있는지 확인"""
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        return ID_TOKEN_PATTERN.search(f.read(1 << 16)) is not None
+
+def read_translated_examples_by_id(csv_file):
+    """
+    "번호. {ID} 예문" 형식의 번역 파일에서 ID -> 번역된 예문 딕셔너리를 반환
+    
+    같은 ID가 여러 번 나오면 마지막 예문을 사용한다.
+    """
+    translations = {}
+    duplicate_count = 0
+    missing_id_count = 0
+    
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        for _, example_text in iter_numbered_sentences(f):
+            match = ID_TOKEN_PATTERN.match(example_text)
+            if not match:
+                missing_id_count += 1
+                continue
+            entry_id = match.group(1)
+            example_text = example_text[match.end():].strip()
+            if not example_text:
+                continue
+            if entry_id in translations:
+                duplicate_count += 1
+            translations[entry_id] = example_text
+        add_counts(entries_in=len(translations), bytes_read=os.fstat(f.fileno()).st_size)
+    
+    print(f"총 {len(translations)}개의 번역된 예문을 ID와 함께 읽었습니다.")
+    if duplicate_count:
+        print(f"⚠️  중복된 ID {duplicate_count}개는 마지막 예문을 사용합니다.")
+    if missing_id_count:
+        print(f"⚠️  ID가 없는 예문 {missing_id_count}개는 건너뜁니다.")
+    return translations
+
+def filtered_export_count(txt_file):
+    """
+    all_ko_examples.txt가 번역 메모리로 예문을 건너뛴 내보내기이면 건너뛴 예문 수, 아니면 0
+
+    건너뛴 내보내기의 번역은 덱 항목과 위치가 맞지 않으므로 ID로만 적용해야 한다.
+    """
+    with open(txt_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith(FILTERED_EXPORT_LABEL):
+                return int(line[len(FILTERED_EXPORT_LABEL):].split()[0])
+            if line.startswith("파일: "):
+                break
+    return 0
+
 def read_all_ko_examples_order(txt_file):
     """
     all_ko_examples.txt 파일에서 예문 순서를 파악
     """
     with open(txt_file, 'r', encoding='utf-8') as f:
         content = f.read()
+        add_counts(bytes_read=os.fstat(f.fileno()).st_size)
     
     # 파일별 예문 수를 추출 (더 정확한 패턴 사용)
     file_sections = re.findall(r'파일: (KO_.*?\.json)\n카테고리: .*?\n예문 수: (\d+)', content)
@@ -49,74 +124,269 @@ def read_all_ko_examples_order(txt_file):
     print(f"각 파일의 예문 수: {[f[1] for f in file_order]}")
     return file_order
 
+def read_exported_sources(txt_file):
+    """
+    all_ko_examples.txt에서 번역하려고 내보낸 원문들을 읽음
+
+    Returns:
+        tuple: (원문 리스트 - 파일 순서, ID -> 원문 딕셔너리 - ID가 있는 줄만)
+    """
+    sources = []
+    sources_by_id = {}
+    with open(txt_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            match = EXPORTED_LINE_PATTERN.match(line)
+            if not match:
+                continue
+            text = match.group(1).strip()
+            id_match = ID_TOKEN_PATTERN.match(text)
+            if id_match:
+                text = text[id_match.end():].strip()
+                sources_by_id[id_match.group(1)] = text
+            sources.append(text)
+    return sources, sources_by_id
+
+def record_translations(tm_file, pairs):
+    """(원문, 번역) 쌍들을 번역 메모리에 기록하고 결과를 출력"""
+    with TranslationMemory(tm_file) as memory:
+        counts = memory.add_many(pairs)
+        total = len(memory)
+    print(f"📝 번역 메모리: 새 번역 {counts['added']}개, 바뀐 번역 {counts['updated']}개, "
+          f"그대로 {counts['unchanged']}개 (전체 {total:,}개)")
+
+def collect_memory_translations(data_dir, tm_file, translations):
+    """
+    번역 파일에 없는 KO 예문 중 번역 메모리에 같은 원문의 번역이 있는 것들의 ID -> 번역 딕셔너리
+
+    이미 번역된 예문(번역 메모리의 번역문과 같은 예문)은 건너뛴다.
+    """
+    found = {}
+    with TranslationMemory(tm_file, readonly=True) as memory:
+        for file_path in sorted(Path(data_dir).glob("KO_*.json")):
+            for item in iter_deck_entries(file_path):
+                entry_id = item.get('id')
+                example = item.get('example', '').strip()
+                if not entry_id or entry_id in translations or not example:
+                    continue
+                target = memory.lookup(example)
+                if target is not None and target != example:
+                    found[entry_id] = target
+    print(f"번역 메모리에서 {len(found)}개 예문의 번역을 찾았습니다.")
+    return found
+
+def inject_translated_examples(entries, translated_examples, progress):
+    """
+    항목들을 하나씩 받아 example 필드를 번역된 예문으로 교체해서 내보내는 제너레이터
+    
+    progress["index"] 위치의 번역 예문부터 항목마다 하나씩 차례로 사용하고, progress["index"]와
+    progress["updated"]를 증가시킨다. 번역 예문 자리가 None(빠진 번호)이면 그 항목은 기존 예문을 유지하고
+    progress["kept"]를 증가시킨다. 번역 예문이 부족하면 남은 항목은 그대로 내보낸다.
+    """
+    for item in entries:
+        if progress["index"] < len(translated_examples):
+            translated = translated_examples[progress["index"]]
+            if translated is None:
+                progress["kept"] += 1
+            else:
+                item['example'] = translated
+                progress["updated"] += 1
+            progress["index"] += 1
+        progress["total"] += 1
+        yield item
+
+def apply_translated_examples(data, translated_examples, example_index):
+    """
+    덱 항목 리스트의 example 필드를 example_index 위치부터 번역된 예문으로 교체
+    
+    Returns:
+        tuple: (다음 example_index, 업데이트된 예문 수)
+    """
+    progress = {"index": example_index, "updated": 0, "kept": 0, "total": 0}
+    for _ in inject_translated_examples(data, translated_examples, progress):
+        pass
+    return progress["index"], progress["updated"]
+
+def join_translated_examples(entries, translations, matched_ids):
+    """
+    항목들을 하나씩 받아 ID에 해당하는 번역 예문이 있으면 example 필드를 교체해서 내보내는 제너레이터
+    
+    사용한 ID는 matched_ids에 추가한다.
+    """
+    for item in entries:
+        entry_id = item.get('id')
+        if entry_id in translations:
+            item['example'] = translations[entry_id]
+            matched_ids.add(entry_id)
+        yield item
+
+def apply_translations_by_id(data, translations, matched_ids):
+    """
+    덱 항목 리스트의 example 필드를 ID에 해당하는 번역 예문으로 교체
+    
+    Returns:
+        int: 업데이트된 예문 수
+    """
+    before = len(matched_ids)
+    for _ in join_translated_examples(data, translations, matched_ids):
+        pass
+    return len(matched_ids) - before
+
+def report_unmatched_translations(translations, matched_ids, limit=20):
+    """어떤 덱 항목과도 연결되지 않은 번역 예문들을 출력하고 해당 ID 리스트를 반환"""
+    unmatched = [entry_id for entry_id in translations if entry_id not in matched_ids]
+    if unmatched:
+        print(f"\n⚠️  덱에서 찾을 수 없는 ID의 번역 예문 {len(unmatched)}개:")
+        for entry_id in unmatched[:limit]:
+            print(f"  {{{entry_id}}} {translations[entry_id]}")
+        if len(unmatched) > limit:
+            print(f"  ... 외 {len(unmatched) - limit}개")
+    return unmatched
+
+def update_ko_files_by_id(data_dir, translations):
+    """
+    KO 파일들의 example 필드를 항목 ID로 찾은 번역 예문으로 업데이트
+    
+    번역 예문 딕셔너리와의 해시 조인이므로 전체 항목 수에 비례하는 시간이 걸리고,
+    일부 예문만 번역한 파일도 해당 항목만 업데이트한다.
+    
+    Returns:
+        list: 덱에서 찾을 수 없는 번역 예문의 ID 리스트
+    """
+    matched_ids = set()
+    
+    # 모든 KO 파일을 하나의 트랜잭션으로 반영 (중간에 중단되면 어떤 파일도 바뀌지 않음)
+    ko_files = sorted(Path(data_dir).glob("KO_*.json"))
+    with snapshot_run("update_ko_examples --by-id", ko_files), deck_transaction(data_dir) as transaction:
+        for file_path in ko_files:
+            before = len(matched_ids)
+            with tracked("update_ko_file", deck=file_path.name):
+                entries = join_translated_examples(iter_deck_entries(file_path), translations, matched_ids)
+                write_deck_entries(file_path, entries, transaction)
+            print(f"✅ {file_path.name}: {len(matched_ids) - before}개 예문 업데이트 완료")
+    
+    print(f"\n🎉 모든 KO 파일 업데이트 완료!")
+    print(f"총 {len(matched_ids)}개의 예문이 업데이트되었습니다.")
+    return report_unmatched_translations(translations, matched_ids)
+
 def update_ko_files(data_dir, translated_examples, file_order):
     """
     KO 파일들의 example 필드를 새로운 한국어 예문으로 업데이트
     """
     example_index = 0
+    updated_total = 0
     
-    for filename, example_count in file_order:
-        file_path = data_dir / filename
-        
-        if not file_path.exists():
-            print(f"❌ 파일을 찾을 수 없습니다: {filename}")
-            continue
-        
-        print(f"\n📝 {filename} 처리 중... (예문 수: {example_count})")
-        
-        # JSON 파일 읽기
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # 각 항목의 example 필드 업데이트
-        updated_count = 0
-        for item in data:
-            if example_index < len(translated_examples):
-                item['example'] = translated_examples[example_index]
-                example_index += 1
-                updated_count += 1
-            else:
+    # 모든 KO 파일을 하나의 트랜잭션으로 반영 (중간에 중단되면 어떤 파일도 바뀌지 않음)
+    ko_files = [data_dir / filename for filename, _ in file_order]
+    with snapshot_run("update_ko_examples", ko_files), deck_transaction(data_dir) as transaction:
+        for filename, example_count in file_order:
+            file_path = data_dir / filename
+            
+            if not file_path.exists():
+                print(f"❌ 파일을 찾을 수 없습니다: {filename}")
+                continue
+            
+            print(f"\n📝 {filename} 처리 중... (예문 수: {example_count})")
+            
+            # 항목을 하나씩 읽어서 example 필드를 업데이트하고 바로 저장 (덱 전체를 메모리에 올리지 않음)
+            progress = {"index": example_index, "updated": 0, "kept": 0, "total": 0}
+            with tracked("update_ko_file", deck=filename):
+                entries = inject_translated_examples(iter_deck_entries(file_path), translated_examples, progress)
+                write_deck_entries(file_path, entries, transaction)
+            example_index = progress["index"]
+            updated_total += progress["updated"]
+            
+            if progress["updated"] + progress["kept"] < progress["total"]:
                 print(f"⚠️  번역된 예문이 부족합니다. {filename}의 일부 예문이 업데이트되지 않았습니다.")
-                break
-        
-        # 파일 저장
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        
-        print(f"✅ {filename}: {updated_count}개 예문 업데이트 완료")
+            
+            print(f"✅ {filename}: {progress['updated']}개 예문 업데이트 완료"
+                  + (f" (번호가 빠진 {progress['kept']}개는 기존 예문 유지)" if progress["kept"] else ""))
     
     print(f"\n🎉 모든 KO 파일 업데이트 완료!")
-    print(f"총 {example_index}개의 예문이 업데이트되었습니다.")
+    print(f"총 {updated_total}개의 예문이 업데이트되었습니다.")
 
 def main():
     """메인 함수"""
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    data_dir = project_root / "assets" / "data"
-    
-    # 파일 경로 설정
-    csv_file = project_root / "translate_examples.csv"
-    txt_file = project_root / "all_ko_examples.txt"
-    
-    print("=" * 60)
-    print("KO 파일들의 example 필드를 번역된 한국어 예문으로 업데이트")
-    print("=" * 60)
-    
-    # 번역된 예문 읽기
-    print("\n1. 번역된 예문 읽는 중...")
-    translated_examples = read_translated_examples(csv_file)
-    
-    # 파일 순서 파악
-    print("\n2. 파일 순서 파악 중...")
-    file_order = read_all_ko_examples_order(txt_file)
+    parser = argparse.ArgumentParser(description="KO 파일들의 example 필드를 번역된 한국어 예문으로 업데이트")
+    parser.add_argument("--tm", nargs="?", type=Path, const=default_tm_file(), default=None,
+                        help="번역을 번역 메모리에 기록하고 번역 메모리로 남은 예문도 채움 "
+                             "(기본 경로: .translation_memory.sqlite)")
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
     
-    # KO 파일들 업데이트
-    print("\n3. KO 파일들 업데이트 중...")
-    update_ko_files(data_dir, translated_examples, file_order)
-    
-    print("\n" + "=" * 60)
-    print("작업 완료!")
-    print("=" * 60)
+    with profiled("update_ko_examples", args.profile), metered("update_ko_examples", args.metrics, args.prometheus):
+        script_dir = Path(__file__).parent
+        project_root = script_dir.parent
+        data_dir = project_root / "assets" / "data"
+        
+        # 파일 경로 설정
+        csv_file = project_root / "translate_examples.csv"
+        txt_file = project_root / "all_ko_examples.txt"
+        
+        print("=" * 60)
+        print("KO 파일들의 example 필드를 번역된 한국어 예문으로 업데이트")
+        print("=" * 60)
+        
+        if has_entry_ids(csv_file):
+            # 번역된 예문을 ID로 읽어서 적용
+            print("\n1. 번역된 예문 읽는 중... (항목 ID 기준)")
+            with tracked("read_translated_examples_by_id"):
+                translations = read_translated_examples_by_id(csv_file)
+            
+            if args.tm:
+                # 내보낸 원문과 번역을 ID로 짝지어 기록한 뒤, 번역 파일에 없는 예문은 번역 메모리로 채움
+                with tracked("translation_memory"):
+                    _, sources_by_id = read_exported_sources(txt_file)
+                    record_translations(args.tm, (
+                        (sources_by_id[entry_id], translation)
+                        for entry_id, translation in translations.items() if entry_id in sources_by_id
+                    ))
+                    translations = {**collect_memory_translations(data_dir, args.tm, translations), **translations}
+            
+            print("\n2. KO 파일들 업데이트 중...")
+            with tracked("update_ko_files_by_id"):
+                update_ko_files_by_id(data_dir, translations)
+            
+            print("\n" + "=" * 60)
+            print("작업 완료!")
+            print("=" * 60)
+            return
+        
+        # 번역 메모리로 일부 예문을 건너뛴 내보내기는 위치로 적용하면 엉뚱한 항목에 들어가므로 거부
+        skipped_count = filtered_export_count(txt_file)
+        if skipped_count:
+            print(f"❌ {txt_file.name}: 번역 메모리로 예문 {skipped_count}개를 건너뛴 내보내기라서 "
+                  f"위치 기준으로 적용할 수 없습니다. 번역 파일의 예문마다 {{ID}}를 남겨 주세요.")
+            sys.exit(1)
+        
+        # 번역된 예문 읽기
+        print("\n1. 번역된 예문 읽는 중...")
+        with tracked("read_translated_examples"):
+            translated_examples = read_translated_examples(csv_file)
+        
+        # 파일 순서 파악
+        print("\n2. 파일 순서 파악 중...")
+        with tracked("read_all_ko_examples_order"):
+            file_order = read_all_ko_examples_order(txt_file)
+        
+        if args.tm:
+            # 위치 기준 번역은 내보낸 원문과 개수가 같을 때만 짝지어 기록
+            with tracked("translation_memory"):
+                sources, _ = read_exported_sources(txt_file)
+                if len(sources) == len(translated_examples):
+                    record_translations(args.tm, zip(sources, translated_examples))
+                else:
+                    print(f"⚠️  원문 {len(sources)}개와 번역 {len(translated_examples)}개의 수가 달라서 "
+                          f"번역 메모리에 기록하지 않았습니다.")
+        
+        # KO 파일들 업데이트
+        print("\n3. KO 파일들 업데이트 중...")
+        with tracked("update_ko_files"):
+            update_ko_files(data_dir, translated_examples, file_order)
+        
+        print("\n" + "=" * 60)
+        print("작업 완료!")
+        print("=" * 60)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+덱 JSON 파일의 항목들을 스키마로 검사하는 스크립트
+
+DECK_SCHEMA의 필드 규칙을 덱마다 (언어, 레벨, 카테고리에 맞춰) 하나의 검사 함수로 컴파일해 두고
+항목마다 그 함수만 호출한다. 덱들은 --jobs 프로세스에서 나눠서 검사하고,
+위반은 "파일[항목 번호] 필드: 내용" 형식으로 모두 출력한다.
+
+빌드 캐시(.deck_build_cache.json)에 위반 없이 통과한 덱의 해시를 기록하므로,
+다음 실행에서는 바뀐 덱만 다시 검사한다 (--no-cache로 전체 검사).
+위반이 있으면 종료 코드 1로 끝나므로 pre-commit 훅에서 그대로 사용할 수 있다.
+
+    python scripts/validate_decks.py --jobs 0
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+from build_cache import (
+    DEFAULT_CACHE_FILE,
+    file_hash,
+    inputs_key,
+    is_up_to_date,
+    load_cache,
+    record_step,
+    save_cache,
+)
+from deck_io import (
+    CATEGORIES,
+    CATEGORY_ALIASES,
+    DECK_SCHEMA_VERSION,
+    LEVELS,
+    deck_category,
+    deck_files,
+    default_data_dir,
+    load_deck,
+)
+from entry_ids import ID_LENGTH
+from metrics import add_counts, add_metrics_arguments, metered, tracked
+from parallel import add_jobs_argument, map_in_order, print_worker_timings, resolve_jobs
+from profiling import add_profile_argument, profiled
+
+# 규칙이 바뀌면 deck_io.DECK_SCHEMA_VERSION을 올린다 (빌드 캐시에 기록된 통과 결과를 무효화)
+SCHEMA_VERSION = DECK_SCHEMA_VERSION
+
+POS_VALUES = {
+    "noun", "verb", "adjective", "adverb", "phrase", "preposition",
+    "interjection", "pronoun", "conjunction", "verb/adjective",
+}
+
+# 스크립트가 임시로 채워 넣는 예문 (update_with_oxford, improve_all_examples의 기본값)
+PLACEHOLDER_EXAMPLES = [
+    "This is an example with {word}.",
+    "I use {word} in my daily life.",
+]
+
+# 언어별 필드 규칙 (덱 파일의 필드 순서)
+# 모든 필드는 필수이고, 앞뒤 공백이 없는 비어있지 않은 문자열이어야 한다.
+# - length, charset: 정확한 길이, 허용하는 문자 (정규식보다 빠름)
+# - choices: 허용하는 값 목록
+# - hangul: 한글이 한 글자 이상 있어야 함
+# - differs_from: 같은 항목의 다른 필드와 값이 달라야 함 (영어 단어를 뜻으로 그대로 넣은 경우)
+# - not_placeholder: 단어 필드를 넣은 PLACEHOLDER_EXAMPLES와 같으면 안 됨
+# - deck: 덱 파일명의 레벨/카테고리와 같아야 함
+DECK_SCHEMA = {
+    "EN": {
+        "id": {"length": ID_LENGTH, "charset": "0123456789abcdef"},
+        "word": {},
+        "meaning_ko": {"hangul": True, "differs_from": "word"},
+        "pos": {"choices": POS_VALUES},
+        "example": {"not_placeholder": "word"},
+        "level": {"deck": "level"},
+        "category": {"deck": "category"},
+    },
+    "KO": {
+        "id": {"length": ID_LENGTH, "charset": "0123456789abcdef"},
+        "word": {"hangul": True, "differs_from": "meaning_en"},
+        "meaning_en": {},
+        "pos": {"choices": POS_VALUES},
+        "example": {"hangul": True, "not_placeholder": "meaning_en"},
+        "level": {"deck": "level"},
+        "category": {"deck": "category"},
+    },
+}
+
+HANGUL_PATTERN = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣ]')
+
+# 덱 하나에서 작업 프로세스가 돌려주는 위반 수 (전체 개수는 따로 셈)
+MAX_REPORTED_VIOLATIONS = 1000
+
+_MISSING = object()
+
+
+def parse_deck_name(filename):
+    """덱 파일명에서 (언어, 레벨, 카테고리)를 얻음 (형식이 다르면 None)"""
+    stem = Path(filename).stem
+    parts = stem.split("_", 2)
+    if len(parts) != 3 or parts[0] not in DECK_SCHEMA or parts[1] not in LEVELS or parts[2] not in CATEGORIES:
+        return None
+    return tuple(parts)
+
+
+def _field_rules(name, rules, level, category):
+    """
+    필드 규칙 하나를 검사 리스트로 변환
+
+    Returns:
+        tuple: ([(통과 조건 식, 위반 메시지 함수 (값, 항목) -> 메시지)], 조건 식에서 쓰는 이름 -> 값)
+    """
+    checks = []
+    names = {}
+    if "length" in rules:
+        length = rules["length"]
+        checks.append((f"len(value) == {length}", lambda value, entry: f"길이가 {length}가 아님: {value!r}"))
+    if "charset" in rules:
+        charset = names[f"{name}_charset"] = rules["charset"]
+        checks.append((f"not value.strip({name}_charset)", lambda value, entry: f"허용되지 않는 문자 ({charset}): {value!r}"))
+    if "choices" in rules:
+        names[f"{name}_choices"] = frozenset(rules["choices"])
+        checks.append((f"value in {name}_choices", lambda value, entry: f"허용되지 않는 값: {value!r}"))
+    if rules.get("hangul"):
+        checks.append(("hangul_search(value)", lambda value, entry: f"한국어가 아님: {value!r}"))
+    if "differs_from" in rules:
+        other = rules["differs_from"]
+        checks.append((f"value != entry.get({other!r})", lambda value, entry: f"{other}와 같은 값: {value!r}"))
+    if "not_placeholder" in rules:
+        source = rules["not_placeholder"]
+        templates = [template.split("{word}") for template in PLACEHOLDER_EXAMPLES]
+
+        def is_placeholder(value, entry):
+            word = entry.get(source)
+            return any(value.startswith(prefix) and value.endswith(suffix) and value[len(prefix):-len(suffix)] == word
+                       for prefix, suffix in templates)
+        names[f"{name}_placeholder"] = is_placeholder
+        names[f"{name}_suffixes"] = tuple(suffix for _, suffix in templates)
+        # 대부분의 예문은 끝부분만 보고 통과시킨다
+        checks.append((f"(not value.endswith({name}_suffixes) or not {name}_placeholder(value, entry))",
+                       lambda value, entry: f"임시 예문: {value!r}"))
+    if "deck" in rules:
+        expected = level if rules["deck"] == "level" else category
+        # 카테고리는 파일명 대신 deck_io.CATEGORY_ALIASES의 별칭이 기록되어 있어도 됨
+        names[f"{name}_allowed"] = frozenset(
+            value for value in (expected, *CATEGORY_ALIASES) if deck_category(value) == expected)
+        checks.append((f"value in {name}_allowed", lambda value, entry: f"덱 파일과 다름 ({expected}): {value!r}"))
+    return checks, names
+
+
+def _compile_field(checks, names):
+    """필드 하나의 위반 메시지 함수 (값, 항목) -> 위반 메시지 (통과하지 못한 값에만 호출)"""
+    tests = [(eval(f"lambda value, entry: {condition}", dict(names, hangul_search=HANGUL_PATTERN.search)), message)
+             for condition, message in checks]
+
+    def describe(value, entry):
+        if value is _MISSING:
+            return "필드가 없음"
+        if type(value) is not str:
+            return f"문자열이 아님: {value!r}"
+        if not value.strip():
+            return "빈 값"
+        if value != value.strip():
+            return f"앞뒤 공백: {value!r}"
+        for test, message in tests:
+            if not test(value, entry):
+                return message(value, entry)
+        return "알 수 없는 위반"
+    return describe
+
+
+def compile_schema(language, level, category):
+    """
+    (언어, 레벨, 카테고리) 덱용 항목 검사 함수를 만듦
+
+    필드마다 규칙의 통과 조건을 하나의 식으로 이어 붙인 검사 함수의 소스를 만들어 컴파일하므로,
+    통과하는 항목은 함수 호출 없이 조건 식만 평가한다. 위반 메시지는 통과하지 못한 필드에 대해서만 만든다.
+
+    Returns:
+        callable: 항목 -> [(필드, 위반 메시지)] (위반이 없으면 빈 리스트)
+    """
+    schema = DECK_SCHEMA[language]
+    namespace = {
+        "_MISSING": _MISSING,
+        "hangul_search": HANGUL_PATTERN.search,
+        "known": frozenset(schema),
+    }
+    lines = [
+        "def check_entry(entry):",
+        "    if type(entry) is not dict:",
+        "        return [(None, f'항목이 객체가 아님: {type(entry).__name__}')]",
+        "    violations = []",
+    ]
+    for number, (field, rules) in enumerate(schema.items()):
+        name = f"field{number}"
+        checks, names = _field_rules(name, rules, level, category)
+        namespace.update(names)
+        namespace[f"{name}_describe"] = _compile_field(checks, names)
+        # 값 목록/허용 문자로 검사하는 필드는 빈 값이나 앞뒤 공백이 있으면 어차피 통과하지 못한다
+        exact = "choices" in rules or "deck" in rules or ("length" in rules and "charset" in rules)
+        basics = ["type(value) is str"] if exact else ["type(value) is str", "value", "value == value.strip()"]
+        condition = " and ".join(basics + [condition for condition, _ in checks])
+        lines += [
+            f"    value = entry.get({field!r}, _MISSING)",
+            f"    if not ({condition}):",
+            f"        violations.append(({field!r}, {name}_describe(value, entry)))",
+        ]
+    lines += [
+        f"    if len(entry) != {len(schema)} or not known.issuperset(entry):",
+        "        violations.extend((field, '알 수 없는 필드') for field in entry if field not in known)",
+        "    return violations",
+    ]
+    exec(compile("\n".join(lines), f"<schema {language}_{level}_{category}>", "exec"), namespace)
+    return namespace["check_entry"]
+
+
+def validate_entries(entries, filename):
+    """
+    덱 항목 리스트를 검사
+
+    Returns:
+        tuple: (위반 수, [(항목 번호, 필드, 위반 메시지)] - 최대 MAX_REPORTED_VIOLATIONS개)
+    """
+    deck = parse_deck_name(filename)
+    if deck is None:
+        return 1, [(None, None, "덱 파일명이 \"EN|KO_레벨_카테고리.json\" 형식이 아님")]
+    if type(entries) is not list:
+        return 1, [(None, None, "최상위가 배열이 아님")]
+
+    check_entry = compile_schema(*deck)
+    found = []
+    for index, entry in enumerate(entries):
+        violations = check_entry(entry)
+        if violations:
+            found.extend((index, field, message) for field, message in violations)
+
+    # 중복 ID는 서로 다른 ID 수가 ID 수보다 적을 때만 위치를 찾는다
+    ids = [entry.get("id") if type(entry) is dict else None for entry in entries]
+    valid_ids = [entry_id for entry_id in ids if type(entry_id) is str]
+    if len(set(valid_ids)) < len(valid_ids):
+        seen_ids = {}
+        for index, entry_id in enumerate(ids):
+            if type(entry_id) is not str:
+                continue
+            if entry_id in seen_ids:
+                found.append((index, "id", f"중복된 ID: {entry_id} ({seen_ids[entry_id]}번 항목과 같음)"))
+            else:
+                seen_ids[entry_id] = index
+        found.sort(key=lambda violation: violation[0])
+    return len(found), found[:MAX_REPORTED_VIOLATIONS]
+
+
+def validate_deck_file(path):
+    """
+    덱 파일 하나를 읽어서 검사 (작업 프로세스에서 실행)
+
+    Returns:
+        tuple: (항목 수, 위반 수, 보고할 위반 리스트)
+    """
+    try:
+        entries = load_deck(path)
+    except (OSError, ValueError) as e:
+        add_counts(errors=1)
+        return 0, 1, [(None, None, f"읽을 수 없음: {e}")]
+    violation_count, reported = validate_entries(entries, path.name)
+    add_counts(errors=violation_count)
+    return len(entries) if type(entries) is list else 0, violation_count, reported
+
+
+def format_violation(filename, index, field, message):
+    """위반 하나를 "파일[항목 번호] 필드: 내용" 형식으로"""
+    location = filename if index is None else f"{filename}[{index}]"
+    return f"{location} {field}: {message}" if field else f"{location}: {message}"
+
+
+def print_deck_result(filename, entry_count, violation_count, reported):
+    """덱 하나의 검사 결과와 위반들을 출력"""
+    if violation_count == 0:
+        print(f"✅ {filename}: {entry_count:,}개 항목")
+        return
+    print(f"❌ {filename}: {entry_count:,}개 항목 중 위반 {violation_count:,}개")
+    for index, field, message in reported:
+        print(f"   {format_violation(filename, index, field, message)}")
+    if violation_count > len(reported):
+        print(f"   ... 외 {violation_count - len(reported):,}개")
+
+
+def validate_decks(paths, jobs=1, cache_file=None):
+    """
+    덱 파일들을 병렬로 검사하고 위반을 출력
+
+    cache_file이 주어지면 마지막으로 통과한 뒤 바뀌지 않은 덱은 건너뛴다.
+
+    Returns:
+        int: 전체 위반 수
+    """
+    cache = load_cache(cache_file) if cache_file else None
+    key = inputs_key({"schema": SCHEMA_VERSION, "validator": file_hash(Path(__file__), cache)})
+
+    paths = [Path(path) for path in paths]
+    if cache is not None:
+        stale = [path for path in paths if not is_up_to_date(cache, f"validate:{path.name}", key, [path])]
+    else:
+        stale = paths
+    if len(stale) < len(paths):
+        print(f"⏭️  마지막 검사 이후 바뀌지 않은 덱 {len(paths) - len(stale)}개는 건너뜀")
+
+    with tracked("validate_deck_file"):
+        results, timings = map_in_order(validate_deck_file, stale, jobs)
+
+    total_entries = 0
+    total_violations = 0
+    for path, (entry_count, violation_count, reported) in zip(stale, results):
+        total_entries += entry_count
+        total_violations += violation_count
+        print_deck_result(path.name, entry_count, violation_count, reported)
+        if violation_count == 0 and cache is not None:
+            record_step(cache, f"validate:{path.name}", key, [path])
+
+    if cache is not None:
+        save_cache(cache, cache_file)
+
+    if total_violations:
+        print(f"\n❌ 덱 {len(stale)}개 (항목 {total_entries:,}개)에서 위반 {total_violations:,}개를 찾았습니다.")
+    else:
+        print(f"\n🎉 덱 {len(stale)}개 (항목 {total_entries:,}개) 검사 완료, 위반 없음")
+    if jobs > 1 and stale:
+        print_worker_timings(timings)
+    return total_violations
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="덱 JSON 파일의 항목들을 스키마로 검사")
+    parser.add_argument("files", nargs="*", type=Path, help="검사할 덱 파일 (기본값: assets/data의 모든 덱)")
+    parser.add_argument("--no-cache", action="store_true", help="빌드 캐시를 무시하고 모든 덱을 검사")
+    add_jobs_argument(parser)
+    add_metrics_arguments(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    paths = args.files or deck_files(default_data_dir())
+    cache_file = None if args.no_cache else DEFAULT_CACHE_FILE
+    with profiled("validate_decks", args.profile), metered("validate_decks", args.metrics, args.prometheus):
+        violations = validate_decks(paths, resolve_jobs(args.jobs), cache_file)
+    if violations:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()